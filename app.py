@@ -4,6 +4,7 @@ import logging
 from PyQt6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QTabWidget
 from PyQt6.QtCore import QThreadPool
 from utils.errors import show_error_message
+from utils.outbox import outbox_drainer, start_outbox_drainer
 
 
 class SourceProviderTool(QMainWindow):
@@ -15,6 +16,12 @@ class SourceProviderTool(QMainWindow):
         self.init_state()
         self.init_ui()
         self.threadpool = QThreadPool()
+        # Replay backend writes queued while the backend was unreachable
+        start_outbox_drainer()
+
+    def closeEvent(self, event):
+        outbox_drainer.stop(timeout=5)
+        super().closeEvent(event)
 
     def init_state(self):
         """Initialize application state variables"""
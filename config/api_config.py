@@ -30,7 +30,8 @@ GITHUB_API = {
     "get_pull_requests": lambda owner, repo: f"https://api.github.com/repos/{owner}/{repo}/pulls",
     "get_pull_request_details": lambda owner, repo, number: f"https://api.github.com/repos/{owner}/{repo}/pulls/{number}",
     "search_issues": lambda: "https://api.github.com/search/issues",
-    "get_pull_request_more_details":"https://api.github.com/graphql"
+    "get_pull_request_more_details":"https://api.github.com/graphql",
+    "graphql": "https://api.github.com/graphql"
 }
 
 
@@ -45,5 +46,145 @@ AZURE_DEVOPS_API = {
     "get_pull_requests": lambda org_name, project, repo: f"https://dev.azure.com/{org_name}/{project}/_apis/git/repositories/{repo}/pullrequests?api-version=7.2-preview.2",
     "get_pull_requests_with_criteria_closed": lambda org_name, project, repo, status="all", min_time=None: f"https://dev.azure.com/{org_name}/{project}/_apis/git/repositories/{repo}/pullrequests?api-version=7.2-preview.2&searchCriteria.status={status}&searchCriteria.queryTimeRangeType=Closed" + (f"&searchCriteria.minTime={min_time}" if min_time else ""),
     "get_pull_requests_with_criteria_opened": lambda org_name, project, repo, status="all", min_time=None: f"https://dev.azure.com/{org_name}/{project}/_apis/git/repositories/{repo}/pullrequests?api-version=7.2-preview.2&searchCriteria.status={status}&searchCriteria.queryTimeRangeType=Opened" + (f"&searchCriteria.minTime={min_time}" if min_time else ""),
-    "get_pull_request_details": lambda org_name, project, repo, pr_id: f"https://dev.azure.com/{org_name}/{project}/_apis/git/repositories/{repo}/pullrequests/{pr_id}?api-version=7.2-preview.2"
-}
\ No newline at end of file
+    "get_pull_request_details": lambda org_name, project, repo, pr_id: f"https://dev.azure.com/{org_name}/{project}/_apis/git/repositories/{repo}/pullrequests/{pr_id}?api-version=7.2-preview.2",
+    "get_pull_request_commits": lambda org_name, project, repo, pr_id: f"https://dev.azure.com/{org_name}/{project}/_apis/git/repositories/{repo}/pullRequests/{pr_id}/commits?api-version=7.1",
+    "get_pull_request_iterations": lambda org_name, project, repo, pr_id: f"https://dev.azure.com/{org_name}/{project}/_apis/git/repositories/{repo}/pullRequests/{pr_id}/iterations?api-version=7.1",
+    "get_pull_request_iteration_changes": lambda org_name, project, repo, pr_id, iteration_id: f"https://dev.azure.com/{org_name}/{project}/_apis/git/repositories/{repo}/pullRequests/{pr_id}/iterations/{iteration_id}/changes?api-version=7.1&$compareTo=0",
+    "get_file_diffs": lambda org_name, project, repo: f"https://dev.azure.com/{org_name}/{project}/_apis/git/repositories/{repo}/filediffs?api-version=7.1"
+}
+
+# Connection pool sizing for the pooled HTTP transports (utils/transport.py)
+HTTP_POOL_CONFIG = {
+    "github": {"pool_connections": 4, "pool_maxsize": 16},
+    "azure_devops": {"pool_connections": 6, "pool_maxsize": 16},
+    "backend": {"pool_connections": 1, "pool_maxsize": 8},
+}
+
+# Token-bucket pacing for GitHub rate limits (utils/rate_limit.py)
+RATE_LIMIT_CONFIG = {
+    "limit": 5000,
+    "window": 3600,
+    "burst": 100,
+    "reserve": 50,
+    "max_rate_limit_waits": 3,
+}
+
+# Backoff for throttled/unavailable Azure DevOps calls (utils/retry.py)
+AZURE_RETRY_CONFIG = {
+    "max_attempts": 6,
+    "base_delay": 1.0,
+    "max_delay": 60.0,
+    "retry_statuses": (429, 503),
+    "sync_retry_budget": 50,
+    # PR enrichment calls draw on a budget of their own, so throttled
+    # enrichment cannot starve the PR listing (and vice versa)
+    "enrichment_retry_budget": 50,
+}
+
+# On-disk ETag/Last-Modified cache for provider GETs (utils/http_cache.py)
+HTTP_CACHE_CONFIG = {
+    "enabled": True,
+    "directory": "http_cache",
+}
+
+# Bulk "sync all repositories" pull request collection
+PR_SYNC_CONFIG = {
+    "max_workers": 4,
+    # Repositories whose first PR page shares one aliased GraphQL search
+    "graphql_batch_size": 25,
+    # "pull_requests" walks repository.pullRequests by updatedAt and stops at
+    # the watermark; "search" uses the search API (capped at 1,000 results)
+    "github_pr_source": "pull_requests",
+    # PRs are saved in chunks while fetching continues
+    "upload_chunk_size": 500,
+    "upload_workers": 3,
+    "upload_max_pending_chunks": 6,
+    # Continue interrupted syncs from their last checkpointed page
+    "resume": True,
+}
+
+# SQLite database for sync state kept across runs (utils/local_store.py)
+LOCAL_STORE_CONFIG = {
+    "filename": "collector.db",
+}
+
+# Commit and diff stats of Azure DevOps PRs, fetched after listing
+AZURE_ENRICHMENT_CONFIG = {
+    "enabled": True,
+    "max_workers": 8,
+    # Line counts need a filediffs call per PR on top of commits and iterations
+    "line_counts": True,
+    "file_diff_batch_size": 50,
+    # Syncs that re-try a PR whose enrichment failed before it is given up
+    "max_retry_attempts": 5,
+}
+
+# Adaptive "first:" size of GitHub PR GraphQL pages (utils/page_size.py)
+GRAPHQL_PAGE_SIZE_CONFIG = {
+    "initial": 100,
+    "minimum": 10,
+    "maximum": 100,
+    # Consecutive successful pages before the size grows again
+    "grow_after": 3,
+    # "first:" of a batched first page for a repository that already has a
+    # watermark; most incremental runs find few or no new PRs
+    "incremental_first_page": 10,
+}
+
+# Chunked, concurrent saves to the backend (utils/bulk_save.py)
+BULK_SAVE_CONFIG = {
+    "chunk_size": 200,
+    "max_workers": 4,
+    # Attempts per chunk for network errors, 429 and 5xx
+    "max_attempts": 3,
+    "base_delay": 1.0,
+    "max_delay": 10.0,
+}
+
+# In-memory cache of saved users/teams/repositories read from the backend (utils/read_cache.py)
+READ_CACHE_CONFIG = {
+    "enabled": True,
+    # Seconds a loaded list is reused; saves invalidate it immediately
+    "ttl_seconds": {
+        "users": 300,
+        "teams": 300,
+        "code_repositories": 300,
+        "team_members": 120,
+    },
+}
+
+# Content-hash delta sync of users, teams and repositories (utils/delta_sync.py)
+DELTA_SYNC_CONFIG = {
+    "enabled": True,
+    # Provider fields left out of the content hash because they change without
+    # the record changing. userUpdatedAt is Azure DevOps' lastAccessedDate (every
+    # sign-in) and GitHub's updatedAt (any profile activity); a record is re-sent
+    # with its current value whenever another field changes.
+    "ignored_fields": ["userUpdatedAt"],
+}
+
+# Durable local queue of backend writes that failed while the backend was unreachable (utils/outbox.py)
+OUTBOX_CONFIG = {
+    "enabled": True,
+    # Seconds between replay passes
+    "poll_interval": 15.0,
+    "batch_size": 20,
+    # Backoff of a write that keeps failing
+    "base_delay": 5.0,
+    "max_delay": 300.0,
+    # Header carrying a write's idempotency key, so a replayed write is applied once
+    "idempotency_header": "Idempotency-Key",
+    # Days delivered and superseded writes stay in the outbox before they are pruned
+    "retention_days": 7,
+}
+
+# Encoding of large backend save bodies (PRs, users, teams, repositories, team members)
+# Turn these on only when the backend accepts them (request decompression / MessagePack input)
+BACKEND_BODY_CONFIG = {
+    # "json", or "msgpack" (needs the optional msgpack package; falls back to JSON without it)
+    "format": "json",
+    # "gzip" or None
+    "compression": None,
+    # Smaller bodies are not worth compressing
+    "min_compress_bytes": 1024,
+}
@@ -1,5 +1,10 @@
 from services.backend.get_code_repository_data_service import get_code_repository_data_service
+from utils.bulk_save import bulk_save
 from utils.errors import APIError
+from utils.read_cache import backend_read_cache
+from utils.single_flight import model_single_flight
+from utils.delta_sync import classify_records, delta_counts, record_saved_hashes
+from utils.outbox import project_records_endpoint, register_outbox_endpoint, send_through_outbox
 from services.backend.save_code_repository_data_service import (
     save_code_repository_data_service,
 )
@@ -11,17 +16,24 @@ def fetch_code_repository_data(project_id, org_name, provider):
 
     saved_node_ids = {repo.get("nodeId") for repo in saved_repos if repo.get("nodeId")}
 
-    unsaved_repos = [
-        repo for repo in provider_repos
-        if repo.get("nodeId") not in saved_node_ids
-    ]
+    # New repositories and saved ones whose provider data changed since they were saved
+    delta = classify_records(project_id, "code_repositories", provider_repos, saved_node_ids)
+    unsaved_repos = delta["new"] + delta["changed"]
 
     return {
         "saved": saved_repos,
-        "unsaved": unsaved_repos
+        "unsaved": unsaved_repos,
+        "delta": delta_counts(delta),
     }
 
 def get_saved_code_repositories(project_id):
+    """Saved repositories of a project, from the read cache or the backend API."""
+    return backend_read_cache.get_or_load(
+        "code_repositories", project_id, lambda: load_saved_code_repositories(project_id)
+    )
+
+
+def load_saved_code_repositories(project_id):
     """Fetch saved repositories from backend API."""
     try:
         response = get_code_repository_data_service(project_id)
@@ -42,20 +54,40 @@ def get_saved_code_repositories(project_id):
 def get_provider_repositories(org_name, provider):
     """Fetch repositories from  provider API."""
     try:
-        return provider.get_repository_data(org_name)
+        return model_single_flight.do(
+            ("provider_repositories", id(provider), org_name), lambda: provider.get_repository_data(org_name)
+        )
     except Exception as e:
         raise APIError(f"Failed to fetch provider repositories: {str(e)}")  
 
 def save_code_repositories(project_id, repos):
     """Save selected repositories to the backend."""
-    payload = {"projectId": project_id, "codeRepositories": repos}
-    print(payload)
-    response = save_code_repository_data_service(payload)
-    response_data = response.json()
+    def save_chunk(chunk):
+        send_through_outbox("code_repositories", {"projectId": project_id, "codeRepositories": chunk})
+
+    # Unchanged repositories are already saved as they are; only new and changed ones are sent.
+    # Anything the backend does not have is new, whatever hash was stored locally.
+    saved_node_ids = {
+        repo.get("nodeId") for repo in get_saved_code_repositories(project_id) if repo.get("nodeId")
+    }
+    delta = classify_records(project_id, "code_repositories", repos, saved_node_ids)
+    try:
+        result = bulk_save(delta["new"] + delta["changed"], save_chunk, retry=False)
+    finally:
+        backend_read_cache.invalidate("code_repositories", project_id)
+    return {"saved_count": result["saved"], **result, "delta": delta_counts(delta)}
 
+
+def send_code_repositories_payload(payload, idempotency_key=None):
+    """Post one repositories payload; also replays queued writes from the outbox."""
+    response_data = save_code_repository_data_service(payload, idempotency_key).json()
     if not response_data.get("success"):
-        raise APIError(response_data.get("message", "Failed to save repositories"))
+        raise APIError(
+            response_data.get("message", "Failed to save repositories"),
+            error_code=response_data.get("errorCode", "SAVE_FAILED"),
+        )
+    record_saved_hashes(payload["projectId"], "code_repositories", payload["codeRepositories"])
+    backend_read_cache.invalidate("code_repositories", payload["projectId"])
 
-    return {
-        "saved_count": len(repos)
-    }
+
+register_outbox_endpoint("code_repositories", project_records_endpoint(send_code_repositories_payload, "codeRepositories"))
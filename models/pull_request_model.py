@@ -1,8 +1,25 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config.api_config import PR_SYNC_CONFIG
 from models.code_repository_model import get_saved_code_repositories
 from services.backend.get_last_pr_data_service import get_last_pr_data_service
 from services.backend.save_pr_data_service import save_pr_data_service
 from models.user_model import get_saved_users
+from utils.author_index import AuthorIndex
+from utils.bulk_save import save_with_retry
+from services.local.sync_watermark_service import get_sync_watermark_service, save_sync_watermark_service
+from services.local.sync_checkpoint_service import (
+    load_checkpoint_service,
+    start_checkpoint_service,
+    save_page_checkpoint_service,
+    mark_prs_saved_service,
+    get_unsaved_prs_service,
+    clear_checkpoint_service,
+)
+from utils.dates import parse_iso_date, parse_utc
 from utils.errors import APIError
+from utils.upload_pipeline import ChunkedUploader
 
 
 def fetch_pull_request_data(project_id, org_name, provider):
@@ -18,15 +35,313 @@ def fetch_last_pr_data(repo_id):
     return response.json().get("data")
 
 
+def save_pr_chunk(chunk):
+    """Save one chunk of PR payloads, raising if the backend rejects it."""
+    response_data = save_pr_data_service(chunk).json()
+    if not response_data.get("success"):
+        raise APIError(
+            response_data.get("message", "Failed to save pull requests"),
+            error_code=response_data.get("errorCode", "SAVE_FAILED"),
+        )
+
+
 def fetch_and_save_pull_requests(
     current_provider, saved_users, selected_repo_data, filter_date
 ):
-    pr_payload = current_provider.get_pr_data(
-        saved_users, selected_repo_data, filter_date
-    )
+    """
+    Stream a repository's PRs to the backend while they are being fetched.
+
+    The local sync watermark, when there is one, takes precedence over
+    ``filter_date`` (the backend's last PR). See ``stream_pull_requests``.
+
+    Returns:
+        Dict with ``fetched``, ``filterDate``, ``resumed`` plus the uploader
+        stats (``saved``, ``failed``, ``chunks``, ``failedChunks``, ``errors``)
+    """
+    current_provider.begin_sync()
+    repo_id = selected_repo_data.get("codeRepositoryId")
+    filter_date = get_local_watermark(current_provider, repo_id) or filter_date
+    return stream_pull_requests(current_provider, saved_users, selected_repo_data, filter_date)
+
+
+def stream_pull_requests(current_provider, saved_users, repo_data, filter_date,
+                         prefetched=None, on_page=None, resume=None):
+    """
+    Fetch a repository's PR pages and save them in chunks, with durable checkpoints.
+
+    Provider pages feed a ChunkedUploader, which saves fixed-size chunks
+    concurrently. A failed chunk does not stop the others. Every completed
+    page is checkpointed in the local store, together with the cursor after
+    it and its PRs. Saved PRs are flagged as such. If the sync is cut
+    short (a network failure, an app restart), the next run with resume
+    enabled continues from the last completed page. It first re-sends the
+    checkpointed PRs that were never confirmed saved. Once every chunk is
+    saved, the watermark advances and the checkpoint is dropped.
+
+    Args:
+        filter_date: Watermark to fetch from; ignored when resuming
+        prefetched: Optional batched first page (see ``prefetch_first_pr_pages``)
+        on_page: Called with each page after it is checkpointed
+        resume: Continue an interrupted sync (default ``PR_SYNC_CONFIG["resume"]``)
+
+    Returns:
+        Dict with ``fetched`` (including checkpointed PRs sent again on
+        resume), ``filterDate``, ``resumed`` plus the uploader stats
+    """
+    scope = current_provider.get_sync_scope()
+    repo_id = repo_data.get("codeRepositoryId")
+    resume = PR_SYNC_CONFIG["resume"] if resume is None else resume
+
+    checkpoint = load_checkpoint_service(scope, repo_id) if resume else None
+    after = None
+    high_water = None
+    if checkpoint:
+        filter_date = parse_utc(checkpoint["filterDate"]) if checkpoint["filterDate"] else None
+        high_water = parse_utc(checkpoint["highWater"]) if checkpoint["highWater"] else None
+        after = checkpoint["cursor"]
+        prefetched = None
+        logging.info(
+            f"Resuming PR sync of '{repo_data.get('fullName')}' after page {checkpoint['pages']}"
+        )
+    else:
+        start_checkpoint_service(scope, repo_id, filter_date.isoformat() if filter_date else None)
+
+    def upload(chunk):
+        save_with_retry(save_pr_chunk, chunk)
+        mark_prs_saved_service(scope, repo_id, [pr["nodeId"] for pr in chunk])
+
+    fetched = 0
+    cursor = after
+
+    def emit(page, page_cursor):
+        nonlocal fetched, high_water, cursor
+        high_water = latest_pr_timestamp(page, high_water)
+        cursor = page_cursor
+        save_page_checkpoint_service(
+            scope, repo_id, cursor, page, high_water.isoformat() if high_water else None
+        )
+        uploader.add(page)
+        fetched += len(page)
+        if on_page:
+            on_page(page)
+
+    with ChunkedUploader(
+        upload,
+        chunk_size=PR_SYNC_CONFIG["upload_chunk_size"],
+        max_workers=PR_SYNC_CONFIG["upload_workers"],
+        max_pending=PR_SYNC_CONFIG["upload_max_pending_chunks"],
+    ) as uploader:
+        if checkpoint:
+            unsaved = get_unsaved_prs_service(scope, repo_id)
+            uploader.add(unsaved)
+            fetched += len(unsaved)
+            # A checkpoint whose last page had no cursor has listed everything
+            listing_done = checkpoint["pages"] > 0 and checkpoint["cursor"] is None
+            pages = [] if listing_done else current_provider.iter_pr_pages(
+                saved_users, repo_data, filter_date, after=after
+            )
+        elif prefetched is not None:
+            next_cursor = prefetched["endCursor"] if prefetched["hasNextPage"] else None
+            emit(prefetched["prs"], next_cursor)
+            pages = []
+            if prefetched["hasNextPage"]:
+                pages = current_provider.iter_pr_pages(
+                    saved_users, repo_data, filter_date, after=next_cursor
+                )
+        else:
+            pages = current_provider.iter_pr_pages(saved_users, repo_data, filter_date)
+
+        for page in pages:
+            emit(page, getattr(page, "cursor", None))
+
+    result = {
+        "fetched": fetched,
+        "filterDate": filter_date,
+        "resumed": checkpoint is not None,
+        **uploader.stats(),
+    }
+    if not result["failedChunks"]:
+        record_sync_watermark(current_provider, repo_id, high_water, cursor)
+        clear_checkpoint_service(scope, repo_id)
+    return result
+
+
+def get_local_watermark(current_provider, repo_id):
+    """Precise high-water mark of the repository's last successful sync from this machine, or None."""
+    watermark = get_sync_watermark_service(current_provider.get_sync_scope(), repo_id)
+    return parse_utc(watermark["updatedAt"]) if watermark else None
+
+
+def get_sync_watermark(current_provider, repo_id):
+    """Start of an incremental sync: the local watermark, else the backend's last PR."""
+    return get_local_watermark(current_provider, repo_id) or get_last_pr_watermark(repo_id)
+
+
+def latest_pr_timestamp(prs, latest=None):
+    """Newest updated/closed/created time among ``prs`` and ``latest``."""
+    for pr in prs:
+        for field in ("prUpdatedAt", "prClosedAt", "prCreatedAt"):
+            if pr.get(field):
+                timestamp = parse_utc(pr[field])
+                if latest is None or timestamp > latest:
+                    latest = timestamp
+    return latest
+
+
+def record_sync_watermark(current_provider, repo_id, high_water, cursor=None):
+    """Advance the local watermark after a fully saved sync (no-op if nothing was fetched)."""
+    if high_water is not None:
+        save_sync_watermark_service(current_provider.get_sync_scope(), repo_id, high_water.isoformat(), cursor)
+
+
+def get_last_pr_watermark(repo_id):
+    """Creation date of the repository's last saved PR, or None if it has none."""
+    try:
+        last_pr = fetch_last_pr_data(repo_id)
+    except APIError as e:
+        if e.status_code == 404:
+            return None
+        raise
+
+    if last_pr and last_pr.get("prCreatedAt"):
+        return parse_iso_date(last_pr["prCreatedAt"])
+    return None
+
+
+def sync_repository_pull_requests(current_provider, saved_users, repo_data, progress_callback=None,
+                                  prefetched=None):
+    """
+    Fetch and save the new pull requests of one repository.
+
+    Progress is reported as a status dict with the repository's pages,
+    PR count, elapsed seconds, state and error.
+
+    Args:
+        prefetched: Optional batched first page of the repository (see
+            ``prefetch_first_pr_pages``); the sync then continues from its
+            cursor instead of starting over
+    """
+    started = time.monotonic()
+    status = {
+        "codeRepositoryId": repo_data.get("codeRepositoryId"),
+        "fullName": repo_data.get("fullName"),
+        "state": "running",
+        "pages": 0,
+        "prs": 0,
+        "elapsed": 0.0,
+        "error": None,
+    }
+
+    def report(**changes):
+        status.update(changes, elapsed=time.monotonic() - started)
+        if progress_callback:
+            progress_callback(dict(status))
+
+    report()
+    try:
+        if prefetched is None:
+            filter_date = get_sync_watermark(current_provider, repo_data.get("codeRepositoryId"))
+        else:
+            filter_date = prefetched["filterDate"]
+
+        upload = stream_pull_requests(
+            current_provider,
+            saved_users,
+            repo_data,
+            filter_date,
+            prefetched=prefetched,
+            on_page=lambda page: report(pages=status["pages"] + 1, prs=status["prs"] + len(page)),
+        )
+        if upload["failedChunks"]:
+            raise APIError(
+                f"{upload['failed']} of {upload['fetched']} pull requests failed to save "
+                f"({upload['failedChunks']} chunks): {upload['errors'][0]}"
+            )
+        report(state="done")
+    except Exception as e:
+        report(state="failed", error=str(e))
+
+    return dict(status)
+
+
+def prefetch_first_pr_pages(current_provider, saved_users, repos, executor):
+    """
+    Fetch the first PR page of many repositories through the provider's batched query.
+
+    Watermarks are looked up concurrently on ``executor``. A repository
+    with an interrupted sync to resume, whose watermark lookup fails, or
+    that the batch leaves out, gets no entry and is synced from scratch by its own worker, which then reports
+    the error. A failed batch request only disables the shortcut.
+
+    Returns:
+        Dict keyed by codeRepositoryId with ``filterDate``, ``prs``,
+        ``hasNextPage`` and ``endCursor``
+    """
+
+    def watermark(repo_data):
+        repo_id = repo_data.get("codeRepositoryId")
+        try:
+            if PR_SYNC_CONFIG["resume"] and load_checkpoint_service(current_provider.get_sync_scope(), repo_id):
+                # Interrupted syncs resume from their checkpoint instead
+                return None, "checkpointed"
+            return get_sync_watermark(current_provider, repo_id), None
+        except Exception as e:
+            return None, e
+
+    repo_requests = [
+        (repo_data, filter_date)
+        for repo_data, (filter_date, error) in zip(repos, executor.map(watermark, repos))
+        if error is None
+    ]
+    if not repo_requests:
+        return {}
+
+    try:
+        first_pages = current_provider.get_first_pr_pages(saved_users, repo_requests)
+    except Exception:
+        logging.warning("Batched first-page PR query failed; syncing repositories one by one", exc_info=True)
+        return {}
+
+    filter_dates = {repo_data.get("codeRepositoryId"): filter_date for repo_data, filter_date in repo_requests}
+    for repo_id, first_page in first_pages.items():
+        first_page["filterDate"] = filter_dates.get(repo_id)
+    return first_pages
+
+
+def sync_all_pull_requests(current_provider, saved_users, repos, progress_callback=None,
+                           max_workers=None):
+    """
+    Sync the pull requests of many repositories concurrently.
+
+    Each repository starts from its own sync watermark. When the provider
+    supports it, the first page of every repository comes from a few batched
+    queries, so quiet repositories need no request of their own.
+    Repositories run under a bounded worker pool, and a failure in one does
+    not stop the others.
 
-    if not pr_payload:
-        return {"pr_payload": [], "response": None}
+    Returns:
+        One final status dict per repository, in input order
+    """
+    max_workers = max_workers or PR_SYNC_CONFIG["max_workers"]
+    # Once for the whole sync, so its retry budget bounds every worker together
+    current_provider.begin_sync()
+    # One author index for the whole sync: each PR author is hashed once
+    saved_users = AuthorIndex.of(saved_users)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pr-sync") as executor:
+        first_pages = prefetch_first_pr_pages(current_provider, saved_users, repos, executor)
+        futures = [
+            executor.submit(
+                sync_repository_pull_requests,
+                current_provider,
+                saved_users,
+                repo_data,
+                progress_callback,
+                first_pages.get(repo_data.get("codeRepositoryId")),
+            )
+            for repo_data in repos
+        ]
+        results = [future.result() for future in futures]
 
-    response = save_pr_data_service(pr_payload)
-    return {"pr_payload": pr_payload, "response": response}
+    if saved_users.misses:
+        logging.info(f"{len(saved_users.misses)} PR authors are not saved users; their PRs have no userId")
+    return results
@@ -4,7 +4,10 @@ from services.backend.save_team_members_data_service import (
 from services.backend.get_team_member_data_service import get_team_member_data_service
 from models.user_model import get_saved_users
 from models.team_model import get_saved_teams
+from utils.bulk_save import bulk_save
 from utils.errors import  APIError
+from utils.read_cache import backend_read_cache
+from utils.outbox import OutboxEndpoint, register_outbox_endpoint, send_through_outbox
 
 
 def fetch_team_member_data(project_id, org_name, provider):
@@ -31,6 +34,10 @@ def fetch_team_members(project_id,team):
         }
 
 def get_team_members(team_id):
+    """Members of a team, from the read cache or the backend API."""
+    return backend_read_cache.get_or_load("team_members", team_id, lambda: load_team_members(team_id))
+
+def load_team_members(team_id):
     """Fetch team members from backend API."""
     try:
         response = get_team_member_data_service(team_id)
@@ -47,6 +54,31 @@ def get_team_members(team_id):
         raise e        
 
 def save_team_members(payload):
-    """Saves team members using backend API."""
-    response = save_team_members_data_service(payload)
-    return response.json()
+    """Saves team members using backend API, in chunks."""
+    def save_chunk(chunk):
+        send_through_outbox("team_members", chunk)
+
+    try:
+        result = bulk_save(payload, save_chunk, retry=False)
+    finally:
+        for team_id in {member["teamId"] for member in payload}:
+            backend_read_cache.invalidate("team_members", team_id)
+    return {"saved_count": result["saved"], **result}
+
+def send_team_members_payload(members, idempotency_key=None):
+    """Post one list of team members; also replays queued writes from the outbox."""
+    response_data = save_team_members_data_service(members, idempotency_key).json()
+    if not response_data.get("success"):
+        raise APIError(
+            response_data.get("message", "Failed to save team members"),
+            error_code=response_data.get("errorCode", "SAVE_FAILED"),
+        )
+    for team_id in {member["teamId"] for member in members}:
+        backend_read_cache.invalidate("team_members", team_id)
+
+register_outbox_endpoint("team_members", OutboxEndpoint(
+    send=send_team_members_payload,
+    records=lambda members: members,
+    record_key=lambda members, member: f"{member['teamId']}:{member['userId']}",
+    with_records=lambda members, remaining: remaining,
+))
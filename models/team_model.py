@@ -1,29 +1,45 @@
 from services.backend.get_team_data_service import get_team_data_service
 from services.backend.save_team_data_service import save_team_data_service
+from utils.bulk_save import bulk_save
 from utils.errors import APIError
+from utils.read_cache import backend_read_cache
+from utils.single_flight import model_single_flight
+from utils.delta_sync import classify_records, delta_counts, record_saved_hashes
+from utils.outbox import project_records_endpoint, register_outbox_endpoint, send_through_outbox
 
 
 def fetch_team_data(project_id, org_name, provider):
     saved_teams = get_saved_teams(project_id)
     provider_teams = get_provider_teams(org_name, provider)
 
+    # New teams and saved ones whose provider data changed since they were saved
     saved_team_ids = {team["nodeId"] for team in saved_teams}
-    unsaved_teams = [
-        team for team in provider_teams if team["nodeId"] not in saved_team_ids
-    ]
+    delta = classify_records(project_id, "teams", provider_teams, saved_team_ids)
+    unsaved_teams = delta["new"] + delta["changed"]
 
-    return {"saved_teams": saved_teams, "unsaved_teams": unsaved_teams}
+    return {
+        "saved_teams": saved_teams,
+        "unsaved_teams": unsaved_teams,
+        "delta": delta_counts(delta),
+    }
 
 
 def get_provider_teams(org_name, provider):
     """Fetch organization teams from provider with full details"""
-    project_payload = provider.get_team_data(org_name)
+    project_payload = model_single_flight.do(
+        ("provider_teams", id(provider), org_name), lambda: provider.get_team_data(org_name)
+    )
     # parent.provider_members=project_payload
 
     return project_payload
 
 
 def get_saved_teams(project_id):
+    """Saved teams of a project, from the read cache or the backend API"""
+    return backend_read_cache.get_or_load("teams", project_id, lambda: load_saved_teams(project_id))
+
+
+def load_saved_teams(project_id):
     """Fetch saved teams from backend API"""
     try:
         response = get_team_data_service(project_id)
@@ -42,17 +58,31 @@ def get_saved_teams(project_id):
 
 def save_teams(project_id, teams):
     """Save teamss"""
-    payload = {"projectId": project_id, "teams": teams}
-    response = save_team_data_service(payload)
-    response_data = response.json()
+    def save_chunk(chunk):
+        send_through_outbox("teams", {"projectId": project_id, "teams": chunk})
+
+    # Unchanged teams are already saved as they are; only new and changed ones are sent.
+    # Anything the backend does not have is new, whatever hash was stored locally.
+    saved_team_ids = {team["nodeId"] for team in get_saved_teams(project_id)}
+    delta = classify_records(project_id, "teams", teams, saved_team_ids)
+    try:
+        result = bulk_save(delta["new"] + delta["changed"], save_chunk, retry=False)
+    finally:
+        backend_read_cache.invalidate("teams", project_id)
+    return {"saved_count": result["saved"], **result, "delta": delta_counts(delta)}
+    payload = {"projectId": project_id, "users": users}
+
 
+def send_teams_payload(payload, idempotency_key=None):
+    """Post one teams payload; also replays queued writes from the outbox"""
+    response_data = save_team_data_service(payload, idempotency_key).json()
     if not response_data.get("success"):
-        raise APIError(response_data.get("message", "Failed to save teams"))
+        raise APIError(
+            response_data.get("message", "Failed to save teams"),
+            error_code=response_data.get("errorCode", "SAVE_FAILED"),
+        )
+    record_saved_hashes(payload["projectId"], "teams", payload["teams"])
+    backend_read_cache.invalidate("teams", payload["projectId"])
 
-    # # Reload updated team data
-    # refreshed_data = get_saved_teams(parent)
-    return {
-        "saved_count": len(payload["teams"]),
-        # "refreshed_data": refreshed_data
-    }
-    payload = {"projectId": project_id, "users": users}
+
+register_outbox_endpoint("teams", project_records_endpoint(send_teams_payload, "teams"))
@@ -1,23 +1,34 @@
 from services.backend.save_user_data_service import save_user_data_service 
 from services.backend.get_user_data_service import get_user_data_service
+from utils.bulk_save import bulk_save
 from utils.errors import  APIError
+from utils.read_cache import backend_read_cache
+from utils.single_flight import model_single_flight
+from utils.delta_sync import classify_records, delta_counts, record_saved_hashes
+from utils.outbox import project_records_endpoint, register_outbox_endpoint, send_through_outbox
 
 def fetch_user_data(project_id, org_name, provider):
     """Load saved and provider users, and filter unsaved ones"""
     saved_users = get_saved_users(project_id)
     provider_members = get_provider_members(org_name,provider)
 
-    unsaved_members = [
-            m for m in provider_members
-            if m["nodeId"] not in [user['nodeId'] for user in saved_users]
-        ]
+    # New members and saved ones whose provider data changed since they were saved
+    delta = classify_records(
+        project_id, "users", provider_members, {user['nodeId'] for user in saved_users}
+    )
+    unsaved_members = delta["new"] + delta["changed"]
 
     return {
         "saved_users": saved_users,
         "unsaved_members": unsaved_members,
+        "delta": delta_counts(delta),
     }
 
 def get_saved_users(project_id):
+    """Saved users of a project, from the read cache or the backend API"""
+    return backend_read_cache.get_or_load("users", project_id, lambda: load_saved_users(project_id))
+
+def load_saved_users(project_id):
     """Fetch saved users from backend API"""
     try:
         response = get_user_data_service(project_id)
@@ -36,7 +47,9 @@ def get_saved_users(project_id):
 
 def get_provider_members(org_name,provider):
     """Fetch saved users from provider API"""
-    project_payload = provider.get_user_data(org_name)
+    project_payload = model_single_flight.do(
+        ("provider_members", id(provider), org_name), lambda: provider.get_user_data(org_name)
+    )
     # parent.provider_members=project_payload  
     return project_payload
 
@@ -62,11 +75,28 @@ def save_users(project_id, users):
         #     # "unsaved_members": unsaved_members,
         #     "saved_count": len(payload["users"])
         # }
-    payload = {"projectId": project_id, "users": users}
-    response = save_user_data_service(payload)
-    result = response.json()
+    def save_chunk(chunk):
+        send_through_outbox("users", {"projectId": project_id, "users": chunk})
+
+    # Unchanged users are already saved as they are; only new and changed ones are sent.
+    # Anything the backend does not have is new, whatever hash was stored locally.
+    saved_node_ids = {user['nodeId'] for user in get_saved_users(project_id)}
+    delta = classify_records(project_id, "users", users, saved_node_ids)
+    try:
+        result = bulk_save(delta["new"] + delta["changed"], save_chunk, retry=False)
+    finally:
+        backend_read_cache.invalidate("users", project_id)
+    return {"saved_count": result["saved"], **result, "delta": delta_counts(delta)}
 
+def send_users_payload(payload, idempotency_key=None):
+    """Post one users payload; also replays queued writes from the outbox"""
+    result = save_user_data_service(payload, idempotency_key).json()
     if not result.get("success"):
-        raise APIError(result.get("message", "Failed to save users"))
+        raise APIError(
+            result.get("message", "Failed to save users"),
+            error_code=result.get("errorCode", "SAVE_FAILED"),
+        )
+    record_saved_hashes(payload["projectId"], "users", payload["users"])
+    backend_read_cache.invalidate("users", payload["projectId"])
 
-    return {"saved_count": len(users)}
+register_outbox_endpoint("users", project_records_endpoint(send_users_payload, "users"))
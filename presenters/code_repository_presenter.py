@@ -9,7 +9,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from functools import partial
-from utils.errors import show_error_message, APIError, InputValidationError
+from utils.errors import show_error_message, show_bulk_save_result, APIError, InputValidationError
 from utils.threading import worker_spinner
 from models.code_repository_model import (
     fetch_code_repository_data,
@@ -177,11 +177,7 @@ def save_selected_repositories(parent):
             return save_code_repositories(project_id, selected_repos)
 
         def on_success(result):
-            QMessageBox.information(
-                parent,
-                "Success",
-                f"Saved {result['saved_count']} repositories successfully.",
-            )
+            show_bulk_save_result(parent, result, "repositories")
             load_repos_data(parent)
 
         def on_error(e):
@@ -83,7 +83,9 @@ def update_provider_fields(parent):
     provider = parent.provider_combo.currentText()
 
     if provider == ProviderType.GITHUB.value:
-        parent.pat_input.setToolTip("Enter a GitHub PAT with 'read:org' scope")
+        parent.pat_input.setToolTip(
+            "Enter a GitHub PAT with 'read:org' scope, or several separated by commas to rotate between them"
+        )
         parent.org_input.setPlaceholderText("e.g., codefusionuom")
         parent.org_input.setToolTip("Enter the GitHub organization name")
     elif provider == ProviderType.AZURE_DEVOPS.value:
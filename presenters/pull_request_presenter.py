@@ -1,4 +1,4 @@
-from PyQt6.QtWidgets import QMessageBox, QApplication
+from PyQt6.QtWidgets import QMessageBox, QApplication, QTableWidgetItem
 import requests
 from utils.errors import (
     show_error_message,
@@ -8,39 +8,30 @@ from utils.errors import (
 )
 from datetime import datetime
 from utils.threading import worker_spinner
+from utils.dates import parse_iso_date
 from models.pull_request_model import (
     fetch_pull_request_data,
     fetch_last_pr_data,
     fetch_and_save_pull_requests,
+    sync_all_pull_requests,
 )
 
-try:
-    import iso8601
-except ImportError:
-    iso8601 = None
-    print("Warning: iso8601 module not found, using datetime fallback")
-
-
-def parse_iso_date(date_str):
-    """Parse ISO 8601 date with fallback if iso8601 is unavailable."""
-    if iso8601:
-        return iso8601.parse_date(date_str)
-    else:
-        try:
-            for fmt in (
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-                "%Y-%m-%dT%H:%M:%SZ",
-                "%Y-%m-%dT%H:%M:%S.%f",
-                "%Y-%m-%dT%H:%M:%S",
-            ):
-                try:
-                    return datetime.strptime(date_str, fmt)
-                except ValueError:
-                    continue
-            raise ValueError(f"Invalid date format: {date_str}")
-        except Exception as e:
-            print(f"Date parsing error: {e}")
-            raise
+PR_SYNC_COLUMNS = ["Repository", "Status", "Pages", "PRs", "Elapsed", "Error"]
+
+
+def update_rate_limit_label(parent):
+    """Show the provider's remaining API budget per rate-limit resource."""
+    provider = getattr(parent, "current_provider", None)
+    status = provider.get_rate_limit_status() if provider else {}
+    if not status:
+        parent.rate_limit_label.setText("API Budget: Not tracked")
+        return
+
+    parts = [
+        f"{name}: {budget['remaining']}/{budget['limit']} (resets {budget['resetAt'][11:16]})"
+        for name, budget in sorted(status.items())
+    ]
+    parent.rate_limit_label.setText("API Budget: " + ", ".join(parts))
 
 
 def load_pull_request_data(parent):
@@ -63,6 +54,8 @@ def load_pull_request_data(parent):
             full_name = repo.get("fullName", "Unknown/Unknown")
             parent.repo_combo.addItem(f"{name} ({full_name})", repo)
 
+        parent.sync_all_prs_btn.setEnabled(bool(result["saved_repos"]))
+
     def on_error(e):
         from requests.exceptions import ConnectionError, Timeout
 
@@ -192,31 +185,38 @@ def fetch_and_save_new_pull_requests(parent):
         parent.pr_progress_bar.setVisible(False)
         parent.fetch_prs_btn.setEnabled(True)
 
-        pr_payload = result.get("pr_payload", [])
-        response = result.get("response")
+        update_rate_limit_label(parent)
 
-        if not pr_payload:
+        if not result["fetched"]:
             msg = (
                 "No pull requests found."
-                if not filter_date
+                if not result["filterDate"]
                 else "No new pull requests found since the last fetch."
             )
             QMessageBox.information(parent, "No PRs", msg)
             return
 
-        response_data = response.json()
-
-        if response_data.get("success"):
-            QMessageBox.information(
-                parent, "Success", f"Saved {len(pr_payload)} pull requests successfully"
+        if result["failedChunks"]:
+            show_error_message(
+                parent,
+                APIError(
+                    f"Saved {result['saved']} of {result['fetched']} pull requests; "
+                    f"{result['failedChunks']} of {result['chunks']} chunks failed",
+                    details=result["errors"][0],
+                ),
+                "API Error",
             )
-            fetch_last_pull_request(parent)
         else:
-            raise APIError(response_data.get("message", "Failed to save pull requests"))
+            resumed = " (resumed an interrupted sync)" if result["resumed"] else ""
+            QMessageBox.information(
+                parent, "Success", f"Saved {result['saved']} pull requests successfully{resumed}"
+            )
+        fetch_last_pull_request(parent)
 
     def on_error(e):
         parent.pr_progress_bar.setVisible(False)
         parent.fetch_prs_btn.setEnabled(True)
+        update_rate_limit_label(parent)
 
         if isinstance(e, InputValidationError):
             show_error_message(parent, e, "Input Error")
@@ -237,3 +237,94 @@ def fetch_and_save_new_pull_requests(parent):
         on_success=on_success,
         on_error=on_error,
     )
+
+
+def sync_all_repositories(parent):
+    """Sync new PRs of every saved repository concurrently, with a per-repo status table."""
+    repos = getattr(parent, "saved_repos_data", None)
+    if not repos:
+        show_error_message(
+            parent, InputValidationError("No saved repositories to sync."), "Input Error"
+        )
+        return
+
+    parent.sync_all_prs_btn.setEnabled(False)
+    parent.fetch_prs_btn.setEnabled(False)
+
+    # One row per repository, keyed by codeRepositoryId
+    table = parent.pr_sync_table
+    table.setRowCount(len(repos))
+    table.setVisible(True)
+    parent.pr_sync_rows = {}
+    for row, repo in enumerate(repos):
+        parent.pr_sync_rows[repo.get("codeRepositoryId")] = row
+        update_sync_row(
+            parent,
+            {"fullName": repo.get("fullName"), "state": "queued", "pages": 0, "prs": 0,
+             "elapsed": 0.0, "error": None},
+            row,
+        )
+
+    duplicates_before = parent.current_provider.get_pr_sync_stats().get("duplicatesDropped", 0)
+
+    def task(progress_callback):
+        return sync_all_pull_requests(
+            parent.current_provider, parent.saved_users, repos, progress_callback
+        )
+
+    def on_progress(status):
+        row = parent.pr_sync_rows.get(status.get("codeRepositoryId"))
+        if row is not None:
+            update_sync_row(parent, status, row)
+
+    def on_success(results):
+        parent.sync_all_prs_btn.setEnabled(True)
+        parent.fetch_prs_btn.setEnabled(bool(getattr(parent, "selected_repo_data", None)))
+        update_rate_limit_label(parent)
+
+        failed = [status for status in results if status["state"] == "failed"]
+        total_prs = sum(status["prs"] for status in results)
+        message = (
+            f"Synced {len(results) - len(failed)} of {len(results)} repositories "
+            f"({total_prs} pull requests). {len(failed)} failed."
+        )
+        duplicates = (
+            parent.current_provider.get_pr_sync_stats().get("duplicatesDropped", 0)
+            - duplicates_before
+        )
+        if duplicates:
+            message += f"\n{duplicates} duplicate pull requests were skipped."
+        QMessageBox.information(parent, "Sync Complete", message)
+
+    def on_error(e):
+        parent.sync_all_prs_btn.setEnabled(True)
+        parent.fetch_prs_btn.setEnabled(bool(getattr(parent, "selected_repo_data", None)))
+        update_rate_limit_label(parent)
+        show_error_message(parent, e, "Sync Error")
+
+    worker_spinner(
+        parent=parent,
+        progress_bar=parent.pr_progress_bar,
+        task_fn=task,
+        on_success=on_success,
+        on_error=on_error,
+        on_progress=on_progress,
+    )
+
+
+def update_sync_row(parent, status, row):
+    """Write one repository's sync status into the status table."""
+    values = [
+        status.get("fullName") or "",
+        status.get("state", ""),
+        str(status.get("pages", 0)),
+        str(status.get("prs", 0)),
+        f"{status.get('elapsed', 0.0):.1f}s",
+        status.get("error") or "",
+    ]
+    for column, value in enumerate(values):
+        item = QTableWidgetItem(value)
+        if column == len(values) - 1 and value:
+            item.setToolTip(value)
+        parent.pr_sync_table.setItem(row, column, item)
+
@@ -16,7 +16,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from functools import partial
-from utils.errors import show_error_message, APIError, InputValidationError
+from utils.errors import show_error_message, show_bulk_save_result, APIError, InputValidationError
 from utils.threading import worker_spinner
 from models.user_model import get_saved_users
 from models.team_model import get_saved_teams
@@ -294,21 +294,13 @@ def save_selected_team_members(parent):
     def task():
         return save_team_members(payload)
 
-    def on_success(response_data):
+    def on_success(result):
         parent.save_team_members_btn.setEnabled(bool(parent.selected_team_users))
         parent.selected_team_users.clear()
 
-        if response_data.get("success"):
-            QMessageBox.information(
-                parent, "Success", "Saved team members successfully."
-            )
+        show_bulk_save_result(parent, result, "team members")
+        if result["saved"]:
             load_team_member_data(parent)  # Refresh view
-        else:
-            QMessageBox.critical(
-                parent,
-                str(response_data.get("errorCode", "API_ERROR")),
-                str(response_data.get("message", "Operation failed without details")),
-            )
 
     def on_error(e):
         parent.save_team_members_btn.setEnabled(bool(parent.selected_team_users))
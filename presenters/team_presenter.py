@@ -9,6 +9,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QApplication
 from functools import partial
+from utils.errors import show_error_message, show_bulk_save_result
 from utils.threading import worker_spinner
 from models.team_model import fetch_team_data, save_teams
 
@@ -144,9 +145,7 @@ def save_selected_teams(parent):
     def on_success(result):
         parent.save_teams_btn.setEnabled(True)
 
-        QMessageBox.information(
-            parent, "Success", f"Saved {result['saved_count']} teams successfully."
-        )
+        show_bulk_save_result(parent, result, "teams")
 
         load_team_data(parent)
         parent.selected_teams.clear()
@@ -10,7 +10,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QApplication
 from functools import partial
-from utils.errors import show_error_message
+from utils.errors import show_error_message, show_bulk_save_result
 from utils.threading import worker_spinner
 from models.user_model import fetch_user_data, save_users
 
@@ -200,9 +200,7 @@ def save_selected_users(parent):
         parent.save_users_btn.setEnabled(True)
         parent.selected_users.clear()
 
-        QMessageBox.information(
-            parent, "Success", f"Saved {result['saved_count']} users successfully."
-        )
+        show_bulk_save_result(parent, result, "users")
 
         clear_user_ui(parent)
         # display_saved_users(parent, result["saved_users"])
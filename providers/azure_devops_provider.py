@@ -1,20 +1,26 @@
 import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 from .base_provider import SourceControlProvider
-from config.api_config import AZURE_DEVOPS_API
+from config.api_config import AZURE_DEVOPS_API, HTTP_POOL_CONFIG, AZURE_RETRY_CONFIG, AZURE_ENRICHMENT_CONFIG
+from utils.transport import HttpTransport
+from utils.retry import RetryPolicy, RetryBudget
 import base64
 from utils.errors import handle_azure_error,AzureAPIError
 from services.azure_devops.get_organization_data_service import get_organization_data_service
 from services.azure_devops.get_user_data_service import get_user_data_service
 from services.azure_devops.get_team_data_service import get_team_data_service
 from services.azure_devops.get_repository_data_service import get_repository_data_service
-from services.azure_devops.get_pr_data_service import get_pr_data_service
+from services.azure_devops.get_pr_data_service import get_pr_data_service, iter_pr_data_pages_service
 from services.azure_devops.get_team_members_data_service import get_team_members_data_service
 
 
 class AzureDevOpsProvider(SourceControlProvider):
     """Azure DevOps implementation of the source control provider."""
+
+    provider_type = "azure_devops"
     
     def __init__(self,org_name:str, token: str):
         """Initialize Azure DevOps provider with PAT token."""
@@ -28,9 +34,46 @@ class AzureDevOpsProvider(SourceControlProvider):
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
+        # Throttled (429/503) and dropped requests are retried with backoff;
+        # the budget is reset at the start of every sync (see begin_sync)
+        self.retry_budget = RetryBudget(AZURE_RETRY_CONFIG["sync_retry_budget"])
+        self.retry_policy = RetryPolicy(
+            max_attempts=AZURE_RETRY_CONFIG["max_attempts"],
+            base_delay=AZURE_RETRY_CONFIG["base_delay"],
+            max_delay=AZURE_RETRY_CONFIG["max_delay"],
+            retry_statuses=AZURE_RETRY_CONFIG["retry_statuses"],
+            budget=self.retry_budget
+        )
+        self.transport = HttpTransport(
+            **HTTP_POOL_CONFIG["azure_devops"],
+            retry_policy=self.retry_policy,
+            coalesce_gets=True
+        )
+        # PRs found in both the Opened and Closed windows and uploaded once
+        self.pr_duplicates_dropped = 0
+        self._stats_lock = threading.Lock()
+        # Enrichment has its own transport and retry budget, so a throttled
+        # enrichment pass cannot use up the retries of the PR listing
+        self.enrichment_retry_budget = RetryBudget(AZURE_RETRY_CONFIG["enrichment_retry_budget"])
+        self.enrichment_transport = HttpTransport(
+            **HTTP_POOL_CONFIG["azure_devops"],
+            retry_policy=RetryPolicy(
+                max_attempts=AZURE_RETRY_CONFIG["max_attempts"],
+                base_delay=AZURE_RETRY_CONFIG["base_delay"],
+                max_delay=AZURE_RETRY_CONFIG["max_delay"],
+                retry_statuses=AZURE_RETRY_CONFIG["retry_statuses"],
+                budget=self.enrichment_retry_budget
+            )
+        )
+        # Bounds concurrent PR enrichment calls across every repository being synced
+        self.enrichment_executor = ThreadPoolExecutor(
+            max_workers=AZURE_ENRICHMENT_CONFIG["max_workers"],
+            thread_name_prefix="azure-pr-enrich"
+        )
 
     def get_organization_data(self, org_name: str) -> Dict[str, Any]:
         try:
+            self.retry_budget.reset()
             project_payload=get_organization_data_service(self,org_name)
                 
             return project_payload
@@ -43,6 +86,7 @@ class AzureDevOpsProvider(SourceControlProvider):
 
     def get_user_data(self, org_name: str) -> list[str]:
         try:
+            self.retry_budget.reset()
             
             users=get_user_data_service(self,org_name)
                
@@ -56,6 +100,7 @@ class AzureDevOpsProvider(SourceControlProvider):
         
     def get_team_data(self, org_name: str) -> list[str]:
         try:
+            self.retry_budget.reset()
             
             teams=get_team_data_service(self,org_name)
                
@@ -69,6 +114,7 @@ class AzureDevOpsProvider(SourceControlProvider):
         
     def get_repository_data(self,org_name:str) -> Dict[str,Any]:
         try:
+            self.retry_budget.reset()
             print(org_name)
             repos=get_repository_data_service(self,org_name)
              
@@ -92,8 +138,24 @@ class AzureDevOpsProvider(SourceControlProvider):
                     str(e)
                 ) 
                    
+    def iter_pr_pages(self,saved_users,repo_data,filter_date,after=None):
+        return iter_pr_data_pages_service(self,saved_users,repo_data,filter_date,after)
+                   
+    def begin_sync(self):
+        self.retry_budget.reset()
+        self.enrichment_retry_budget.reset()
+
+    def record_pr_duplicates(self, count: int):
+        with self._stats_lock:
+            self.pr_duplicates_dropped += count
+
+    def get_pr_sync_stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return {"duplicatesDropped": self.pr_duplicates_dropped}
+
     def get_team_members_data(self, teamName:str,teamId:str) -> list[str]:
         try:
+            self.retry_budget.reset()
             
             teams=get_team_members_data_service(self,teamId)
                
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 
 class SourceControlProvider(ABC):
     """Abstract base class for source control providers."""
@@ -32,4 +32,46 @@ class SourceControlProvider(ABC):
 
     @abstractmethod
     def get_team_members_data(self,teamName:str,teamId:str) -> Dict[str,Any]:
-        pass
\ No newline at end of file
+        pass
+
+    def iter_pr_pages(self,saved_users,repo_data,filter_date,after=None) -> Iterator[List[Dict[str,Any]]]:
+        """Yield pull request payloads page by page (default: everything as one page).
+
+        ``after`` is a provider-specific continuation token: the ``cursor``
+        of a yielded ``Page`` or the ``endCursor`` of ``get_first_pr_pages``.
+        Providers that never return one ignore it.
+        """
+        yield self.get_pr_data(saved_users, repo_data, filter_date)
+
+    def get_first_pr_pages(self,saved_users,repo_requests) -> Dict[Any,Dict[str,Any]]:
+        """First PR page of many repositories at once, keyed by codeRepositoryId.
+
+        Each entry holds ``prs``, ``hasNextPage`` and ``endCursor``.
+        Providers without a batched query return {} and every repository is
+        fetched through ``iter_pr_pages`` alone.
+        """
+        return {}
+
+    def begin_sync(self):
+        """Start a PR sync that may span many repositories and threads.
+
+        Called once per sync, before any of its requests, so per-sync limits
+        such as a retry budget bound the whole sync rather than one call.
+        """
+        pass
+
+    def get_sync_scope(self) -> str:
+        """Key separating local sync state of different providers and organizations."""
+        return f"{self.provider_type}:{self.org_name}"
+
+    def get_pr_sync_stats(self) -> Dict[str, int]:
+        """Cumulative PR collection counters, e.g. duplicates dropped (empty if none)."""
+        return {}
+
+    def get_rate_limit_status(self) -> Dict[str, Dict[str, Any]]:
+        """Remaining API budget per rate-limit resource (empty if not tracked)."""
+        return {}
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """HTTP cache hit/miss/bytes-saved counters (empty if not cached)."""
+        return {}
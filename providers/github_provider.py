@@ -1,29 +1,64 @@
+import re
 import requests
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 from .base_provider import SourceControlProvider
-from config.api_config import GITHUB_API
+from config.api_config import GITHUB_API, HTTP_POOL_CONFIG, RATE_LIMIT_CONFIG, HTTP_CACHE_CONFIG, PR_SYNC_CONFIG
+from utils.transport import HttpTransport
+from utils.rate_limit import RateLimitGovernor
+from utils.token_pool import TokenPool
+from utils.http_cache import ConditionalRequestCache
+from utils.paths import get_app_data_dir
 from utils.errors import handle_github_error,GitHubAPIError
 from services.github.get_organization_data_service import get_organization_data_service
 from services.github.get_user_data_service import get_user_data_service
 from services.github.get_team_data_service import get_team_data_service
-from services.github.get_pr_data_service import get_pr_data_service
+from services.github.get_pr_data_service import get_pr_data_service, iter_pr_data_pages_service, get_first_pr_pages_service
 from services.github.get_repository_data_service import get_repository_data_service
 from services.github.get_team_members_data_service import get_team_members_data_service
 
 class GitHubProvider(SourceControlProvider):
     """GitHub implementation of the source control provider."""
+
+    provider_type = "github"
     
-    def __init__(self,org_name:str, token: str):
-        """Initialize GitHub provider with PAT token."""
-        self.token = token
+    def __init__(self,org_name:str, token):
+        """Initialize GitHub provider with one PAT, or a pool of PATs.
+
+        ``token`` may be a list of tokens or a string of tokens separated by
+        commas or whitespace; requests are then rotated across the pool.
+        """
+        self.tokens = parse_tokens(token)
+        self.token = self.tokens[0]
         self.org_name=org_name
         self.headers = {
-            "Authorization": f"Bearer {token}",
+            "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json",
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": "2022-11-28"
         }
+        # Each token is paced by its own governor; the pool picks the token
+        # with the most headroom for every request
+        self.rate_limiter = TokenPool(
+            self.tokens,
+            lambda: RateLimitGovernor(
+                limit=RATE_LIMIT_CONFIG["limit"],
+                window=RATE_LIMIT_CONFIG["window"],
+                burst=RATE_LIMIT_CONFIG["burst"],
+                reserve=RATE_LIMIT_CONFIG["reserve"]
+            )
+        )
+        self.http_cache = (
+            ConditionalRequestCache(get_app_data_dir(HTTP_CACHE_CONFIG["directory"]))
+            if HTTP_CACHE_CONFIG["enabled"] else None
+        )
+        self.transport = HttpTransport(
+            **HTTP_POOL_CONFIG["github"],
+            governor=self.rate_limiter,
+            max_rate_limit_waits=RATE_LIMIT_CONFIG["max_rate_limit_waits"],
+            cache=self.http_cache,
+            coalesce_gets=True
+        )
     
     def get_organization_data(self, org_name: str) -> Dict[str, Any]:
  
@@ -87,6 +122,14 @@ class GitHubProvider(SourceControlProvider):
                 str(e)
             ) 
                   
+    def iter_pr_pages(self,saved_users,repo_data,filter_date,after=None):
+        return iter_pr_data_pages_service(self,saved_users,repo_data,filter_date,after)
+
+    def get_first_pr_pages(self,saved_users,repo_requests):
+        return get_first_pr_pages_service(
+            self,saved_users,repo_requests,PR_SYNC_CONFIG["graphql_batch_size"]
+        )
+                  
     def get_team_members_data(self,teamName:str,teamId:str) -> Dict[str,Any]:
         try:
             teams=get_team_members_data_service(self,teamName)
@@ -97,4 +140,19 @@ class GitHubProvider(SourceControlProvider):
             raise GitHubAPIError(
                 "Failed to connect to GitHub API",
                 str(e)
-            )    
\ No newline at end of file
+            )
+
+    def get_rate_limit_status(self) -> Dict[str, Dict[str, Any]]:
+        return self.rate_limiter.status()
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        return self.http_cache.stats() if self.http_cache else {}
+
+
+def parse_tokens(token) -> List[str]:
+    """Split a token list or a comma/whitespace separated token string."""
+    candidates = token if isinstance(token, (list, tuple)) else re.split(r"[,\s]+", token or "")
+    tokens = [candidate.strip() for candidate in candidates if candidate and candidate.strip()]
+    if not tokens:
+        raise ValueError("At least one GitHub Personal Access Token is required")
+    return tokens
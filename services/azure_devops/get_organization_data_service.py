@@ -29,7 +29,7 @@ def get_organization_data_service(self, org_name: str) -> Dict[str, Any]:
             # Get organization details (needed for avatar URL) and project details
 
             url = AZURE_DEVOPS_API["get_project_details"](organization, project)
-            response = requests.get(
+            response = self.transport.get(
                     url,
                     headers=self.headers,
                     timeout=10
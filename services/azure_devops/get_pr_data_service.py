@@ -1,77 +1,153 @@
+import json
+import logging
 import requests
-from config.api_config import AZURE_DEVOPS_API
+from config.api_config import AZURE_DEVOPS_API, AZURE_ENRICHMENT_CONFIG
 from utils.errors import handle_azure_error,AzureAPIError
-from utils.hash import hash_id
+from utils.author_index import AuthorIndex
+from utils.json_stream import iter_json_array
+from utils.pagination import merge_page_streams, Page
+from utils.dates import format_utc
+from services.azure_devops.get_pr_enrichment_service import enrich_pr_page_service, retry_failed_enrichments_service
+
+# Both time windows are searched; a PR opened and closed inside the window shows up in each
+PR_TIME_WINDOWS = [
+    ("Opened", "get_pull_requests_with_criteria_opened"),
+    ("Closed", "get_pull_requests_with_criteria_closed"),
+]
 
 def get_pr_data_service(self, saved_users, repo_data, filter_date) -> list[str]:
+    return [
+        pr
+        for page in iter_pr_data_pages_service(self, saved_users, repo_data, filter_date)
+        for pr in page
+    ]
+
+def iter_pr_data_pages_service(self, saved_users, repo_data, filter_date, after=None):
+    """
+    Yield the PR payloads of a repository one $top-sized page at a time.
+
+    The Opened and Closed windows are paged concurrently and merged as pages
+    arrive. A pullRequestId already yielded from the other window is
+    dropped, so every PR is uploaded once. The count of dropped duplicates is
+    logged and added to the provider's ``get_pr_sync_stats``.
+
+    When ``AZURE_ENRICHMENT_CONFIG["enabled"]`` is set, each merged page gets
+    its commit and diff stats from ``enrich_pr_page_service`` before it is
+    yielded, while the windows keep paging in the background. PRs whose
+    enrichment failed in an earlier sync are enriched again and yielded
+    first, so the stats they were uploaded without get filled in.
+
+    Every yielded page is a ``Page`` whose cursor is a JSON object holding
+    each window's next ``$skip``. Passing it back as ``after`` resumes
+    both windows from there.
+    """
     try:
+        authors = AuthorIndex.of(saved_users)
         org_name = self.org_name
         parts = org_name.split('/')
         if len(parts) != 2:
             raise ValueError("Azure DevOps organization name must be in format 'organization/project'")
-        
+
         organization, project = parts
-        all_prs = []
-        
-        # Fetch both opened and closed PRs
-        for pr_type, api_key in [("Opened", "get_pull_requests_with_criteria_opened"), ("Closed", "get_pull_requests_with_criteria_closed")]:
-            skip = 0
-            top = 100
-            has_more = True
-            while has_more:
-                response = requests.get(
-                    AZURE_DEVOPS_API[api_key](
-                        organization,
-                        project,
-                        repo_data.get('nodeId'),
-                        "all",
-                        filter_date
-                    ) + f"&$skip={skip}&$top={top}",
-                    headers=self.headers,
-                    timeout=10000
+
+        positions = json.loads(after) if after else {}
+        seen_ids = set()
+        duplicates = 0
+        retried_ids = set()
+        if AZURE_ENRICHMENT_CONFIG["enabled"]:
+            retried = retry_failed_enrichments_service(self, repo_data, organization, project)
+            if retried:
+                retried_ids.update(payload["number"] for payload in retried)
+                yield Page(retried, cursor=json.dumps(positions))
+        try:
+            for page_entries in merge_page_streams(
+                iter_window_pages(
+                    self, authors, repo_data, filter_date, organization, project,
+                    pr_type, api_key, positions.get(pr_type, 0)
+                )
+                for pr_type, api_key in PR_TIME_WINDOWS
+            ):
+                pr_type, next_skip = page_entries.cursor
+                positions[pr_type] = next_skip
+                new_entries = []
+                for entry in page_entries:
+                    if entry[0]["number"] in retried_ids:
+                        continue
+                    if entry[0]["number"] in seen_ids:
+                        duplicates += 1
+                        continue
+                    seen_ids.add(entry[0]["number"])
+                    new_entries.append(entry)
+                if not new_entries:
+                    continue
+                if AZURE_ENRICHMENT_CONFIG["enabled"]:
+                    enrich_pr_page_service(self, repo_data, organization, project, new_entries)
+                yield Page((payload for payload, _ in new_entries), cursor=json.dumps(positions))
+        finally:
+            self.record_pr_duplicates(duplicates)
+            if duplicates:
+                logging.info(
+                    f"Dropped {duplicates} duplicate PRs of '{repo_data.get('fullName')}' "
+                    "found in both the Opened and Closed windows"
                 )
-                if response.status_code != 200:
-                    handle_azure_error(response, f"Organization '{org_name}' ({pr_type})")
-                pr_data = response.json().get("value", [])
-                if not pr_data:
-                    has_more = False
-                    break
-                current_batch = []
-                for pr in pr_data:
-                    azure_user_id = pr.get('createdBy', {}).get('id')
-                    user_id = None
-                    for user in saved_users:
-                        if user.get('nodeId') == hash_id(azure_user_id):
-                            user_id = user.get('userId')
-                            break
-                    pr_status = pr.get('status')
-                    merge_status = pr.get('mergeStatus')
-                    closed_date = pr.get('closedDate')
-                    pr_merged_at = closed_date if pr_status == "completed" and merge_status == "succeeded" else None
-                    current_batch.append({
-                        "nodeId": str(pr.get('pullRequestId')),
-                        "number": pr.get('pullRequestId'),
-                        "state": pr_status,
-                        "prCreatedAt": pr.get('creationDate'),
-                        "prUpdatedAt": pr.get('creationDate'),
-                        "prMergedAt": pr_merged_at,
-                        "prClosedAt": closed_date,
-                        "codeRepositoryId": repo_data.get('codeRepositoryId'),
-                        "projectId": repo_data.get('projectId'),
-                        "userId": user_id,
-                        "commits": 0,
-                        "additions": 0,
-                        "deletions": 0,
-                        "changedFiles": 0
-                    })
-                all_prs.extend(current_batch)
-                skip += top
-        return all_prs
     except requests.exceptions.RequestException as e:
         raise AzureAPIError(
             "Failed to connect to Azure DevOps API",
             str(e)
         )
+
+def iter_window_pages(self, authors, repo_data, filter_date, organization, project, pr_type, api_key, skip=0):
+    """
+    Yield (payload, last merge commit id) pairs of one time window (Opened or Closed) page by page.
+
+    Each page's cursor is ``(pr_type, skip of the next page)``.
+    """
+    top = 100
+    while True:
+        response = self.transport.get(
+            AZURE_DEVOPS_API[api_key](
+                organization,
+                project,
+                repo_data.get('nodeId'),
+                "all",
+                format_utc(filter_date) if filter_date else None
+            ) + f"&$skip={skip}&$top={top}",
+            headers=self.headers,
+            timeout=10000,
+            stream=True
+        )
+        if response.status_code != 200:
+            handle_azure_error(response, f"Organization '{self.org_name}' ({pr_type})")
+        page_prs = []
+        # Decode the page's "value" array one PR at a time
+        with response:
+            for pr in iter_json_array(response, "value"):
+                user_id = authors.resolve(pr.get('createdBy', {}).get('id'))
+                pr_status = pr.get('status')
+                merge_status = pr.get('mergeStatus')
+                closed_date = pr.get('closedDate')
+                pr_merged_at = closed_date if pr_status == "completed" and merge_status == "succeeded" else None
+                merge_commit_id = (pr.get('lastMergeCommit') or pr.get('lastMergeSourceCommit') or {}).get('commitId')
+                page_prs.append(({
+                    "nodeId": str(pr.get('pullRequestId')),
+                    "number": pr.get('pullRequestId'),
+                    "state": pr_status,
+                    "prCreatedAt": pr.get('creationDate'),
+                    "prUpdatedAt": pr.get('creationDate'),
+                    "prMergedAt": pr_merged_at,
+                    "prClosedAt": closed_date,
+                    "codeRepositoryId": repo_data.get('codeRepositoryId'),
+                    "projectId": repo_data.get('projectId'),
+                    "userId": user_id,
+                    "commits": 0,
+                    "additions": 0,
+                    "deletions": 0,
+                    "changedFiles": 0
+                }, merge_commit_id))
+        if not page_prs:
+            return
+        skip += top
+        yield Page(page_prs, cursor=(pr_type, skip))
 # def get_pr_data_service(self,saved_users,repo_data,filter_date)  -> list[str]:
 #         try:
 #             org_name=self.org_name
@@ -0,0 +1,254 @@
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from config.api_config import AZURE_DEVOPS_API, AZURE_ENRICHMENT_CONFIG
+from utils.errors import handle_azure_error
+from utils.local_store import get_local_store
+
+ENRICHMENT_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS azure_pr_enrichment (
+        repository_id TEXT NOT NULL,
+        pull_request_id INTEGER NOT NULL,
+        merge_commit_id TEXT NOT NULL,
+        commits INTEGER NOT NULL,
+        additions INTEGER NOT NULL,
+        deletions INTEGER NOT NULL,
+        changed_files INTEGER NOT NULL,
+        PRIMARY KEY (repository_id, pull_request_id, merge_commit_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS azure_pr_enrichment_retry (
+        repository_id TEXT NOT NULL,
+        pull_request_id INTEGER NOT NULL,
+        merge_commit_id TEXT,
+        payload TEXT NOT NULL,
+        attempts INTEGER NOT NULL DEFAULT 1,
+        PRIMARY KEY (repository_id, pull_request_id)
+    )
+    """,
+]
+
+# FileDiff lineDiffBlock.changeType values (numeric or by name, depending on the API version)
+LINE_DIFF_ADDS = (1, 3, "add", "edit")
+LINE_DIFF_DELETES = (2, 3, "delete", "edit")
+
+STAT_FIELDS = ("commits", "additions", "deletions", "changedFiles")
+
+
+def enrich_pr_page_service(self, repo_data, organization, project, entries: List[Tuple[Dict[str, Any], Optional[str]]]):
+    """
+    Fill in ``commits``, ``additions``, ``deletions`` and ``changedFiles`` of a page of PR payloads.
+
+    Stats are cached in the local store by pullRequestId and last merge
+    commit id. A PR whose merge commit has not changed (every completed PR)
+    is never enriched twice. The rest are fetched concurrently on the
+    provider's bounded enrichment pool. A PR whose enrichment fails is
+    uploaded with zeros and recorded, and ``retry_failed_enrichments_service``
+    enriches and re-uploads it on the next sync.
+
+    Args:
+        entries: (payload, last merge commit id) pairs; payloads are updated in place
+    """
+    store = get_local_store()
+    store.ensure_schema("azure_pr_enrichment", ENRICHMENT_SCHEMA)
+    repository_id = repo_data.get('nodeId')
+
+    pending = []
+    enriched_ids = []
+    for payload, merge_commit_id in entries:
+        cached = None
+        if merge_commit_id:
+            cached = store.fetchone(
+                "SELECT commits, additions, deletions, changed_files FROM azure_pr_enrichment "
+                "WHERE repository_id = ? AND pull_request_id = ? AND merge_commit_id = ?",
+                (repository_id, payload["number"], merge_commit_id)
+            )
+        if cached is not None:
+            payload.update(zip(STAT_FIELDS, cached))
+            enriched_ids.append((repository_id, payload["number"]))
+        else:
+            pending.append((payload, merge_commit_id))
+
+    futures = [
+        (payload, merge_commit_id, self.enrichment_executor.submit(
+            get_pr_stats_service, self, organization, project, repository_id, payload["number"]
+        ))
+        for payload, merge_commit_id in pending
+    ]
+    fresh_rows = []
+    failed_rows = []
+    for payload, merge_commit_id, future in futures:
+        try:
+            stats = future.result()
+        except Exception:
+            logging.warning(f"Could not enrich pull request {payload['number']}; retrying next sync", exc_info=True)
+            failed_rows.append((repository_id, payload["number"], merge_commit_id, json.dumps(payload)))
+            continue
+        payload.update(stats)
+        enriched_ids.append((repository_id, payload["number"]))
+        if merge_commit_id:
+            fresh_rows.append((repository_id, payload["number"], merge_commit_id,
+                               *(stats[field] for field in STAT_FIELDS)))
+
+    with store.transaction() as connection:
+        connection.executemany(
+            "INSERT OR REPLACE INTO azure_pr_enrichment "
+            "(repository_id, pull_request_id, merge_commit_id, commits, additions, deletions, changed_files) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            fresh_rows
+        )
+        connection.executemany(
+            "DELETE FROM azure_pr_enrichment_retry WHERE repository_id = ? AND pull_request_id = ?",
+            enriched_ids
+        )
+        connection.executemany(
+            "INSERT INTO azure_pr_enrichment_retry (repository_id, pull_request_id, merge_commit_id, payload) "
+            "VALUES (?, ?, ?, ?) ON CONFLICT (repository_id, pull_request_id) DO UPDATE SET "
+            "merge_commit_id = excluded.merge_commit_id, payload = excluded.payload, attempts = attempts + 1",
+            failed_rows
+        )
+
+
+def retry_failed_enrichments_service(self, repo_data, organization, project) -> List[Dict[str, Any]]:
+    """
+    Enrich the repository's PRs whose enrichment failed in an earlier sync.
+
+    Those PRs were uploaded with zeros and are not listed again once the
+    watermark has passed them. The ones enriched now are returned for
+    re-upload. The others stay recorded until they have failed
+    ``AZURE_ENRICHMENT_CONFIG["max_retry_attempts"]`` times.
+    """
+    store = get_local_store()
+    store.ensure_schema("azure_pr_enrichment", ENRICHMENT_SCHEMA)
+    repository_id = repo_data.get('nodeId')
+
+    given_up = store.execute(
+        "DELETE FROM azure_pr_enrichment_retry WHERE repository_id = ? AND attempts >= ?",
+        (repository_id, AZURE_ENRICHMENT_CONFIG["max_retry_attempts"])
+    )
+    if given_up:
+        logging.warning(f"Gave up enriching {given_up} pull requests of '{repo_data.get('fullName')}'")
+    rows = store.fetchall(
+        "SELECT merge_commit_id, payload FROM azure_pr_enrichment_retry WHERE repository_id = ?",
+        (repository_id,)
+    )
+    if not rows:
+        return []
+
+    entries = [(json.loads(row["payload"]), row["merge_commit_id"]) for row in rows]
+    enrich_pr_page_service(self, repo_data, organization, project, entries)
+    still_failing = {
+        row["pull_request_id"] for row in store.fetchall(
+            "SELECT pull_request_id FROM azure_pr_enrichment_retry WHERE repository_id = ?", (repository_id,)
+        )
+    }
+    return [payload for payload, _ in entries if payload["number"] not in still_failing]
+
+
+def get_pr_stats_service(self, organization, project, repository_id, pr_id) -> Dict[str, int]:
+    """Commit count, changed files and (optionally) added/deleted lines of one PR."""
+    commits = count_pr_commits(self, organization, project, repository_id, pr_id)
+
+    iterations = get_json(
+        self,
+        AZURE_DEVOPS_API["get_pull_request_iterations"](organization, project, repository_id, pr_id),
+        f"Pull request {pr_id} iterations"
+    ).get('value', [])
+    if not iterations:
+        return {"commits": commits, "additions": 0, "deletions": 0, "changedFiles": 0}
+
+    last_iteration = max(iterations, key=lambda iteration: iteration.get('id', 0))
+    changes = [
+        change
+        for change in iter_iteration_changes(self, organization, project, repository_id, pr_id, last_iteration['id'])
+        if not change.get('item', {}).get('isFolder')
+    ]
+
+    additions = deletions = 0
+    if AZURE_ENRICHMENT_CONFIG["line_counts"] and changes:
+        additions, deletions = count_changed_lines(self, organization, project, repository_id, last_iteration, changes)
+
+    return {
+        "commits": commits,
+        "additions": additions,
+        "deletions": deletions,
+        "changedFiles": len(changes),
+    }
+
+
+def count_pr_commits(self, organization, project, repository_id, pr_id) -> int:
+    url = AZURE_DEVOPS_API["get_pull_request_commits"](organization, project, repository_id, pr_id)
+    count = 0
+    continuation_token = None
+    while True:
+        params = {"$top": 500}
+        if continuation_token:
+            params["continuationToken"] = continuation_token
+        response = self.enrichment_transport.get(url, headers=self.headers, params=params, timeout=30)
+        if response.status_code != 200:
+            handle_azure_error(response, f"Pull request {pr_id} commits")
+        count += len(response.json().get('value', []))
+        continuation_token = response.headers.get("x-ms-continuationtoken")
+        if not continuation_token:
+            return count
+
+
+def iter_iteration_changes(self, organization, project, repository_id, pr_id, iteration_id):
+    url = AZURE_DEVOPS_API["get_pull_request_iteration_changes"](organization, project, repository_id, pr_id, iteration_id)
+    skip = 0
+    while True:
+        body = get_json(self, url, f"Pull request {pr_id} changes", params={"$top": 2000, "$skip": skip})
+        yield from body.get('changeEntries', [])
+        if not body.get('nextTop'):
+            return
+        skip = body.get('nextSkip', skip + 2000)
+
+
+def count_changed_lines(self, organization, project, repository_id, iteration, changes) -> Tuple[int, int]:
+    """Added and deleted lines between the PR's merge base and its last iteration."""
+    base_commit = (iteration.get('commonRefCommit') or iteration.get('targetRefCommit') or {}).get('commitId')
+    target_commit = (iteration.get('sourceRefCommit') or {}).get('commitId')
+    if not base_commit or not target_commit:
+        return 0, 0
+
+    additions = deletions = 0
+    batch_size = AZURE_ENRICHMENT_CONFIG["file_diff_batch_size"]
+    for start in range(0, len(changes), batch_size):
+        file_diff_params = [
+            {
+                "path": change.get('item', {}).get('path'),
+                "originalPath": change.get('originalPath') or change.get('item', {}).get('path'),
+            }
+            for change in changes[start:start + batch_size]
+        ]
+        response = self.enrichment_transport.post(
+            AZURE_DEVOPS_API["get_file_diffs"](organization, project, repository_id),
+            headers=self.headers,
+            json={
+                "baseVersionCommit": base_commit,
+                "targetVersionCommit": target_commit,
+                "fileDiffParams": file_diff_params,
+            },
+            timeout=60
+        )
+        if response.status_code != 200:
+            handle_azure_error(response, "Pull request file diffs")
+        body = response.json()
+        file_diffs = body.get('value', []) if isinstance(body, dict) else body
+        for file_diff in file_diffs:
+            for block in file_diff.get('lineDiffBlocks', []):
+                change_type = block.get('changeType')
+                if change_type in LINE_DIFF_ADDS:
+                    additions += block.get('modifiedLinesCount', 0)
+                if change_type in LINE_DIFF_DELETES:
+                    deletions += block.get('originalLinesCount', 0)
+    return additions, deletions
+
+
+def get_json(self, url, context, params=None) -> Dict[str, Any]:
+    response = self.enrichment_transport.get(url, headers=self.headers, params=params, timeout=30)
+    if response.status_code != 200:
+        handle_azure_error(response, context)
+    return response.json()
@@ -10,7 +10,7 @@ def get_repository_data_service(self, org_name: str) -> list[str]:
                 raise ValueError("Azure DevOps organization name must be in format 'organization/project'")
             
             organization, project = parts
-            response = requests.get(
+            response = self.transport.get(
                 AZURE_DEVOPS_API["get_org_repos"](organization,project),
                 headers=self.headers,
                 timeout=10000
@@ -12,7 +12,7 @@ def get_team_members_data_service(self,teamId:str) -> list[str]:
             
             organization, project = parts
             print(teamId)
-            response = requests.get(
+            response = self.transport.get(
                 AZURE_DEVOPS_API["get_team_members"](organization,project,teamId),
                 headers=self.headers,
                 timeout=10000
@@ -2,6 +2,7 @@ import requests
 from config.api_config import AZURE_DEVOPS_API
 from utils.errors import handle_azure_error,AzureAPIError
 from utils.hash import hash_id
+from utils.json_stream import iter_json_array
 
 def get_user_data_service(self, org_name: str) -> list[str]:
         try:
@@ -11,28 +12,30 @@ def get_user_data_service(self, org_name: str) -> list[str]:
                 raise ValueError("Azure DevOps organization name must be in format 'organization/project'")
             
             organization, project = parts
-            response = requests.get(
+            response = self.transport.get(
                 AZURE_DEVOPS_API["get_org_members"](organization),
                 headers=self.headers,
-                timeout=10000
+                timeout=10000,
+                stream=True
             )
 
             if response.status_code != 200:
                 handle_azure_error(response, f"Organization '{org_name}'")
        
             users=[]
-            users_response=response.json()
-            for user in users_response['members']:
-                user_details = {
-                                "userName": user.get("user").get("directoryAlias"),  
-                                "nodeId": hash_id(user.get("id")), 
-                                "avatarUrl": user.get("user").get("_links").get("avatar").get("href"),  
-                                "displayName": user.get("user").get("displayName"),  
-                                "userCreatedAt": user.get("dateCreated"),  
-                                "userUpdatedAt": user.get("lastAccessedDate") 
-                            }
-                if user_details:
-                    users.append(user_details)
+            # Decode members one at a time instead of materializing the whole document
+            with response:
+                for user in iter_json_array(response, "members"):
+                    user_details = {
+                                    "userName": user.get("user").get("directoryAlias"),  
+                                    "nodeId": hash_id(user.get("id")), 
+                                    "avatarUrl": user.get("user").get("_links").get("avatar").get("href"),  
+                                    "displayName": user.get("user").get("displayName"),  
+                                    "userCreatedAt": user.get("dateCreated"),  
+                                    "userUpdatedAt": user.get("lastAccessedDate") 
+                                }
+                    if user_details:
+                        users.append(user_details)
                
             return users 
         
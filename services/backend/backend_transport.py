@@ -0,0 +1,27 @@
+from config.api_config import BACKEND_BODY_CONFIG, HTTP_POOL_CONFIG, OUTBOX_CONFIG
+from utils.body_encoding import encode_body
+from utils.transport import HttpTransport
+
+# Single pooled transport for the local backend (BASE_API_URL), shared by all
+# backend services so saves and lookups reuse keep-alive connections.
+backend_transport = HttpTransport(**HTTP_POOL_CONFIG["backend"], coalesce_gets=True)
+
+
+def backend_write_body(payload, idempotency_key=None):
+    """
+    Request body and headers of a backend save, encoded as set in BACKEND_BODY_CONFIG.
+
+    The idempotency key lets the backend apply a replayed write once.
+
+    Returns:
+        ``data`` and ``headers`` keyword arguments for ``backend_transport.post``
+    """
+    body, headers = encode_body(
+        payload,
+        body_format=BACKEND_BODY_CONFIG["format"],
+        compression=BACKEND_BODY_CONFIG["compression"],
+        min_compress_bytes=BACKEND_BODY_CONFIG["min_compress_bytes"],
+    )
+    if idempotency_key:
+        headers[OUTBOX_CONFIG["idempotency_header"]] = idempotency_key
+    return {"data": body, "headers": headers}
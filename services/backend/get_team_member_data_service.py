@@ -1,9 +1,9 @@
-import requests
+from services.backend.backend_transport import backend_transport
 from config.api_config import  USER_API
 from utils.errors import handle_api_response
 
 def get_team_member_data_service(team_id):
-    response = requests.get(
+    response = backend_transport.get(
             USER_API["get_team_members"](team_id),
             timeout=10
         )
@@ -1,4 +1,5 @@
 import requests
+from services.backend.backend_transport import backend_transport
 from config.api_config import  USER_API
 from utils.errors import handle_api_response
 import logging
@@ -6,7 +7,7 @@ from utils.errors import  APIError,handle_api_response
 
 def save_organization_data_service(project_payload):
     try:
-        response = requests.post(
+        response = backend_transport.post(
             USER_API["create_project"],
             json=project_payload,
             headers={"Content-Type": "application/json"},
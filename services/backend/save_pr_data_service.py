@@ -1,11 +1,11 @@
-import requests
+from services.backend.backend_transport import backend_transport, backend_write_body
 from config.api_config import  USER_API
 from utils.errors import handle_api_response
 
 def save_pr_data_service(payload):
-    response = requests.post(
+    response = backend_transport.post(
         USER_API["create_pull_request"], 
-        json=payload, 
+        **backend_write_body(payload),
         timeout=10)
     handle_api_response(response)
     return response
\ No newline at end of file
@@ -1,11 +1,11 @@
-import requests
+from services.backend.backend_transport import backend_transport, backend_write_body
 from config.api_config import  USER_API
 from utils.errors import handle_api_response
 
-def save_team_members_data_service(payload):
-    response = requests.post(
+def save_team_members_data_service(payload, idempotency_key=None):
+    response = backend_transport.post(
             USER_API["create_team_member"],
-            json=payload,
+            **backend_write_body(payload, idempotency_key),
             timeout=10
         )
     
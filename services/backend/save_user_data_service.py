@@ -1,15 +1,15 @@
 import requests
+from services.backend.backend_transport import backend_transport, backend_write_body
 from config.api_config import USER_API
 from utils.errors import handle_api_response
 import logging
 from utils.errors import APIError, handle_api_response
 
-def save_user_data_service(user_payload):
+def save_user_data_service(user_payload, idempotency_key=None):
     try:
-        response = requests.post(
+        response = backend_transport.post(
             USER_API["create_user"],
-            json=user_payload,
-            headers={"Content-Type": "application/json"},
+            **backend_write_body(user_payload, idempotency_key),
             timeout=10
         )
         handle_api_response(response)
@@ -21,7 +21,7 @@ def get_organization_data_service(self, org_name: str) -> Dict[str, Any]:
         try:
          
             # Get organization details from GitHub
-            response = requests.get(
+            response = self.transport.get(
                 GITHUB_API["get_org_details"](org_name),
                 headers=self.headers,
                 timeout=10
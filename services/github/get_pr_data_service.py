@@ -1,98 +1,382 @@
+import logging
 import requests
-from typing import List, Dict, Any
-from utils.errors import GitHubAPIError
-from utils.hash import hash_id
+from typing import List, Dict, Any, Iterator
+from utils.errors import GitHubAPIError, GitHubServerError
+from utils.author_index import AuthorIndex
+from utils.dates import parse_iso_date, as_utc, format_utc
+from utils.pagination import Page
+from config.api_config import PR_SYNC_CONFIG, GRAPHQL_PAGE_SIZE_CONFIG
+from utils.page_size import AdaptivePageSize
+from services.local.page_size_service import get_page_size_service, save_page_size_service
+from services.github.graphql_query_service import run_graphql_query
+
+PR_FIELDS_FRAGMENT = """
+fragment PullRequestFields on PullRequest {
+  nodeId: id
+  number
+  title
+  state
+  createdAt
+  updatedAt
+  closedAt
+  mergedAt
+  additions
+  deletions
+  changedFiles
+  commits {
+    totalCount
+  }
+  author {
+    login
+    ... on User {
+      nodeId: id
+    }
+  }
+  url
+}
+"""
+
+PR_SEARCH_QUERY = """
+query($searchQuery: String!, $after: String, $first: Int!) {
+  rateLimit {
+    cost
+    remaining
+    resetAt
+  }
+  search(query: $searchQuery, type: ISSUE, first: $first, after: $after) {
+    pageInfo {
+      hasNextPage
+      endCursor
+    }
+    nodes {
+      ...PullRequestFields
+    }
+  }
+}
+""" + PR_FIELDS_FRAGMENT
+
+PR_CONNECTION_QUERY = """
+query($owner: String!, $name: String!, $after: String, $first: Int!) {
+  rateLimit {
+    cost
+    remaining
+    resetAt
+  }
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: $first, after: $after, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        ...PullRequestFields
+      }
+    }
+  }
+}
+""" + PR_FIELDS_FRAGMENT
+
+PR_BATCH_SEARCH_TEMPLATE = """
+  r{index}: search(query: $q{index}, type: ISSUE, first: $f{index}) {{
+    pageInfo {{
+      hasNextPage
+      endCursor
+    }}
+    nodes {{
+      ...PullRequestFields
+    }}
+  }}"""
+
+PR_BATCH_CONNECTION_TEMPLATE = """
+  r{index}: repository(owner: $o{index}, name: $n{index}) {{
+    pullRequests(first: $f{index}, orderBy: {{field: UPDATED_AT, direction: DESC}}) {{
+      pageInfo {{
+        hasNextPage
+        endCursor
+      }}
+      nodes {{
+        ...PullRequestFields
+      }}
+    }}
+  }}"""
+
+
+def use_search_source() -> bool:
+    """Whether PRs come from the search API instead of the pullRequests connection."""
+    return PR_SYNC_CONFIG["github_pr_source"] == "search"
+
+
+def build_pr_batch_query(count: int) -> str:
+    """GraphQL document fetching the first PR page of ``count`` repositories under aliases r0..r<count-1>."""
+    if use_search_source():
+        variables = ", ".join(f"$q{index}: String!, $f{index}: Int!" for index in range(count))
+        template = PR_BATCH_SEARCH_TEMPLATE
+    else:
+        variables = ", ".join(f"$o{index}: String!, $n{index}: String!, $f{index}: Int!" for index in range(count))
+        template = PR_BATCH_CONNECTION_TEMPLATE
+    selections = "".join(template.format(index=index) for index in range(count))
+    return (
+        f"query({variables}) {{\n"
+        "  rateLimit {\n    cost\n    remaining\n    resetAt\n  }"
+        f"{selections}\n}}\n"
+    ) + PR_FIELDS_FRAGMENT
+
+
+def build_pr_batch_variables(index: int, repo_data, filter_date, page_size: int) -> Dict[str, Any]:
+    if use_search_source():
+        return {f"q{index}": build_pr_search_query(repo_data, filter_date), f"f{index}": page_size}
+    owner, name = split_full_name(repo_data)
+    return {f"o{index}": owner, f"n{index}": name, f"f{index}": page_size}
+
+
+def load_page_size(self, repo_data) -> AdaptivePageSize:
+    """Page size controller of a repository, starting from the size remembered for it."""
+    remembered = get_page_size_service(self.get_sync_scope(), repo_data.get('codeRepositoryId'))
+    return AdaptivePageSize(
+        remembered or GRAPHQL_PAGE_SIZE_CONFIG["initial"],
+        minimum=GRAPHQL_PAGE_SIZE_CONFIG["minimum"],
+        maximum=GRAPHQL_PAGE_SIZE_CONFIG["maximum"],
+        grow_after=GRAPHQL_PAGE_SIZE_CONFIG["grow_after"],
+    )
+
+
+def build_pr_search_query(repo_data, filter_date) -> str:
+    date_range = f"updated:>{format_utc(filter_date)}" if filter_date else ""
+    repo_query = f"repo:{repo_data.get('fullName')}"
+    return f"{repo_query} is:pr {date_range}".strip()
+
+
+def split_full_name(repo_data):
+    owner, _, name = (repo_data.get('fullName') or "").partition("/")
+    return owner, name
+
+
+def read_pr_connection(result, filter_date):
+    """
+    Nodes and page info of one PR page, with the watermark applied.
+
+    ``result`` is a ``search`` block or a ``repository`` block. The
+    repository connection is ordered by updatedAt, newest first, so the
+    first PR not updated after ``filter_date`` ends the sync: it and
+    everything after it is dropped and ``hasNextPage`` is cleared.
+    """
+    if "pullRequests" in result:
+        result = result.get("pullRequests") or {}
+    nodes = result.get('nodes', [])
+    page_info = dict(result.get('pageInfo', {}))
+    if filter_date is None or use_search_source():
+        return nodes, page_info
+
+    watermark = as_utc(filter_date)
+    for position, pr in enumerate(nodes):
+        if pr.get('updatedAt') and as_utc(parse_iso_date(pr['updatedAt'])) <= watermark:
+            page_info['hasNextPage'] = False
+            return nodes[:position], page_info
+    return nodes, page_info
+
+
+def build_pr_payload(pr, authors: AuthorIndex, repo_data) -> Dict[str, Any]:
+    user_id = authors.resolve((pr.get('author') or {}).get('nodeId'))
+
+    return {
+        "nodeId": pr.get('nodeId'),
+        "number": pr.get('number'),
+        "state": pr.get('state'),
+        "prCreatedAt": pr.get('createdAt'),
+        "prUpdatedAt": pr.get('updatedAt'),
+        "prMergedAt": pr.get('mergedAt'),
+        "prClosedAt": pr.get('closedAt'),
+        "codeRepositoryId": repo_data.get('codeRepositoryId'),
+        "projectId": repo_data.get('projectId'),
+        "userId": user_id,
+        "commits": pr.get('commits', {}).get('totalCount', 0),
+        "additions": pr.get('additions',0),
+        "deletions": pr.get('deletions',0),
+        "changedFiles": pr.get('changedFiles',0)
+    }
+
 
 def get_pr_data_service(self,saved_users,repo_data,filter_date) -> List[Dict[str, Any]]:
+        return [
+            pr
+            for page in iter_pr_data_pages_service(self, saved_users, repo_data, filter_date)
+            for pr in page
+        ]
+
+def iter_pr_data_pages_service(self,saved_users,repo_data,filter_date,after=None) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the PR payloads of a repository one GraphQL page at a time.
+
+        By default PRs are read from the repository's ``pullRequests``
+        connection, newest update first, stopping at the first PR older than
+        ``filter_date``. Unlike search, the connection is not capped at
+        1,000 results. ``PR_SYNC_CONFIG["github_pr_source"] = "search"``
+        restores the search API.
+
+        The page size adapts to the repository: a page that times out or
+        fails with a 5xx is retried from the same cursor at half the size,
+        and the size grows back after successes. The last size is
+        remembered per repository, so heavy repositories start small.
+
+        Args:
+            after: Cursor to continue from (e.g. the ``endCursor`` of a
+                batched first page); None starts at the first page
+        """
         try:
-            date_range = f"updated:>{filter_date.strftime('%Y-%m-%d')}" if filter_date else ""
-            repo_query = f"repo:{repo_data.get('fullName')}"
-            search_query = f"{repo_query} is:pr {date_range}".strip()
-            new_prs = []
+            authors = AuthorIndex.of(saved_users)
+            if use_search_source():
+                query = PR_SEARCH_QUERY
+                variables = {"searchQuery": build_pr_search_query(repo_data, filter_date)}
+                block = 'search'
+            else:
+                owner, name = split_full_name(repo_data)
+                query = PR_CONNECTION_QUERY
+                variables = {"owner": owner, "name": name}
+                block = 'repository'
             has_next_page = True
-            end_cursor = None
-
-            print("-----------------------------------------------------",repo_data)
+            end_cursor = after
+            page_size = load_page_size(self, repo_data)
+            initial_size = page_size.size
 
             while has_next_page:
-                after_clause = f', after: "{end_cursor}"' if end_cursor else ""
-                graphql_query = {
-                    "query": f"""
-                    query {{
-                    search(query: "{search_query}", type: ISSUE, first: 100{after_clause}) {{
-                        pageInfo {{
-                        hasNextPage
-                        endCursor
-                        }}
-                        nodes {{
-                        ... on PullRequest {{
-                            nodeId:id
-                            number
-                            title
-                            state
-                            createdAt
-                            updatedAt
-                            closedAt
-                            mergedAt
-                            additions
-                            deletions
-                            changedFiles
-                            commits {{
-                            totalCount
-                            }}
-                            author {{
-                            login
-                            ... on User {{
-                                nodeId: id
-                            }}
-                            }}
-                            url
-                        }}
-                        }}
-                    }}
-                    }}
-                    """
-                }
-
-                response = requests.post("https://api.github.com/graphql", json=graphql_query, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-
-                pr_nodes = data.get('data', {}).get('search', {}).get('nodes', [])
-                page_info = data.get('data', {}).get('search', {}).get('pageInfo', {})
+                try:
+                    data = run_graphql_query(
+                        self,
+                        query,
+                        {**variables, "after": end_cursor, "first": page_size.size},
+                        f"Pull requests of '{repo_data.get('fullName')}'"
+                    )
+                except (requests.exceptions.Timeout, GitHubServerError):
+                    if not page_size.shrink():
+                        raise
+                    logging.info(
+                        f"PR page of '{repo_data.get('fullName')}' failed; retrying with first: {page_size.size}"
+                    )
+                    save_page_size_service(self.get_sync_scope(), repo_data.get('codeRepositoryId'), page_size.size)
+                    initial_size = page_size.size
+                    continue
+                page_size.record_success()
+
+                result = data.get(block)
+                if result is None:
+                    raise GitHubAPIError(
+                        f"Repository '{repo_data.get('fullName')}' not found",
+                        "Check that the token can access the repository"
+                    )
+                pr_nodes, page_info = read_pr_connection(result, filter_date)
                 has_next_page = page_info.get('hasNextPage', False)
                 end_cursor = page_info.get('endCursor')
 
-                for pr in pr_nodes:
-                    github_user_node_id = pr.get('author', {}).get('nodeId')
-                    user_id = None
-                   
-                    for user in saved_users:
-                        if user.get('nodeId') == hash_id(github_user_node_id):
-                            user_id = user.get('userId')
-                            break
-
-                    new_prs.append({
-                        "nodeId": pr.get('nodeId'),
-                        "number": pr.get('number'),
-                        "state": pr.get('state'),
-                        "prCreatedAt": pr.get('createdAt'),
-                        "prUpdatedAt": pr.get('updatedAt'),
-                        "prMergedAt": pr.get('mergedAt'),
-                        "prClosedAt": pr.get('closedAt'),
-                        "codeRepositoryId": repo_data.get('codeRepositoryId'),
-                        "projectId": repo_data.get('projectId'),
-                        "userId": user_id,
-                        "commits": pr.get('commits', {}).get('totalCount', 0),
-                        "additions": pr.get('additions',0),
-                        "deletions": pr.get('deletions',0),
-                        "changedFiles": pr.get('changedFiles',0)
-                    }) 
-            return new_prs
+                if page_size.size != initial_size:
+                    save_page_size_service(self.get_sync_scope(), repo_data.get('codeRepositoryId'), page_size.size)
+                    initial_size = page_size.size
+
+                yield Page(
+                    (build_pr_payload(pr, authors, repo_data) for pr in pr_nodes),
+                    cursor=end_cursor if has_next_page else None
+                )
                 
         except requests.exceptions.RequestException as e:
             raise GitHubAPIError(
                 "Failed to connect to GitHub API",
                 str(e)
             )        
-        
\ No newline at end of file
+
+def batch_page_size(self, repo_data, filter_date) -> AdaptivePageSize:
+    """Page size of a repository's batched first page.
+
+    A repository with a watermark only needs its newest few PRs to see
+    whether anything changed, so it asks for
+    ``GRAPHQL_PAGE_SIZE_CONFIG["incremental_first_page"]``; the follow-up
+    pages use the repository's own size.
+    """
+    page_size = load_page_size(self, repo_data)
+    if filter_date is not None:
+        page_size.size = max(page_size.minimum, min(page_size.size, GRAPHQL_PAGE_SIZE_CONFIG["incremental_first_page"]))
+    return page_size
+
+
+def fetch_first_pr_page_batch(self, authors, batch) -> Dict[Any, Dict[str, Any]]:
+    """
+    First PR pages of one batch of repositories, from one GraphQL document.
+
+    Like ``iter_pr_data_pages_service``, a batch that times out or fails
+    with a 5xx is retried with every repository's ``first`` halved. Once no
+    size can shrink further the error is raised.
+    """
+    page_sizes = [batch_page_size(self, repo_data, filter_date) for repo_data, filter_date in batch]
+    while True:
+        try:
+            data = run_graphql_query(
+                self,
+                build_pr_batch_query(len(batch)),
+                {
+                    name: value
+                    for index, ((repo_data, filter_date), page_size) in enumerate(zip(batch, page_sizes))
+                    for name, value in build_pr_batch_variables(
+                        index, repo_data, filter_date, page_size.size
+                    ).items()
+                },
+                f"Pull requests of {len(batch)} repositories",
+                timeout=30
+            )
+            break
+        except (requests.exceptions.Timeout, GitHubServerError):
+            shrunk = [page_size.shrink() for page_size in page_sizes]
+            if not any(shrunk):
+                raise
+            logging.info(
+                f"Batched PR query of {len(batch)} repositories failed; retrying with "
+                f"first: {max(page_size.size for page_size in page_sizes)}"
+            )
+
+    first_pages = {}
+    for index, (repo_data, filter_date) in enumerate(batch):
+        result = data.get(f"r{index}")
+        if result is None:
+            continue
+        pr_nodes, page_info = read_pr_connection(result, filter_date)
+        first_pages[repo_data.get('codeRepositoryId')] = {
+            "prs": [
+                build_pr_payload(pr, authors, repo_data)
+                for pr in pr_nodes
+            ],
+            "hasNextPage": page_info.get('hasNextPage', False),
+            "endCursor": page_info.get('endCursor'),
+        }
+    return first_pages
+
+
+def get_first_pr_pages_service(self,saved_users,repo_requests,batch_size) -> Dict[Any, Dict[str, Any]]:
+        """
+        Fetch the first PR page of many repositories with few GraphQL requests.
+
+        Up to ``batch_size`` repository queries are packed into one GraphQL
+        document under aliases. Quiet repositories are then complete after a
+        single shared request; only those reporting ``hasNextPage`` need
+        follow-up pages through ``iter_pr_data_pages_service(after=...)``.
+        A batch that still fails after shrinking is logged and skipped, so
+        only its repositories fall back to paging on their own.
+
+        Args:
+            saved_users: Saved users or an AuthorIndex, used to resolve PR authors
+            repo_requests: (repo_data, filter_date) pairs
+            batch_size: Repositories per GraphQL document
+
+        Returns:
+            Dict keyed by codeRepositoryId with ``prs`` (first page payloads),
+            ``hasNextPage`` and ``endCursor``. Repositories whose alias
+            came back null (e.g. the repository was not found) or whose
+            batch failed are left out.
+        """
+        first_pages = {}
+        authors = AuthorIndex.of(saved_users)
+        for start in range(0, len(repo_requests), batch_size):
+            batch = repo_requests[start:start + batch_size]
+            try:
+                first_pages.update(fetch_first_pr_page_batch(self, authors, batch))
+            except Exception:
+                logging.warning(
+                    f"Batched PR query of {len(batch)} repositories failed; they will be synced one by one",
+                    exc_info=True
+                )
+        return first_pages
@@ -3,19 +3,18 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 from config.api_config import GITHUB_API
 from utils.errors import handle_github_error,GitHubAPIError
+from utils.pagination import paginate_github
 
 def get_repository_data_service(self,org_name: str) -> List[Dict[str, Any]]:
         try:
             print("---------",self)
-            response = requests.get(
+            repos = paginate_github(
+                    self.transport,
                     GITHUB_API["get_org_repos"](org_name),
-                    headers=self.headers,
+                    self.headers,
+                    f"Organization '{org_name}'",
                     timeout=100
                 )
-            if response.status_code != 200:
-                handle_github_error(response, f"Organization '{org_name}'")
-
-            repos = response.json()
             
             # Transform the repository data to include only the required fields
             transformed_repos = [
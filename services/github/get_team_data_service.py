@@ -3,19 +3,18 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 from config.api_config import GITHUB_API
 from utils.errors import handle_github_error,GitHubAPIError
+from utils.pagination import paginate_github
 
 def get_team_data_service(self,org_name: str) -> Dict[str, Any]:
         try:
-            response = requests.get(
+            teams_response = paginate_github(
+                self.transport,
                 GITHUB_API["get_org_teams"](org_name),
-                headers=self.headers,
-                timeout=10
-            ) 
-            if response.status_code != 200:
-                handle_github_error(response, f"Organization '{org_name}'")
+                self.headers,
+                f"Organization '{org_name}'"
+            )
 
             teams = []
-            teams_response=response.json()
 
             for team in teams_response:
                 team_data = {
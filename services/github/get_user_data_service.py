@@ -1,28 +1,74 @@
 import requests
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
-from config.api_config import GITHUB_API
-from utils.errors import handle_github_error,GitHubAPIError
+from utils.errors import GitHubAPIError, GitHubNotFoundError
 from utils.hash import hash_id
+from services.github.graphql_query_service import run_graphql_query
+
+MEMBERS_PAGE_SIZE = 100
+
+ORG_MEMBERS_QUERY = """
+query($org: String!, $first: Int!, $after: String) {
+  rateLimit {
+    cost
+    remaining
+    resetAt
+  }
+  organization(login: $org) {
+    membersWithRole(first: $first, after: $after) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        login
+        id
+        avatarUrl
+        name
+        createdAt
+        updatedAt
+      }
+    }
+  }
+}
+"""
 
 def get_user_data_service(self,org_name: str) -> Dict[str, Any]:
+        """
+        Fetch organization members with their profile details.
+
+        Members are hydrated 100 at a time through the GraphQL
+        ``organization.membersWithRole`` connection instead of one REST
+        ``/users/{username}`` request per member.
+        """
         try:
-            print(self.headers)
-            response = requests.get(
-                        GITHUB_API["get_org_members"](org_name),
-                        headers=self.headers,
-                        timeout=10
+            users=[]
+            has_next_page = True
+            end_cursor = None
+
+            while has_next_page:
+                data = run_graphql_query(
+                    self,
+                    ORG_MEMBERS_QUERY,
+                    {"org": org_name, "first": MEMBERS_PAGE_SIZE, "after": end_cursor},
+                    f"Organization '{org_name}'"
+                )
+                organization = data.get("organization")
+                if not organization:
+                    raise GitHubNotFoundError(
+                        f"Resource not found: Organization '{org_name}'",
+                        "Please check if the resource exists and you have access to it"
                     )
-            if response.status_code != 200:
-                handle_github_error(response, f"Organization '{org_name}'")
 
-            users=[]
-            users_logins = [member["login"] for member in response.json()]
-            for username in users_logins:
-                user_details = get_github_user_details(self,username)
-                if user_details:
-                    users.append(user_details)
-               
+                members = organization.get("membersWithRole", {})
+                for member in members.get("nodes", []):
+                    if member:
+                        users.append(build_user_payload(member))
+
+                page_info = members.get("pageInfo", {})
+                has_next_page = page_info.get("hasNextPage", False)
+                end_cursor = page_info.get("endCursor")
+
             return users        
            
         except requests.exceptions.RequestException as e:
@@ -31,24 +77,13 @@ def get_user_data_service(self,org_name: str) -> Dict[str, Any]:
                 str(e)
             )        
         
-def get_github_user_details(self,username):
-        """Fetch detailed user info from GitHub"""
-        try:
-            response = requests.get(
-                GITHUB_API["get_user_details"](username),
-                headers=self.headers,
-                timeout=10
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            return {
-                "userName": data.get("login"),
-                "nodeId": hash_id(data.get("node_id")),
-                "avatarUrl": data.get("avatar_url"),
-                "displayName": data.get("name") or data.get("login"),
-                "userCreatedAt": data.get("created_at"),
-                "userUpdatedAt": data.get("updated_at")
-            }
-        except Exception:
-            return None 
\ No newline at end of file
+def build_user_payload(member):
+        """Map a GraphQL User node to the standardized user payload"""
+        return {
+            "userName": member.get("login"),
+            "nodeId": hash_id(member.get("id")),
+            "avatarUrl": member.get("avatarUrl"),
+            "displayName": member.get("name") or member.get("login"),
+            "userCreatedAt": member.get("createdAt"),
+            "userUpdatedAt": member.get("updatedAt")
+        }
@@ -0,0 +1,69 @@
+from typing import Dict, Any, Optional
+from config.api_config import GITHUB_API, RATE_LIMIT_CONFIG
+from utils.errors import handle_github_error, GitHubAPIError, GitHubRateLimitError, GitHubServerError
+
+
+def run_graphql_query(self, query: str, variables: Optional[Dict[str, Any]] = None,
+                      context: str = "GraphQL query", timeout: int = 10) -> Dict[str, Any]:
+        """
+        Execute a GitHub GraphQL query and return its ``data`` block.
+
+        Queries that select ``rateLimit { cost remaining resetAt }`` feed
+        that block to the provider's rate limit governor. A query GitHub
+        answers with a ``RATE_LIMITED`` error blocks the governor's GraphQL
+        budget until its reset and is retried, up to
+        ``RATE_LIMIT_CONFIG["max_rate_limit_waits"]`` times.
+
+        Args:
+            query: GraphQL document
+            variables: Variables referenced by the document
+            context: Description of the operation, used in error messages
+            timeout: Request timeout in seconds
+
+        Returns:
+            The ``data`` object of the GraphQL response
+
+        Raises:
+            GitHubRateLimitError: If the query is still rate limited after every wait
+            GitHubServerError: On a 5xx response or a query GitHub timed out
+            GitHubAPIError: If the response carries GraphQL errors
+            requests.exceptions.RequestException: If the request fails
+        """
+        rate_limit_waits = 0
+        while True:
+            response = self.transport.post(
+                GITHUB_API["graphql"],
+                json={"query": query, "variables": variables or {}},
+                headers=self.headers,
+                timeout=timeout
+            )
+            if response.status_code != 200:
+                handle_github_error(response, context)
+
+            body = response.json()
+            errors = body.get("errors")
+            if not errors or not any(error.get("type") == "RATE_LIMITED" for error in errors):
+                break
+            if rate_limit_waits >= RATE_LIMIT_CONFIG["max_rate_limit_waits"]:
+                raise GitHubRateLimitError(
+                    "GitHub API rate limit exceeded",
+                    "Please try again later or use a different token"
+                )
+            # The transport's governor holds the retry until the budget resets
+            self.rate_limiter.block_graphql((body.get("data") or {}).get("rateLimit"), response)
+            rate_limit_waits += 1
+
+        if errors:
+            if not body.get("data"):
+                message = errors[0].get('message', 'Unknown error')
+                if "timeout" in message.lower() or "timed out" in message.lower():
+                    raise GitHubServerError(f"GitHub GraphQL query timed out: {message}", context)
+                raise GitHubAPIError(
+                    f"GitHub GraphQL error: {message}",
+                    context
+                )
+
+        data = body.get("data") or {}
+        if data.get("rateLimit"):
+            self.rate_limiter.update_from_graphql(data["rateLimit"], response)
+        return data
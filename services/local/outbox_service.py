@@ -0,0 +1,187 @@
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
+from utils.local_store import get_local_store
+
+OUTBOX_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS backend_outbox (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        idempotency_key TEXT NOT NULL UNIQUE,
+        endpoint TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'pending',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        next_attempt_at REAL NOT NULL,
+        last_error TEXT,
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS backend_outbox_due ON backend_outbox (status, next_attempt_at)",
+    """
+    CREATE TABLE IF NOT EXISTS backend_outbox_records (
+        entry_id INTEGER NOT NULL,
+        endpoint TEXT NOT NULL,
+        record_key TEXT NOT NULL,
+        PRIMARY KEY (entry_id, record_key)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS backend_outbox_records_key ON backend_outbox_records (endpoint, record_key)",
+]
+
+# Entry statuses:
+#   inflight    written before its first attempt; the inline save is sending it
+#   pending     handed to the drainer after the inline attempts failed
+#   replaying   being sent by the drainer
+#   delivered   accepted by the backend
+#   superseded  every record in it was written again by a newer entry
+#   failed      rejected by the backend; kept for inspection, not replayed
+LIVE_STATUSES = ("inflight", "pending", "replaying", "delivered")
+TERMINAL_STATUSES = ("delivered", "superseded")
+
+
+def _store():
+    store = get_local_store()
+    store.ensure_schema("backend_outbox", OUTBOX_SCHEMA)
+    return store
+
+
+def append_outbox_entry_service(endpoint: str, payload: Any, idempotency_key: str,
+                                record_keys: Iterable[str]) -> int:
+    """
+    Append a backend write before its first attempt (status ``inflight``).
+
+    Args:
+        endpoint: Name the write's sender is registered under, e.g. ``"users"``
+        payload: JSON-serialisable request body
+        idempotency_key: Unique key of this write, sent with every attempt and replay
+        record_keys: Keys of the records the payload writes
+
+    Returns:
+        The entry id; later entries have larger ids
+    """
+    with _store().transaction() as connection:
+        entry_id = connection.execute(
+            "INSERT INTO backend_outbox (idempotency_key, endpoint, payload, status, next_attempt_at) "
+            "VALUES (?, ?, ?, 'inflight', ?)",
+            (idempotency_key, endpoint, json.dumps(payload), time.time())
+        ).lastrowid
+        connection.executemany(
+            "INSERT OR IGNORE INTO backend_outbox_records (entry_id, endpoint, record_key) VALUES (?, ?, ?)",
+            [(entry_id, endpoint, record_key) for record_key in record_keys]
+        )
+    return entry_id
+
+
+def set_outbox_entry_status_service(entry_id: int, status: str, error: Optional[str] = None):
+    """Move an entry to ``status``, counting the attempt when it failed."""
+    _store().execute(
+        "UPDATE backend_outbox SET status = ?, last_error = COALESCE(?, last_error), "
+        "attempts = attempts + (CASE WHEN ? IS NULL THEN 0 ELSE 1 END) WHERE id = ?",
+        (status, error, error, entry_id)
+    )
+
+
+def recover_inflight_outbox_entries_service() -> int:
+    """Hand writes left in flight by a previous run (e.g. a crash) to the drainer."""
+    return _store().execute(
+        "UPDATE backend_outbox SET status = 'pending', next_attempt_at = ? WHERE status IN ('inflight', 'replaying')",
+        (time.time(),)
+    )
+
+
+def get_due_outbox_entries_service(limit: int) -> List[Dict[str, Any]]:
+    """Pending writes whose next attempt is due, oldest first."""
+    rows = _store().fetchall(
+        "SELECT id, idempotency_key, endpoint, payload, attempts FROM backend_outbox "
+        "WHERE status = 'pending' AND next_attempt_at <= ? ORDER BY id LIMIT ?",
+        (time.time(), limit)
+    )
+    return [
+        {
+            "id": row["id"],
+            "idempotencyKey": row["idempotency_key"],
+            "endpoint": row["endpoint"],
+            "payload": json.loads(row["payload"]),
+            "attempts": row["attempts"],
+        }
+        for row in rows
+    ]
+
+
+def get_outbox_record_keys_service(entry_id: int) -> Set[str]:
+    rows = _store().fetchall("SELECT record_key FROM backend_outbox_records WHERE entry_id = ?", (entry_id,))
+    return {row["record_key"] for row in rows}
+
+
+def get_superseded_record_keys_service(entry_id: int) -> Set[str]:
+    """Record keys of an entry that a newer, not failed entry of the same endpoint also writes."""
+    rows = _store().fetchall(
+        "SELECT DISTINCT own.record_key FROM backend_outbox_records own "
+        "JOIN backend_outbox_records newer "
+        "ON newer.endpoint = own.endpoint AND newer.record_key = own.record_key AND newer.entry_id > own.entry_id "
+        "JOIN backend_outbox entry ON entry.id = newer.entry_id "
+        f"WHERE own.entry_id = ? AND entry.status IN ({', '.join('?' * len(LIVE_STATUSES))})",
+        (entry_id, *LIVE_STATUSES)
+    )
+    return {row["record_key"] for row in rows}
+
+
+def claim_outbox_entry_service(entry_id: int) -> bool:
+    """Mark a pending entry as being replayed; False if something else changed it first."""
+    return _store().execute(
+        "UPDATE backend_outbox SET status = 'replaying' WHERE id = ? AND status = 'pending'",
+        (entry_id,)
+    ) > 0
+
+
+def replace_outbox_payload_service(entry_id: int, payload: Any, record_keys: Iterable[str]):
+    """Narrow an entry to the records still its own after newer writes superseded the rest."""
+    record_keys = list(record_keys)
+    with _store().transaction() as connection:
+        connection.execute("UPDATE backend_outbox SET payload = ? WHERE id = ?", (json.dumps(payload), entry_id))
+        connection.execute(
+            f"DELETE FROM backend_outbox_records WHERE entry_id = ? "
+            f"AND record_key NOT IN ({', '.join('?' * len(record_keys))})",
+            (entry_id, *record_keys)
+        )
+
+
+def reschedule_outbox_entry_service(entry_id: int, delay: float, error: str):
+    """Count a failed delivery and make the entry pending again ``delay`` seconds from now."""
+    _store().execute(
+        "UPDATE backend_outbox SET status = 'pending', attempts = attempts + 1, next_attempt_at = ?, "
+        "last_error = ? WHERE id = ?",
+        (time.time() + delay, error, entry_id)
+    )
+
+
+def prune_outbox_service(retention_days: float) -> int:
+    """
+    Delete delivered and superseded entries older than ``retention_days``.
+
+    Only entries older than every entry still in flight or pending are
+    deleted, since those may need them to tell which of their records are
+    superseded. Failed entries are kept.
+    """
+    with _store().transaction() as connection:
+        oldest_open = connection.execute(
+            "SELECT MIN(id) FROM backend_outbox WHERE status IN ('inflight', 'pending', 'replaying')"
+        ).fetchone()[0]
+        stale_ids = [
+            row[0] for row in connection.execute(
+                f"SELECT id FROM backend_outbox WHERE status IN ({', '.join('?' * len(TERMINAL_STATUSES))}) "
+                "AND created_at <= datetime('now', ?) AND id < ?",
+                (*TERMINAL_STATUSES, f"-{retention_days} days", oldest_open if oldest_open is not None else 2 ** 62)
+            )
+        ]
+        for entry_id in stale_ids:
+            connection.execute("DELETE FROM backend_outbox_records WHERE entry_id = ?", (entry_id,))
+            connection.execute("DELETE FROM backend_outbox WHERE id = ?", (entry_id,))
+    return len(stale_ids)
+
+
+def count_outbox_entries_service() -> Dict[str, int]:
+    """Number of entries per status."""
+    rows = _store().fetchall("SELECT status, COUNT(*) AS count FROM backend_outbox GROUP BY status")
+    return {row["status"]: row["count"] for row in rows}
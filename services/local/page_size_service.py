@@ -0,0 +1,33 @@
+from typing import Optional
+from utils.local_store import get_local_store
+
+PAGE_SIZE_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS graphql_page_sizes (
+        scope TEXT NOT NULL,
+        repository_id TEXT NOT NULL,
+        page_size INTEGER NOT NULL,
+        PRIMARY KEY (scope, repository_id)
+    )
+    """,
+]
+
+
+def get_page_size_service(scope: str, repository_id) -> Optional[int]:
+    """Last page size that worked for a repository, or None if it was never adjusted."""
+    store = get_local_store()
+    store.ensure_schema("graphql_page_sizes", PAGE_SIZE_SCHEMA)
+    row = store.fetchone(
+        "SELECT page_size FROM graphql_page_sizes WHERE scope = ? AND repository_id = ?",
+        (scope, str(repository_id))
+    )
+    return row["page_size"] if row else None
+
+
+def save_page_size_service(scope: str, repository_id, page_size: int):
+    store = get_local_store()
+    store.ensure_schema("graphql_page_sizes", PAGE_SIZE_SCHEMA)
+    store.execute(
+        "INSERT OR REPLACE INTO graphql_page_sizes (scope, repository_id, page_size) VALUES (?, ?, ?)",
+        (scope, str(repository_id), page_size)
+    )
@@ -0,0 +1,48 @@
+from typing import Dict, Iterable, Tuple
+from utils.local_store import get_local_store
+
+RECORD_HASH_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS record_hashes (
+        project_id TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        node_id TEXT NOT NULL,
+        content_hash TEXT NOT NULL,
+        saved_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (project_id, kind, node_id)
+    )
+    """,
+]
+
+
+def get_record_hashes_service(project_id, kind: str) -> Dict[str, str]:
+    """
+    Load the content hash of every record of one kind last saved to a project.
+
+    Args:
+        project_id: Backend projectId
+        kind: Record kind, e.g. ``"users"``
+
+    Returns:
+        Dict of nodeId to content hash
+    """
+    store = get_local_store()
+    store.ensure_schema("record_hashes", RECORD_HASH_SCHEMA)
+    rows = store.fetchall(
+        "SELECT node_id, content_hash FROM record_hashes WHERE project_id = ? AND kind = ?",
+        (str(project_id), kind)
+    )
+    return {row["node_id"]: row["content_hash"] for row in rows}
+
+
+def save_record_hashes_service(project_id, kind: str, hashes: Iterable[Tuple[str, str]]):
+    """Record the content hashes of saved records, given as (nodeId, hash) pairs."""
+    store = get_local_store()
+    store.ensure_schema("record_hashes", RECORD_HASH_SCHEMA)
+    store.executemany(
+        "INSERT INTO record_hashes (project_id, kind, node_id, content_hash, saved_at) "
+        "VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP) "
+        "ON CONFLICT (project_id, kind, node_id) DO UPDATE SET "
+        "content_hash = excluded.content_hash, saved_at = excluded.saved_at",
+        [(str(project_id), kind, node_id, content_hash) for node_id, content_hash in hashes]
+    )
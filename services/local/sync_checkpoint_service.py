@@ -0,0 +1,119 @@
+import json
+from typing import Any, Dict, List, Optional
+from utils.local_store import get_local_store
+
+CHECKPOINT_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS pr_sync_checkpoints (
+        scope TEXT NOT NULL,
+        repository_id TEXT NOT NULL,
+        filter_date TEXT,
+        cursor TEXT,
+        pages INTEGER NOT NULL DEFAULT 0,
+        prs INTEGER NOT NULL DEFAULT 0,
+        high_water TEXT,
+        updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (scope, repository_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS pr_sync_checkpoint_prs (
+        scope TEXT NOT NULL,
+        repository_id TEXT NOT NULL,
+        node_id TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        saved INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (scope, repository_id, node_id)
+    )
+    """,
+]
+
+
+def _store():
+    store = get_local_store()
+    store.ensure_schema("pr_sync_checkpoints", CHECKPOINT_SCHEMA)
+    return store
+
+
+def load_checkpoint_service(scope: str, repository_id) -> Optional[Dict[str, Any]]:
+    """
+    Load the checkpoint of an interrupted PR sync.
+
+    Returns:
+        Dict with ``filterDate`` and ``highWater`` (ISO 8601 or None),
+        ``cursor`` (after the last completed page), ``pages`` and ``prs``,
+        or None if the repository has no unfinished sync
+    """
+    row = _store().fetchone(
+        "SELECT filter_date, cursor, pages, prs, high_water FROM pr_sync_checkpoints "
+        "WHERE scope = ? AND repository_id = ?",
+        (scope, str(repository_id))
+    )
+    if row is None:
+        return None
+    return {
+        "filterDate": row["filter_date"],
+        "cursor": row["cursor"],
+        "pages": row["pages"],
+        "prs": row["prs"],
+        "highWater": row["high_water"],
+    }
+
+
+def start_checkpoint_service(scope: str, repository_id, filter_date: Optional[str]):
+    """Begin a fresh checkpoint, discarding any previous one of the repository."""
+    with _store().transaction() as connection:
+        connection.execute(
+            "DELETE FROM pr_sync_checkpoint_prs WHERE scope = ? AND repository_id = ?",
+            (scope, str(repository_id))
+        )
+        connection.execute(
+            "INSERT OR REPLACE INTO pr_sync_checkpoints (scope, repository_id, filter_date) VALUES (?, ?, ?)",
+            (scope, str(repository_id), filter_date)
+        )
+
+
+def save_page_checkpoint_service(scope: str, repository_id, cursor: Optional[str],
+                                 payloads: List[Dict[str, Any]], high_water: Optional[str]):
+    """Record a completed page: its PRs (as not yet saved) and the cursor after it, atomically."""
+    with _store().transaction() as connection:
+        connection.executemany(
+            "INSERT OR REPLACE INTO pr_sync_checkpoint_prs (scope, repository_id, node_id, payload, saved) "
+            "VALUES (?, ?, ?, ?, 0)",
+            [(scope, str(repository_id), str(pr["nodeId"]), json.dumps(pr)) for pr in payloads]
+        )
+        connection.execute(
+            "UPDATE pr_sync_checkpoints SET cursor = ?, pages = pages + 1, prs = prs + ?, "
+            "high_water = ?, updated_at = CURRENT_TIMESTAMP WHERE scope = ? AND repository_id = ?",
+            (cursor, len(payloads), high_water, scope, str(repository_id))
+        )
+
+
+def mark_prs_saved_service(scope: str, repository_id, node_ids: List[str]):
+    """Flag checkpointed PRs as saved to the backend, so a resume does not send them again."""
+    _store().executemany(
+        "UPDATE pr_sync_checkpoint_prs SET saved = 1 WHERE scope = ? AND repository_id = ? AND node_id = ?",
+        [(scope, str(repository_id), str(node_id)) for node_id in node_ids]
+    )
+
+
+def get_unsaved_prs_service(scope: str, repository_id) -> List[Dict[str, Any]]:
+    """Checkpointed PRs that were emitted but not confirmed saved."""
+    rows = _store().fetchall(
+        "SELECT payload FROM pr_sync_checkpoint_prs WHERE scope = ? AND repository_id = ? AND saved = 0",
+        (scope, str(repository_id))
+    )
+    return [json.loads(row["payload"]) for row in rows]
+
+
+def clear_checkpoint_service(scope: str, repository_id):
+    """Drop the checkpoint of a sync that finished with every PR saved."""
+    with _store().transaction() as connection:
+        connection.execute(
+            "DELETE FROM pr_sync_checkpoint_prs WHERE scope = ? AND repository_id = ?",
+            (scope, str(repository_id))
+        )
+        connection.execute(
+            "DELETE FROM pr_sync_checkpoints WHERE scope = ? AND repository_id = ?",
+            (scope, str(repository_id))
+        )
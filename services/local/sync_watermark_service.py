@@ -0,0 +1,51 @@
+from typing import Any, Dict, Optional
+from utils.local_store import get_local_store
+
+WATERMARK_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS sync_watermarks (
+        scope TEXT NOT NULL,
+        repository_id TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        cursor TEXT,
+        synced_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (scope, repository_id)
+    )
+    """,
+]
+
+
+def get_sync_watermark_service(scope: str, repository_id) -> Optional[Dict[str, Any]]:
+    """
+    Load the high-water mark of a repository's last successful PR sync.
+
+    Args:
+        scope: Provider type and organization, e.g. ``"github:my-org"``
+        repository_id: Backend codeRepositoryId
+
+    Returns:
+        Dict with ``updatedAt`` (ISO 8601) and ``cursor``, or None if the
+        repository has never been synced from this machine
+    """
+    store = get_local_store()
+    store.ensure_schema("sync_watermarks", WATERMARK_SCHEMA)
+    row = store.fetchone(
+        "SELECT updated_at, cursor FROM sync_watermarks WHERE scope = ? AND repository_id = ?",
+        (scope, str(repository_id))
+    )
+    if row is None:
+        return None
+    return {"updatedAt": row["updated_at"], "cursor": row["cursor"]}
+
+
+def save_sync_watermark_service(scope: str, repository_id, updated_at: str, cursor: Optional[str] = None):
+    """Record the high-water mark of a successful PR sync (call only once every PR is saved)."""
+    store = get_local_store()
+    store.ensure_schema("sync_watermarks", WATERMARK_SCHEMA)
+    store.execute(
+        "INSERT INTO sync_watermarks (scope, repository_id, updated_at, cursor, synced_at) "
+        "VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP) "
+        "ON CONFLICT (scope, repository_id) DO UPDATE SET "
+        "updated_at = excluded.updated_at, cursor = excluded.cursor, synced_at = excluded.synced_at",
+        (scope, str(repository_id), updated_at, cursor)
+    )
@@ -5,11 +5,15 @@ from PyQt6.QtWidgets import (
     QComboBox,
     QPushButton,
     QProgressBar,
+    QTableWidget,
+    QHeaderView,
 )
 from PyQt6.QtCore import Qt
 from presenters.pull_request_presenter import (
     fetch_and_save_new_pull_requests,
     fetch_last_pull_request,
+    sync_all_repositories,
+    PR_SYNC_COLUMNS,
 )
 from presenters.common.on_tab_change_presenter import on_tab_changed
 
@@ -39,6 +43,10 @@ def setup_pull_request_tab(parent):
     parent.last_pr_label = QLabel("Last PR Created: Not fetched")
     main_layout.addWidget(parent.last_pr_label)
 
+    # Remaining provider API budget
+    parent.rate_limit_label = QLabel("API Budget: Not fetched")
+    main_layout.addWidget(parent.rate_limit_label)
+
     # Fetch pull requests button
     parent.fetch_prs_btn = QPushButton("Fetch and Save New Pull Requests")
     parent.fetch_prs_btn.clicked.connect(
@@ -47,6 +55,22 @@ def setup_pull_request_tab(parent):
     parent.fetch_prs_btn.setEnabled(False)
     main_layout.addWidget(parent.fetch_prs_btn)
 
+    # Bulk sync of every saved repository
+    parent.sync_all_prs_btn = QPushButton("Sync All Repositories")
+    parent.sync_all_prs_btn.clicked.connect(lambda: sync_all_repositories(parent))
+    parent.sync_all_prs_btn.setEnabled(False)
+    main_layout.addWidget(parent.sync_all_prs_btn)
+
+    parent.pr_sync_table = QTableWidget(0, len(PR_SYNC_COLUMNS))
+    parent.pr_sync_table.setHorizontalHeaderLabels(PR_SYNC_COLUMNS)
+    parent.pr_sync_table.horizontalHeader().setSectionResizeMode(
+        0, QHeaderView.ResizeMode.Stretch
+    )
+    parent.pr_sync_table.verticalHeader().setVisible(False)
+    parent.pr_sync_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+    parent.pr_sync_table.setVisible(False)
+    main_layout.addWidget(parent.pr_sync_table)
+
     # Loading indicator
     parent.pr_progress_bar = QProgressBar()
     parent.pr_progress_bar.setVisible(False)
@@ -0,0 +1,60 @@
+import pytest
+import requests
+
+import models.user_model as user_model
+import utils.local_store as local_store
+from config.api_config import BULK_SAVE_CONFIG
+from utils.read_cache import backend_read_cache
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+class FakeUserBackend:
+    """Stands in for the users endpoints.
+
+    It can go down (``down``), lose records behind the client's back (edit
+    ``users``), and records every write it accepts.
+    """
+
+    def __init__(self):
+        self.down = False
+        self.users = {}
+        self.accepted = []
+        self.on_save = None
+
+    @property
+    def posted(self):
+        """nodeIds of every accepted write, in order."""
+        return [[user["nodeId"] for user in users] for _, users in self.accepted]
+
+    def get(self, project_id):
+        return FakeResponse({"success": True, "data": list(self.users.values())})
+
+    def save(self, payload, idempotency_key=None):
+        if self.on_save:
+            self.on_save(payload, idempotency_key)
+        if self.down:
+            raise requests.exceptions.ConnectionError("backend refused the connection")
+        self.accepted.append((idempotency_key, [dict(user) for user in payload["users"]]))
+        for user in payload["users"]:
+            self.users[user["nodeId"]] = user
+        return FakeResponse({"success": True})
+
+
+@pytest.fixture
+def user_backend(tmp_path, monkeypatch):
+    """A FakeUserBackend behind models.user_model, with a fresh local store and no save retries."""
+    monkeypatch.setattr(local_store, "_store", local_store.LocalStore(str(tmp_path / "collector.db")))
+    monkeypatch.setitem(BULK_SAVE_CONFIG, "max_attempts", 1)
+    backend_read_cache.clear()
+    fake = FakeUserBackend()
+    monkeypatch.setattr(user_model, "get_user_data_service", fake.get)
+    monkeypatch.setattr(user_model, "save_user_data_service", fake.save)
+    yield fake
+    backend_read_cache.clear()
@@ -0,0 +1,68 @@
+import pytest
+
+import services.azure_devops.get_pr_enrichment_service as enrichment
+import utils.local_store as local_store
+from config.api_config import AZURE_ENRICHMENT_CONFIG
+from providers.azure_devops_provider import AzureDevOpsProvider
+
+REPO = {"nodeId": "repo-guid", "fullName": "acme/web"}
+STATS = {"commits": 3, "additions": 40, "deletions": 2, "changedFiles": 5}
+
+
+def pr(number):
+    return {"nodeId": str(number), "number": number, "commits": 0, "additions": 0, "deletions": 0, "changedFiles": 0}
+
+
+@pytest.fixture
+def provider(tmp_path, monkeypatch):
+    monkeypatch.setattr(local_store, "_store", local_store.LocalStore(str(tmp_path / "collector.db")))
+    provider = AzureDevOpsProvider("acme/web", "token")
+    yield provider
+    provider.enrichment_executor.shutdown()
+
+
+@pytest.fixture
+def stats_api(monkeypatch):
+    """PR stats endpoint; PR numbers in ``failing`` fail as if throttled."""
+    failing = set()
+
+    def get_pr_stats(provider, organization, project, repository_id, pr_id):
+        if pr_id in failing:
+            raise RuntimeError("429 Too Many Requests")
+        return dict(STATS)
+
+    monkeypatch.setattr(enrichment, "get_pr_stats_service", get_pr_stats)
+    return failing
+
+
+def test_failed_enrichment_is_retried_on_the_next_sync(provider, stats_api):
+    stats_api.add(2)
+    page = [(pr(1), "c1"), (pr(2), "c2")]
+
+    enrichment.enrich_pr_page_service(provider, REPO, "acme", "web", page)
+    assert page[1][0]["commits"] == 0
+
+    stats_api.clear()
+    retried = enrichment.retry_failed_enrichments_service(provider, REPO, "acme", "web")
+
+    assert retried == [{**pr(2), **STATS}]
+    assert enrichment.retry_failed_enrichments_service(provider, REPO, "acme", "web") == []
+
+
+def test_enrichment_that_keeps_failing_is_given_up(provider, stats_api, monkeypatch):
+    monkeypatch.setitem(AZURE_ENRICHMENT_CONFIG, "max_retry_attempts", 2)
+    stats_api.add(7)
+    enrichment.enrich_pr_page_service(provider, REPO, "acme", "web", [(pr(7), "c7")])
+
+    assert enrichment.retry_failed_enrichments_service(provider, REPO, "acme", "web") == []
+    assert enrichment.retry_failed_enrichments_service(provider, REPO, "acme", "web") == []
+    assert local_store.get_local_store().fetchall("SELECT * FROM azure_pr_enrichment_retry") == []
+
+
+def test_enrichment_retries_do_not_spend_the_listing_budget(provider):
+    provider.begin_sync()
+    while provider.enrichment_retry_budget.try_consume():
+        pass
+
+    assert provider.retry_budget.remaining == provider.retry_budget.max_retries
+    assert provider.enrichment_transport.retry_policy.budget is provider.enrichment_retry_budget
@@ -0,0 +1,136 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import utils.body_encoding as body_encoding
+from config.api_config import BACKEND_BODY_CONFIG
+from services.backend.backend_transport import backend_transport, backend_write_body
+
+# Shaped like a PR upload: many records repeating the same keys and ids
+PAYLOAD = [
+    {
+        "nodeId": f"PR_{number}",
+        "number": number,
+        "state": "MERGED",
+        "codeRepositoryId": "repo-123",
+        "projectId": "project-9",
+        "userId": None,
+        "commits": 3,
+        "additions": 10,
+        "deletions": 2,
+        "changedFiles": 1,
+    }
+    for number in range(500)
+]
+
+
+class StandInBackend(BaseHTTPRequestHandler):
+    """Decodes save bodies the way the backend would and records what it received."""
+
+    received = []
+
+    def do_POST(self):
+        raw = self.rfile.read(int(self.headers["Content-Length"]))
+        body = gzip.decompress(raw) if self.headers.get("Content-Encoding") == "gzip" else raw
+        if self.headers["Content-Type"] == body_encoding.MSGPACK_CONTENT_TYPE:
+            import msgpack
+            payload = msgpack.unpackb(body, raw=False)
+        else:
+            payload = json.loads(body)
+        StandInBackend.received.append({
+            "payload": payload,
+            "wireBytes": len(raw),
+            "contentType": self.headers["Content-Type"],
+            "contentEncoding": self.headers.get("Content-Encoding"),
+            "idempotencyKey": self.headers.get("Idempotency-Key"),
+        })
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(b'{"success": true}')
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def backend_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInBackend)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/save"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def body_config(monkeypatch):
+    StandInBackend.received.clear()
+
+    def configure(body_format, compression, min_compress_bytes=0):
+        monkeypatch.setitem(BACKEND_BODY_CONFIG, "format", body_format)
+        monkeypatch.setitem(BACKEND_BODY_CONFIG, "compression", compression)
+        monkeypatch.setitem(BACKEND_BODY_CONFIG, "min_compress_bytes", min_compress_bytes)
+
+    return configure
+
+
+def send(url, payload, idempotency_key=None):
+    response = backend_transport.post(url, **backend_write_body(payload, idempotency_key), timeout=10)
+    assert response.status_code == 200
+    return StandInBackend.received[-1]
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+@pytest.mark.parametrize("body_format", ["json", "msgpack"])
+def test_round_trip(backend_url, body_config, body_format, compression):
+    if body_format == "msgpack":
+        pytest.importorskip("msgpack")
+    body_config(body_format, compression)
+
+    received = send(backend_url, PAYLOAD, "key-1")
+
+    assert received["payload"] == PAYLOAD
+    assert received["contentType"] == (
+        body_encoding.MSGPACK_CONTENT_TYPE if body_format == "msgpack" else body_encoding.JSON_CONTENT_TYPE
+    )
+    assert received["contentEncoding"] == compression
+    assert received["idempotencyKey"] == "key-1"
+
+
+def test_gzip_shrinks_repetitive_payloads(backend_url, body_config):
+    body_config("json", None)
+    plain = send(backend_url, PAYLOAD)["wireBytes"]
+    body_config("json", "gzip")
+    compressed = send(backend_url, PAYLOAD)["wireBytes"]
+
+    assert compressed * 5 < plain
+
+
+def test_msgpack_falls_back_to_json_when_missing(backend_url, body_config, monkeypatch):
+    monkeypatch.setattr(body_encoding, "msgpack", None)
+    for compression in (None, "gzip"):
+        body_config("msgpack", compression)
+
+        received = send(backend_url, PAYLOAD)
+
+        assert received["contentType"] == body_encoding.JSON_CONTENT_TYPE
+        assert received["contentEncoding"] == compression
+        assert received["payload"] == PAYLOAD
+
+
+def test_small_bodies_are_not_compressed(backend_url, body_config):
+    small = {"projectId": "project-9", "users": [{"nodeId": "U_1"}]}
+    body_config("json", "gzip", min_compress_bytes=1024)
+
+    received = send(backend_url, small)
+
+    assert received["contentEncoding"] is None
+    assert received["payload"] == small
+
+    received = send(backend_url, PAYLOAD)
+    assert received["contentEncoding"] == "gzip"
+    assert received["payload"] == PAYLOAD
@@ -0,0 +1,56 @@
+import models.user_model as user_model
+from utils.read_cache import backend_read_cache
+
+
+USERS = [
+    {"nodeId": "U_1", "userName": "ada"},
+    {"nodeId": "U_2", "userName": "grace"},
+]
+
+
+def test_repeat_save_sends_nothing(user_backend):
+    first = user_model.save_users("project-1", USERS)
+    second = user_model.save_users("project-1", USERS)
+
+    assert first["delta"] == {"new": 2, "changed": 0, "unchanged": 0}
+    assert second["delta"] == {"new": 0, "changed": 0, "unchanged": 2}
+    assert user_backend.posted == [["U_1", "U_2"]]
+
+
+def test_changed_record_is_resent(user_backend):
+    user_model.save_users("project-1", USERS)
+    renamed = [USERS[0], {**USERS[1], "userName": "grace.hopper"}]
+
+    result = user_model.save_users("project-1", renamed)
+
+    assert result["delta"] == {"new": 0, "changed": 1, "unchanged": 1}
+    assert user_backend.posted[-1] == ["U_2"]
+
+
+def test_record_lost_by_backend_is_sent_again(user_backend):
+    user_model.save_users("project-1", USERS)
+    # Deleted on the backend while its hash is still stored locally
+    del user_backend.users["U_2"]
+    backend_read_cache.clear()
+
+    fetched = user_model.fetch_user_data("project-1", "acme", type("Provider", (), {
+        "get_user_data": staticmethod(lambda org_name: USERS),
+    })())
+    result = user_model.save_users("project-1", fetched["unsaved_members"])
+
+    assert [user["nodeId"] for user in fetched["unsaved_members"]] == ["U_2"]
+    assert result["delta"]["new"] == 1
+    assert user_backend.posted[-1] == ["U_2"]
+    assert "U_2" in user_backend.users
+
+
+def test_sign_in_timestamp_alone_does_not_resend(user_backend):
+    azure_user = {"nodeId": "U_3", "userName": "linus", "userUpdatedAt": "2026-10-01T08:00:00Z"}
+    user_model.save_users("project-1", [azure_user])
+
+    # Azure DevOps maps lastAccessedDate to userUpdatedAt; it moves on every sign-in
+    signed_in = {**azure_user, "userUpdatedAt": "2026-10-18T09:30:00Z"}
+    result = user_model.save_users("project-1", [signed_in])
+
+    assert result["delta"] == {"new": 0, "changed": 0, "unchanged": 1}
+    assert user_backend.posted == [["U_3"]]
@@ -0,0 +1,91 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from config.api_config import GITHUB_API, HTTP_CACHE_CONFIG, RATE_LIMIT_CONFIG
+from providers.github_provider import GitHubProvider
+from services.github.graphql_query_service import run_graphql_query
+from utils.errors import GitHubRateLimitError
+
+
+class RateLimitedGraphQL(BaseHTTPRequestHandler):
+    """Answers HTTP 200 with a RATE_LIMITED error while a token's budget is spent."""
+
+    limited_until = {}
+    requests = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        authorization = self.headers.get("Authorization")
+        RateLimitedGraphQL.requests.append((authorization, time.time()))
+        reset = RateLimitedGraphQL.limited_until.get(authorization, 0)
+        if time.time() < reset:
+            body = {"data": None, "errors": [{"type": "RATE_LIMITED", "message": "API rate limit exceeded"}]}
+        else:
+            body = {"data": {"viewer": {"login": authorization.split()[-1]}}}
+        encoded = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("X-RateLimit-Resource", "graphql")
+        self.send_header("X-RateLimit-Reset", str(reset))
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def graphql_url(monkeypatch):
+    RateLimitedGraphQL.limited_until.clear()
+    RateLimitedGraphQL.requests.clear()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RateLimitedGraphQL)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}/graphql"
+    monkeypatch.setitem(GITHUB_API, "graphql", url)
+    monkeypatch.setitem(HTTP_CACHE_CONFIG, "enabled", False)
+    yield url
+    server.shutdown()
+    server.server_close()
+
+
+QUERY = "query { viewer { login } }"
+
+
+def test_rate_limited_query_waits_for_the_reset_and_retries(graphql_url):
+    provider = GitHubProvider("acme", "only")
+    reset = time.time() + 1.5
+    RateLimitedGraphQL.limited_until["Bearer only"] = reset
+
+    data = run_graphql_query(provider, QUERY)
+
+    assert data == {"viewer": {"login": "only"}}
+    assert len(RateLimitedGraphQL.requests) == 2
+    assert RateLimitedGraphQL.requests[-1][1] >= reset
+
+
+def test_rate_limited_token_is_parked_while_the_others_carry_on(graphql_url):
+    provider = GitHubProvider("acme", ["first", "second"])
+    RateLimitedGraphQL.limited_until["Bearer first"] = time.time() + 3600
+    started = time.time()
+
+    logins = {run_graphql_query(provider, QUERY)["viewer"]["login"] for _ in range(3)}
+
+    assert logins == {"second"}
+    assert time.time() - started < 5
+    assert [authorization for authorization, _ in RateLimitedGraphQL.requests].count("Bearer first") <= 1
+
+
+def test_gives_up_after_max_rate_limit_waits(graphql_url, monkeypatch):
+    monkeypatch.setitem(RATE_LIMIT_CONFIG, "max_rate_limit_waits", 0)
+    provider = GitHubProvider("acme", "only")
+    RateLimitedGraphQL.limited_until["Bearer only"] = time.time() + 3600
+
+    with pytest.raises(GitHubRateLimitError):
+        run_graphql_query(provider, QUERY)
+    assert len(RateLimitedGraphQL.requests) == 1
@@ -0,0 +1,86 @@
+import models.user_model as user_model
+import utils.local_store as local_store
+from services.local.outbox_service import (
+    append_outbox_entry_service,
+    count_outbox_entries_service,
+    recover_inflight_outbox_entries_service,
+)
+from utils.outbox import outbox_drainer
+
+
+def replay_all():
+    local_store.get_local_store().execute("UPDATE backend_outbox SET next_attempt_at = 0")
+    return outbox_drainer.drain_once()
+
+
+def test_write_is_recorded_before_its_first_attempt(user_backend):
+    statuses = []
+    user_backend.on_save = lambda payload, key: statuses.append(count_outbox_entries_service())
+
+    user_model.save_users("project-1", [{"nodeId": "U_1", "userName": "ada"}])
+
+    assert statuses == [{"inflight": 1}]
+    assert count_outbox_entries_service() == {"delivered": 1}
+
+
+def test_every_write_gets_its_own_key(user_backend):
+    ada = {"nodeId": "U_1", "userName": "ada"}
+    user_model.save_users("project-1", [ada])
+    user_model.save_users("project-1", [{**ada, "userName": "ada.lovelace"}])
+    user_model.save_users("project-1", [ada])
+
+    keys = [key for key, _ in user_backend.accepted]
+    assert len(keys) == 3 and len(set(keys)) == 3
+    assert user_backend.users["U_1"]["userName"] == "ada"
+
+
+def test_queued_write_replays_with_its_key_once_backend_is_back(user_backend):
+    user_backend.down = True
+    result = user_model.save_users("project-1", [{"nodeId": "U_1", "userName": "ada"}])
+    assert (result["saved"], result["queued"], result["failed"]) == (0, 1, 0)
+    assert count_outbox_entries_service() == {"pending": 1}
+
+    user_backend.down = False
+    assert replay_all() == 1
+    assert count_outbox_entries_service() == {"delivered": 1}
+    assert user_backend.users["U_1"]["userName"] == "ada"
+
+
+def test_stale_queued_write_is_superseded_by_a_newer_save(user_backend):
+    user_backend.down = True
+    user_model.save_users("project-1", [{"nodeId": "U_1", "userName": "old"}])
+    user_backend.down = False
+    user_model.save_users("project-1", [{"nodeId": "U_1", "userName": "new"}])
+
+    assert replay_all() == 0
+
+    assert user_backend.users["U_1"]["userName"] == "new"
+    assert [users for _, users in user_backend.accepted] == [[{"nodeId": "U_1", "userName": "new"}]]
+    assert count_outbox_entries_service() == {"delivered": 1, "superseded": 1}
+    # The stored hash is the newest content, so saving it again sends nothing
+    assert user_model.save_users("project-1", [{"nodeId": "U_1", "userName": "new"}])["saved"] == 0
+
+
+def test_replay_drops_only_the_records_a_newer_save_wrote(user_backend):
+    user_backend.down = True
+    user_model.save_users("project-1", [
+        {"nodeId": "U_1", "userName": "old"},
+        {"nodeId": "U_2", "userName": "grace"},
+    ])
+    user_backend.down = False
+    user_model.save_users("project-1", [{"nodeId": "U_1", "userName": "new"}])
+
+    assert replay_all() == 1
+
+    assert user_backend.accepted[-1][1] == [{"nodeId": "U_2", "userName": "grace"}]
+    assert user_backend.users["U_1"]["userName"] == "new"
+
+
+def test_writes_interrupted_by_a_crash_are_replayed(user_backend):
+    payload = {"projectId": "project-1", "users": [{"nodeId": "U_1", "userName": "ada"}]}
+    # The process died after recording the write, before the backend answered
+    append_outbox_entry_service("users", payload, "key-from-crashed-run", ["project-1:U_1"])
+
+    assert recover_inflight_outbox_entries_service() == 1
+    assert replay_all() == 1
+    assert user_backend.accepted == [("key-from-crashed-run", payload["users"])]
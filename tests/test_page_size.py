@@ -0,0 +1,95 @@
+import pytest
+import requests
+
+import services.github.get_pr_data_service as pr_service
+import utils.local_store as local_store
+from providers.github_provider import GitHubProvider
+from services.local.page_size_service import get_page_size_service
+from utils.errors import GitHubServerError
+from utils.page_size import AdaptivePageSize
+
+REPO = {"codeRepositoryId": "repo-1", "fullName": "acme/monorepo"}
+
+
+def test_size_halves_down_to_the_minimum():
+    page_size = AdaptivePageSize(100, minimum=10, maximum=100)
+
+    assert [page_size.shrink() for _ in range(5)] == [True, True, True, True, False]
+    assert page_size.size == 10
+
+
+def test_size_grows_back_after_consecutive_successes():
+    page_size = AdaptivePageSize(20, minimum=10, maximum=100, grow_after=2)
+
+    page_size.record_success()
+    assert page_size.size == 20
+    page_size.record_success()
+    assert page_size.size == 30
+
+    # A failure restarts the streak
+    page_size.record_success()
+    page_size.shrink()
+    page_size.record_success()
+    assert page_size.size == 15
+
+
+class PagedGraphQL:
+    """pullRequests connection of 3 pages; requests of ``first`` > ``times_out_above`` time out."""
+
+    def __init__(self, times_out_above):
+        self.times_out_above = times_out_above
+        self.requested = []
+
+    def __call__(self, provider, query, variables, context, timeout=10):
+        self.requested.append((variables["after"], variables["first"]))
+        if variables["first"] > self.times_out_above:
+            raise requests.exceptions.Timeout("read timed out")
+        page = int(variables["after"] or 0)
+        nodes = [{"nodeId": f"PR_{page}_{index}", "number": index, "commits": {"totalCount": 1}} for index in range(2)]
+        return {"repository": {"pullRequests": {
+            "nodes": nodes,
+            "pageInfo": {"hasNextPage": page < 2, "endCursor": str(page + 1)},
+        }}}
+
+
+@pytest.fixture
+def provider(tmp_path, monkeypatch):
+    monkeypatch.setattr(local_store, "_store", local_store.LocalStore(str(tmp_path / "collector.db")))
+    return GitHubProvider("acme", "token")
+
+
+def test_page_timeout_halves_first_and_retries_the_same_cursor(provider, monkeypatch):
+    graphql = PagedGraphQL(times_out_above=30)
+    monkeypatch.setattr(pr_service, "run_graphql_query", graphql)
+
+    pages = list(pr_service.iter_pr_data_pages_service(provider, [], REPO, None))
+
+    assert len(pages) == 3
+    assert graphql.requested == [(None, 100), (None, 50), (None, 25), ("1", 25), ("2", 25)]
+    # Remembered for the next sync, grown back by half after three successful pages
+    assert get_page_size_service(provider.get_sync_scope(), "repo-1") == 37
+
+
+def test_gives_up_once_the_minimum_size_fails(provider, monkeypatch):
+    graphql = PagedGraphQL(times_out_above=0)
+    monkeypatch.setattr(pr_service, "run_graphql_query", graphql)
+
+    with pytest.raises(pr_service.GitHubAPIError):
+        list(pr_service.iter_pr_data_pages_service(provider, [], REPO, None))
+    assert [first for _, first in graphql.requested] == [100, 50, 25, 12, 10]
+
+
+def test_server_errors_shrink_the_page_too(provider, monkeypatch):
+    calls = []
+
+    def flaky(provider, query, variables, context, timeout=10):
+        calls.append(variables["first"])
+        if len(calls) == 1:
+            raise GitHubServerError("GitHub GraphQL query timed out: Something went wrong", context)
+        return {"repository": {"pullRequests": {"nodes": [], "pageInfo": {"hasNextPage": False}}}}
+
+    monkeypatch.setattr(pr_service, "run_graphql_query", flaky)
+
+    list(pr_service.iter_pr_data_pages_service(provider, [], REPO, None))
+
+    assert calls == [100, 50]
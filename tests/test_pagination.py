@@ -0,0 +1,88 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from utils.errors import GitHubError
+from utils.pagination import paginate_github
+from utils.transport import HttpTransport
+
+ITEMS = 250
+
+
+class ListEndpoint(BaseHTTPRequestHandler):
+    """GitHub-style list endpoint; ``?links=next`` leaves out the ``last`` relation."""
+
+    requests = []
+    failing_page = None
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query.get("page", ["1"])[0])
+        per_page = int(query["per_page"][0])
+        ListEndpoint.requests.append(page)
+        if page == ListEndpoint.failing_page:
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        last = -(-ITEMS // per_page)
+        base = f"http://127.0.0.1:{self.server.server_port}/orgs/acme/repos?per_page={per_page}"
+        if "links" in query:
+            base += "&links=next"
+        links = []
+        if page < last:
+            links.append(f'<{base}&page={page + 1}>; rel="next"')
+            if "links" not in query:
+                links.append(f'<{base}&page={last}>; rel="last"')
+        body = json.dumps([
+            {"id": item} for item in range((page - 1) * per_page, min(page * per_page, ITEMS))
+        ]).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if links:
+            self.send_header("Link", ", ".join(links))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def list_url():
+    ListEndpoint.requests.clear()
+    ListEndpoint.failing_page = None
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ListEndpoint)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/orgs/acme/repos"
+    server.shutdown()
+    server.server_close()
+
+
+def test_last_link_fetches_the_remaining_pages_concurrently(list_url):
+    items = list(paginate_github(HttpTransport(), list_url, {}, "Repositories", per_page=50))
+
+    assert sorted(item["id"] for item in items) == list(range(ITEMS))
+    assert ListEndpoint.requests[0] == 1
+    assert sorted(ListEndpoint.requests) == [1, 2, 3, 4, 5]
+
+
+def test_next_links_are_followed_in_order(list_url):
+    items = list(paginate_github(HttpTransport(), list_url, {}, "Repositories", params={"links": "next"},
+                                 per_page=100))
+
+    assert [item["id"] for item in items] == list(range(ITEMS))
+    assert ListEndpoint.requests == [1, 2, 3]
+
+
+def test_a_failed_page_raises(list_url):
+    ListEndpoint.failing_page = 3
+
+    with pytest.raises(GitHubError):
+        list(paginate_github(HttpTransport(), list_url, {}, "Repositories", per_page=50))
@@ -0,0 +1,83 @@
+from datetime import datetime, timezone
+
+import pytest
+import requests
+
+import services.github.get_pr_data_service as pr_service
+import utils.local_store as local_store
+from providers.github_provider import GitHubProvider
+from utils.errors import GitHubAPIError
+
+WATERMARK = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+def repo(number):
+    return {"codeRepositoryId": f"repo-{number}", "fullName": f"acme/repo-{number}"}
+
+
+def pr_node(number, updated_at):
+    return {"nodeId": f"PR_{number}", "number": number, "updatedAt": updated_at, "commits": {"totalCount": 1}}
+
+
+class BatchedGraphQL:
+    """Answers batched first-page queries, failing as listed in ``failures`` (None succeeds)."""
+
+    def __init__(self):
+        self.requests = []
+        self.failures = []
+
+    def __call__(self, provider, query, variables, context, timeout=10):
+        sizes = {name[1:]: value for name, value in variables.items() if name.startswith("f")}
+        self.requests.append(sizes)
+        failure = self.failures.pop(0) if self.failures else None
+        if failure is not None:
+            raise failure
+        return {
+            f"r{index}": {"pullRequests": {
+                "nodes": [pr_node(1, "2026-10-05T00:00:00Z"), pr_node(2, "2026-09-01T00:00:00Z")],
+                "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+            }}
+            for index in sizes
+        }
+
+
+@pytest.fixture
+def graphql(tmp_path, monkeypatch):
+    monkeypatch.setattr(local_store, "_store", local_store.LocalStore(str(tmp_path / "collector.db")))
+    fake = BatchedGraphQL()
+    monkeypatch.setattr(pr_service, "run_graphql_query", fake)
+    return fake
+
+
+def test_repositories_with_a_watermark_ask_for_a_small_first_page(graphql):
+    provider = GitHubProvider("acme", "token")
+
+    pages = pr_service.get_first_pr_pages_service(provider, [], [(repo(0), None), (repo(1), WATERMARK)], 25)
+
+    assert graphql.requests == [{"0": 100, "1": 10}]
+    # The watermark still ends the incremental repository's listing
+    assert [pr["number"] for pr in pages["repo-1"]["prs"]] == [1]
+    assert pages["repo-1"]["hasNextPage"] is False
+    assert pages["repo-0"]["hasNextPage"] is True
+
+
+def test_timed_out_batch_is_retried_with_smaller_pages(graphql):
+    provider = GitHubProvider("acme", "token")
+    graphql.failures.append(requests.exceptions.Timeout("read timed out"))
+
+    pages = pr_service.get_first_pr_pages_service(provider, [], [(repo(0), None), (repo(1), WATERMARK)], 25)
+
+    assert graphql.requests == [{"0": 100, "1": 10}, {"0": 50, "1": 10}]
+    assert set(pages) == {"repo-0", "repo-1"}
+
+
+def test_failed_batch_only_drops_its_own_repositories(graphql):
+    provider = GitHubProvider("acme", "token")
+    repos = [(repo(number), WATERMARK) for number in range(3)]
+    graphql.failures.extend([None, GitHubAPIError("GitHub GraphQL error: Something went wrong", "batch")])
+
+    pages = pr_service.get_first_pr_pages_service(provider, [], repos, 2)
+
+    # Both batches were sent; the second failed, the first one's pages are kept
+    assert len(graphql.requests) == 2
+    assert set(pages) == {"repo-0", "repo-1"}
@@ -0,0 +1,111 @@
+import pytest
+import requests
+
+import models.pull_request_model as pull_request_model
+import utils.local_store as local_store
+from config.api_config import BULK_SAVE_CONFIG, PR_SYNC_CONFIG
+from services.local.sync_checkpoint_service import load_checkpoint_service
+from services.local.sync_watermark_service import get_sync_watermark_service
+from utils.pagination import Page
+
+
+def pr(number):
+    return {"nodeId": f"PR_{number}", "number": number, "prCreatedAt": f"2026-10-{number:02d}T00:00:00Z"}
+
+
+class PagedProvider:
+    """Lists fixed PR pages; ``after`` is the index of the next page."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.listed_from = []
+        self.fail_at = None
+
+    def get_sync_scope(self):
+        return "github:acme"
+
+    def iter_pr_pages(self, saved_users, repo_data, filter_date, after=None):
+        start = int(after) if after else 0
+        self.listed_from.append(start)
+        for index in range(start, len(self.pages)):
+            if index == self.fail_at:
+                self.fail_at = None
+                raise requests.exceptions.ConnectionError("connection reset while listing")
+            has_next = index + 1 < len(self.pages)
+            yield Page(self.pages[index], cursor=str(index + 1) if has_next else None)
+
+
+class PRBackend:
+    def __init__(self):
+        self.down = False
+        self.saved = []
+
+    def save(self, chunk):
+        if self.down:
+            raise requests.exceptions.ConnectionError("backend refused the connection")
+        self.saved.extend(pr["nodeId"] for pr in chunk)
+        return type("Response", (), {"json": staticmethod(lambda: {"success": True})})()
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    monkeypatch.setattr(local_store, "_store", local_store.LocalStore(str(tmp_path / "collector.db")))
+    monkeypatch.setitem(BULK_SAVE_CONFIG, "max_attempts", 1)
+    monkeypatch.setitem(PR_SYNC_CONFIG, "upload_chunk_size", 2)
+    monkeypatch.setitem(PR_SYNC_CONFIG, "upload_workers", 1)
+    fake = PRBackend()
+    monkeypatch.setattr(pull_request_model, "save_pr_data_service", fake.save)
+    return fake
+
+
+REPO = {"codeRepositoryId": "repo-1", "fullName": "acme/web"}
+
+
+def test_resume_after_a_finished_listing_counts_the_resent_prs(backend):
+    provider = PagedProvider([[pr(1), pr(2)], [pr(3)]])
+    backend.down = True
+    first = pull_request_model.stream_pull_requests(provider, [], REPO, None)
+    assert first["failed"] == 3
+    assert load_checkpoint_service("github:acme", "repo-1")["cursor"] is None
+
+    backend.down = False
+    resumed = pull_request_model.stream_pull_requests(provider, [], REPO, None)
+
+    assert provider.listed_from == [0]
+    assert (resumed["fetched"], resumed["saved"], resumed["resumed"]) == (3, 3, True)
+    assert sorted(backend.saved) == ["PR_1", "PR_2", "PR_3"]
+    assert load_checkpoint_service("github:acme", "repo-1") is None
+
+
+def test_interrupted_sync_resumes_after_the_last_checkpointed_page(backend):
+    provider = PagedProvider([[pr(1), pr(2)], [pr(3), pr(4)], [pr(5)]])
+    provider.fail_at = 2
+    with pytest.raises(requests.exceptions.ConnectionError):
+        pull_request_model.stream_pull_requests(provider, [], REPO, None)
+    checkpoint = load_checkpoint_service("github:acme", "repo-1")
+    assert (checkpoint["pages"], checkpoint["cursor"]) == (2, "2")
+    assert get_sync_watermark_service("github:acme", "repo-1") is None
+
+    resumed = pull_request_model.stream_pull_requests(provider, [], REPO, None)
+
+    assert provider.listed_from == [0, 2]
+    assert resumed["resumed"] is True
+    # Pages saved before the interruption are not sent again
+    assert sorted(backend.saved) == ["PR_1", "PR_2", "PR_3", "PR_4", "PR_5"]
+    assert load_checkpoint_service("github:acme", "repo-1") is None
+    assert get_sync_watermark_service("github:acme", "repo-1")["updatedAt"].startswith("2026-10-05")
+
+
+def test_resume_resends_prs_whose_save_failed(backend):
+    provider = PagedProvider([[pr(1), pr(2)], [pr(3)]])
+    provider.fail_at = 1
+    backend.down = True
+    with pytest.raises(requests.exceptions.ConnectionError):
+        pull_request_model.stream_pull_requests(provider, [], REPO, None)
+
+    backend.down = False
+    resumed = pull_request_model.stream_pull_requests(provider, [], REPO, None)
+
+    assert provider.listed_from == [0, 1]
+    assert sorted(backend.saved) == ["PR_1", "PR_2", "PR_3"]
+    assert (resumed["fetched"], resumed["saved"], resumed["failed"]) == (3, 3, 0)
@@ -0,0 +1,45 @@
+import pytest
+import requests
+
+import models.pull_request_model as pull_request_model
+from services.backend import get_last_pr_data_service as last_pr_service
+from utils.errors import APIError
+
+
+def backend_answer(status_code, body):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body.encode("utf-8")
+    return response
+
+
+@pytest.fixture
+def last_pr_reply(monkeypatch):
+    replies = []
+
+    class Transport:
+        def get(self, url, timeout=None):
+            return replies.pop(0)
+
+    monkeypatch.setattr(last_pr_service, "backend_transport", Transport())
+    return replies
+
+
+def test_repository_without_prs_has_no_watermark(last_pr_reply):
+    last_pr_reply.append(backend_answer(404, '{"message": "No pull requests found"}'))
+
+    assert pull_request_model.get_last_pr_watermark("repo-1") is None
+
+
+def test_watermark_is_the_last_pr_creation_date(last_pr_reply):
+    last_pr_reply.append(backend_answer(200, '{"data": {"prCreatedAt": "2026-10-01T08:00:00Z"}}'))
+
+    assert pull_request_model.get_last_pr_watermark("repo-1").isoformat().startswith("2026-10-01T08:00:00")
+
+
+def test_other_backend_errors_still_surface(last_pr_reply):
+    last_pr_reply.append(backend_answer(500, '{"message": "Internal error"}'))
+
+    with pytest.raises(APIError) as raised:
+        pull_request_model.get_last_pr_watermark("repo-1")
+    assert raised.value.status_code == 500
@@ -0,0 +1,39 @@
+import models.pull_request_model as pull_request_model
+from providers.azure_devops_provider import AzureDevOpsProvider
+
+
+def exhaust(budget):
+    while budget.try_consume():
+        pass
+
+
+def test_pr_pages_do_not_refill_the_sync_budget():
+    provider = AzureDevOpsProvider("acme", "token")
+    provider.begin_sync()
+    exhaust(provider.retry_budget)
+
+    # Every repository worker of a sync-all opens its own page iterator
+    for _ in range(3):
+        provider.iter_pr_pages([], {"codeRepositoryId": "repo"}, None)
+
+    assert provider.retry_budget.remaining == 0
+    provider.begin_sync()
+    assert provider.retry_budget.remaining == provider.retry_budget.max_retries
+
+
+def test_sync_all_starts_one_sync(monkeypatch):
+    provider = AzureDevOpsProvider("acme", "token")
+    syncs = []
+    monkeypatch.setattr(provider, "begin_sync", lambda: syncs.append(len(synced)))
+    synced = []
+    monkeypatch.setattr(pull_request_model, "prefetch_first_pr_pages", lambda *args: {})
+    monkeypatch.setattr(
+        pull_request_model, "sync_repository_pull_requests",
+        lambda provider, users, repo_data, *args: synced.append(repo_data) or {"state": "done"},
+    )
+
+    results = pull_request_model.sync_all_pull_requests(provider, [], [{"codeRepositoryId": n} for n in range(4)])
+
+    assert len(results) == len(synced) == 4
+    # Before any repository, and never again by the workers
+    assert syncs == [0]
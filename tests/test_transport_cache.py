@@ -0,0 +1,66 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils.http_cache import ConditionalRequestCache
+from utils.rate_limit import RateLimitGovernor
+from utils.token_pool import TokenPool
+from utils.transport import HttpTransport
+
+
+class PerTokenETags(BaseHTTPRequestHandler):
+    """Serves a different ETag per token and answers 304 only to that token's own ETag."""
+
+    requests = []
+
+    def do_GET(self):
+        authorization = self.headers.get("Authorization")
+        etag = f'"etag-{authorization.split()[-1]}"'
+        PerTokenETags.requests.append((authorization, self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        body = f'{{"token": "{authorization}"}}'.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    PerTokenETags.requests.clear()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PerTokenETags)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/orgs/acme/repos"
+    server.shutdown()
+    server.server_close()
+
+
+def test_cache_is_keyed_by_the_token_the_pool_chose(server_url, tmp_path):
+    pool = TokenPool(["first", "second"], RateLimitGovernor)
+    cache = ConditionalRequestCache(str(tmp_path))
+    transport = HttpTransport(governor=pool, cache=cache)
+    # Like the services: every call carries the provider's default token
+    default_headers = {"Authorization": "Bearer first"}
+
+    for _ in range(4):
+        response = transport.get(server_url, headers=default_headers, timeout=5)
+        assert response.status_code == 200
+
+    sent = PerTokenETags.requests
+    assert {authorization for authorization, _ in sent} == {"Bearer first", "Bearer second"}
+    for authorization, if_none_match in sent:
+        # Validators are only ever sent with the token that received them
+        assert if_none_match in (None, f'"etag-{authorization.split()[-1]}"')
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
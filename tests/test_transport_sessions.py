@@ -0,0 +1,27 @@
+import gc
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.transport import HttpTransport
+
+
+def test_sessions_of_finished_threads_are_released():
+    transport = HttpTransport()
+
+    # Like sync-all and the uploader: a short-lived executor per run
+    for _ in range(50):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: transport.session, range(8)))
+    gc.collect()
+
+    assert len(transport._sessions) <= 4
+    transport.close()
+
+
+def test_close_closes_the_live_sessions():
+    transport = HttpTransport()
+    session = transport.session
+
+    transport.close()
+
+    assert len(transport._sessions) == 0
+    assert transport.session is not session
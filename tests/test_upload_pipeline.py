@@ -0,0 +1,50 @@
+import threading
+
+from utils.upload_pipeline import ChunkedUploader
+
+
+def test_items_are_uploaded_in_fixed_size_chunks():
+    uploaded = []
+    lock = threading.Lock()
+
+    def upload(chunk):
+        with lock:
+            uploaded.append(list(chunk))
+
+    with ChunkedUploader(upload, chunk_size=3, max_workers=2, max_pending=2) as uploader:
+        for start in range(0, 10, 4):
+            uploader.add(list(range(start, min(start + 4, 10))))
+
+    assert sorted(len(chunk) for chunk in uploaded) == [1, 3, 3, 3]
+    assert sorted(item for chunk in uploaded for item in chunk) == list(range(10))
+    assert uploader.stats() == {"saved": 10, "failed": 0, "chunks": 4, "failedChunks": 0, "errors": []}
+
+
+def test_a_failed_chunk_does_not_stop_the_others():
+    def upload(chunk):
+        if 4 in chunk:
+            raise RuntimeError("backend rejected the chunk")
+
+    with ChunkedUploader(upload, chunk_size=2, max_workers=1, max_pending=4) as uploader:
+        uploader.add(list(range(8)))
+
+    stats = uploader.stats()
+    assert (stats["saved"], stats["failed"], stats["chunks"], stats["failedChunks"]) == (6, 2, 4, 1)
+    assert stats["errors"] == ["backend rejected the chunk"]
+
+
+def test_add_blocks_while_the_queue_is_full():
+    release = threading.Event()
+    uploader = ChunkedUploader(lambda chunk: release.wait(5), chunk_size=1, max_workers=1, max_pending=1)
+    # One chunk held by the worker, one waiting in the queue
+    uploader.add([1, 2])
+
+    producer = threading.Thread(target=uploader.add, args=([3],))
+    producer.start()
+    producer.join(0.3)
+    assert producer.is_alive()
+
+    release.set()
+    producer.join(5)
+    assert not producer.is_alive()
+    assert uploader.close()["saved"] == 3
@@ -0,0 +1,43 @@
+from typing import Any, Dict, Iterable, Optional, Set
+from utils.hash import hash_id
+
+
+class AuthorIndex:
+    """Resolves provider author ids to saved user ids.
+
+    Saved users store the SHA-256 of their provider id as ``nodeId``. The
+    index maps those hashes to ``userId`` once. It also remembers every
+    author it has resolved, so each distinct author is hashed only once per
+    sync, however many PRs they opened. Authors with no saved user end up
+    in ``misses``.
+    """
+
+    def __init__(self, saved_users: Iterable[Dict[str, Any]]):
+        self._user_ids = {
+            user.get("nodeId"): user.get("userId")
+            for user in saved_users
+            if user.get("nodeId")
+        }
+        self._resolved: Dict[str, Optional[Any]] = {}
+        self.misses: Set[str] = set()
+
+    @classmethod
+    def of(cls, saved_users) -> "AuthorIndex":
+        """Reuse an existing index, or build one from a list of saved users."""
+        if isinstance(saved_users, cls):
+            return saved_users
+        return cls(saved_users or [])
+
+    def resolve(self, author_id: Optional[str]) -> Optional[Any]:
+        """The saved userId of a raw (unhashed) provider author id, or None."""
+        if not author_id:
+            return None
+        try:
+            return self._resolved[author_id]
+        except KeyError:
+            pass
+        user_id = self._user_ids.get(hash_id(author_id))
+        self._resolved[author_id] = user_id
+        if user_id is None:
+            self.misses.add(author_id)
+        return user_id
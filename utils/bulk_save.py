@@ -0,0 +1,104 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+import requests
+from config.api_config import BULK_SAVE_CONFIG
+from utils.errors import APIError
+from utils.retry import RetryPolicy
+
+
+class WriteQueued(Exception):
+    """A save the backend could not take now; it is kept in the outbox and replayed later."""
+
+
+def is_retryable_save_error(error: Exception) -> bool:
+    """Whether a failed backend save is worth retrying (network trouble, 429 or 5xx)."""
+    if isinstance(error, requests.exceptions.RequestException):
+        return True
+    if isinstance(error, APIError):
+        if error.status_code is None:
+            # Network failures wrapped by the save services carry no status or code
+            return error.error_code is None
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+
+def default_save_retry_policy() -> RetryPolicy:
+    return RetryPolicy(
+        max_attempts=BULK_SAVE_CONFIG["max_attempts"],
+        base_delay=BULK_SAVE_CONFIG["base_delay"],
+        max_delay=BULK_SAVE_CONFIG["max_delay"],
+    )
+
+
+def save_with_retry(save_chunk: Callable[[List[Any]], Any], chunk: List[Any],
+                    retry_policy: Optional[RetryPolicy] = None):
+    """Save one chunk, retrying transient failures with backoff; the last error is raised."""
+    retry_policy = retry_policy or default_save_retry_policy()
+    attempt = 0
+    while True:
+        try:
+            return save_chunk(chunk)
+        except Exception as e:
+            if not is_retryable_save_error(e) or not retry_policy.can_retry(attempt):
+                raise
+            delay = retry_policy.delay_for(attempt)
+            logging.warning(f"Saving a chunk of {len(chunk)} items failed ({e}); retrying in {delay:.1f}s")
+            time.sleep(delay)
+            attempt += 1
+
+
+def bulk_save(items: List[Any], save_chunk: Callable[[List[Any]], Any],
+              chunk_size: Optional[int] = None, max_workers: Optional[int] = None,
+              retry_policy: Optional[RetryPolicy] = None, retry: bool = True) -> Dict[str, Any]:
+    """
+    Save a list through a backend endpoint in concurrent, independently retried chunks.
+
+    A chunk that still fails after its retries is counted as failed; the
+    other chunks are saved regardless, so a large save is no longer
+    all-or-nothing. A chunk whose ``save_chunk`` raises ``WriteQueued``
+    (see ``utils.outbox.send_through_outbox``) is counted as queued rather
+    than failed.
+
+    Args:
+        items: Everything to save
+        save_chunk: Saves one chunk of items, raising on failure
+        chunk_size: Items per request (default ``BULK_SAVE_CONFIG["chunk_size"]``)
+        max_workers: Concurrent requests (default ``BULK_SAVE_CONFIG["max_workers"]``)
+        retry_policy: Backoff for transient failures (default from BULK_SAVE_CONFIG)
+        retry: Retry chunks here; pass False when ``save_chunk`` retries on its own
+
+    Returns:
+        Dict with ``total``, ``saved``, ``queued``, ``failed``, ``chunks``,
+        ``failedChunks`` and the ``errors`` of the failed chunks
+    """
+    chunk_size = chunk_size or BULK_SAVE_CONFIG["chunk_size"]
+    max_workers = max_workers or BULK_SAVE_CONFIG["max_workers"]
+    chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+
+    result = {
+        "total": len(items), "saved": 0, "queued": 0, "failed": 0,
+        "chunks": len(chunks), "failedChunks": 0, "errors": [],
+    }
+    if not chunks:
+        return result
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks)), thread_name_prefix="bulk-save") as executor:
+        futures = [
+            (chunk, executor.submit(save_with_retry, save_chunk, chunk, retry_policy)
+             if retry else executor.submit(save_chunk, chunk))
+            for chunk in chunks
+        ]
+        for chunk, future in futures:
+            try:
+                future.result()
+                result["saved"] += len(chunk)
+            except WriteQueued:
+                result["queued"] += len(chunk)
+            except Exception as e:
+                logging.exception(f"Failed to save a chunk of {len(chunk)} items")
+                result["failed"] += len(chunk)
+                result["failedChunks"] += 1
+                result["errors"].append(str(e))
+    return result
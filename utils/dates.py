@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+
+try:
+    import iso8601
+except ImportError:
+    iso8601 = None
+    print("Warning: iso8601 module not found, using datetime fallback")
+
+
+def parse_iso_date(date_str):
+    """Parse ISO 8601 date with fallback if iso8601 is unavailable."""
+    if iso8601:
+        return iso8601.parse_date(date_str)
+    else:
+        try:
+            for fmt in (
+                "%Y-%m-%dT%H:%M:%S.%fZ",
+                "%Y-%m-%dT%H:%M:%SZ",
+                "%Y-%m-%dT%H:%M:%S.%f",
+                "%Y-%m-%dT%H:%M:%S",
+            ):
+                try:
+                    return datetime.strptime(date_str, fmt)
+                except ValueError:
+                    continue
+            raise ValueError(f"Invalid date format: {date_str}")
+        except Exception as e:
+            print(f"Date parsing error: {e}")
+            raise
+
+
+def as_utc(value):
+    """Make a datetime timezone-aware, treating naive values as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def parse_utc(date_str):
+    """Parse an ISO 8601 timestamp (``Z`` or offset, any fraction length) into an aware UTC datetime."""
+    return as_utc(datetime.fromisoformat(date_str.replace("Z", "+00:00")))
+
+
+def format_utc(value):
+    """Second-precision ``YYYY-MM-DDTHH:MM:SSZ`` form of a datetime, for API filters."""
+    return as_utc(value).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -0,0 +1,75 @@
+from typing import Any, Dict, Iterable, List, Optional, Set
+from config.api_config import DELTA_SYNC_CONFIG
+from services.local.record_hash_service import get_record_hashes_service, save_record_hashes_service
+from utils.hash import hash_record
+
+DELTA_CATEGORIES = ("new", "changed", "unchanged")
+
+
+def record_hash(record: Dict[str, Any]) -> str:
+    return hash_record(record, DELTA_SYNC_CONFIG["ignored_fields"])
+
+
+def classify_records(project_id, kind: str, records: List[Dict[str, Any]],
+                     saved_node_ids: Optional[Set[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Split provider records into new, changed and unchanged ones by content hash.
+
+    A record is compared with the hash stored when it was last saved to the
+    project (see ``record_saved_hashes``). When ``saved_node_ids`` (the
+    nodeIds the backend already has) is given, a record missing from it is
+    new. A saved record with no stored hash was saved before hashes were
+    kept. Its current hash becomes the baseline, and it counts as unchanged.
+
+    With ``DELTA_SYNC_CONFIG["enabled"]`` off, records missing from
+    ``saved_node_ids`` (or every record, without it) are new and the rest unchanged.
+
+    Args:
+        project_id: Backend projectId
+        kind: Record kind, e.g. ``"users"``
+        records: Provider records, each with a ``nodeId``
+        saved_node_ids: nodeIds already saved in the backend, if known
+
+    Returns:
+        Dict with the ``new``, ``changed`` and ``unchanged`` records
+    """
+    delta = {category: [] for category in DELTA_CATEGORIES}
+    if not DELTA_SYNC_CONFIG["enabled"]:
+        for record in records:
+            is_saved = saved_node_ids is not None and record.get("nodeId") in saved_node_ids
+            delta["unchanged" if is_saved else "new"].append(record)
+        return delta
+
+    stored = get_record_hashes_service(project_id, kind)
+    baseline = []
+    for record in records:
+        node_id = record.get("nodeId")
+        content_hash = record_hash(record)
+        if saved_node_ids is not None and node_id not in saved_node_ids:
+            delta["new"].append(record)
+        elif node_id not in stored:
+            if saved_node_ids is None:
+                delta["new"].append(record)
+            else:
+                baseline.append((node_id, content_hash))
+                delta["unchanged"].append(record)
+        elif stored[node_id] != content_hash:
+            delta["changed"].append(record)
+        else:
+            delta["unchanged"].append(record)
+
+    if baseline:
+        save_record_hashes_service(project_id, kind, baseline)
+    return delta
+
+
+def delta_counts(delta: Dict[str, List[Any]]) -> Dict[str, int]:
+    return {category: len(delta[category]) for category in DELTA_CATEGORIES}
+
+
+def record_saved_hashes(project_id, kind: str, records: Iterable[Dict[str, Any]]):
+    """Store the content hashes of records the backend has just accepted."""
+    if DELTA_SYNC_CONFIG["enabled"]:
+        save_record_hashes_service(
+            project_id, kind, [(record.get("nodeId"), record_hash(record)) for record in records]
+        )
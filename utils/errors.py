@@ -47,6 +47,10 @@ class GitHubAPIError(GitHubError):
     """Raised for general GitHub API errors."""
     pass
 
+class GitHubServerError(GitHubAPIError):
+    """Raised when GitHub fails on its side (5xx, or a GraphQL query that timed out)."""
+    pass
+
 # Azure specific errors
 class AzureError(Exception):
     """Base class for Azure-specific errors."""
@@ -144,9 +148,15 @@ def handle_github_error(response: requests.Response, context: str) -> None:
         GitHubAuthError: For authentication issues
         GitHubRateLimitError: When rate limit is exceeded
         GitHubNotFoundError: When resource is not found
+        GitHubServerError: For 5xx responses
         GitHubAPIError: For other GitHub API errors
     """
-    if response.status_code == 401:
+    if response.status_code >= 500:
+        raise GitHubServerError(
+            f"GitHub server error (Status {response.status_code}): {context}",
+            response.text[:200] if response.text else None
+        )
+    elif response.status_code == 401:
         raise GitHubAuthError(
             "Invalid or expired GitHub Personal Access Token",
             "Please check your token and ensure it has the required permissions"
@@ -161,6 +171,11 @@ def handle_github_error(response: requests.Response, context: str) -> None:
             "Insufficient permissions",
             "Your token doesn't have the required permissions for this operation"
         )
+    elif response.status_code == 429:
+        raise GitHubRateLimitError(
+            "GitHub API rate limit exceeded",
+            "Please try again later or use a different token"
+        )
     elif response.status_code == 404:
         raise GitHubNotFoundError(
             f"Resource not found: {context}",
@@ -243,6 +258,11 @@ def handle_azure_error(response: requests.Response, context: str) -> None:
                 "Forbidden: Insufficient permissions or access denied for Azure DevOps operation.",
                 error_details or "Your token might lack required permissions or access is denied."
             )
+    elif response.status_code in (429, 503):
+        raise AzureRateLimitError(
+            "Azure DevOps API is throttling requests.",
+            error_details or "Retries were exhausted. Please try again later or reduce your request frequency."
+        )
     elif response.status_code == 404:
         raise AzureNotFoundError(
             f"Azure DevOps resource not found: {context}.",
@@ -258,4 +278,33 @@ def handle_azure_error(response: requests.Response, context: str) -> None:
         raise AzureAPIError(
             error_message,
             error_details
-        )
\ No newline at end of file
+        )
+
+
+def show_bulk_save_result(parent, result, noun):
+    """Report the outcome of a bulk_save: success, or how much was saved and why the rest failed.
+
+    Args:
+        parent: The parent widget for the message box
+        result: Dict returned by utils.bulk_save.bulk_save, optionally with
+                the ``delta`` counts of utils.delta_sync
+        noun: What was saved, e.g. "users"
+    """
+    delta = result.get("delta")
+    summary = ""
+    if delta:
+        summary = f"\n\nNew: {delta['new']}, changed: {delta['changed']}, unchanged (not sent): {delta['unchanged']}"
+    if result.get("queued"):
+        summary += (
+            f"\n\n{result['queued']} {noun} could not reach the backend and are queued; "
+            "they will be sent automatically once it is reachable."
+        )
+    if not result["failed"]:
+        QMessageBox.information(parent, "Success", f"Saved {result['saved']} {noun} successfully.{summary}")
+        return
+    QMessageBox.warning(
+        parent,
+        "Partially Saved",
+        f"Saved {result['saved']} of {result['total']} {noun}. "
+        f"{result['failedChunks']} of {result['chunks']} requests failed:\n{result['errors'][0]}{summary}",
+    )
@@ -1,5 +1,12 @@
 import hashlib
+import json
 
 def hash_id(id):
     checksum = hashlib.sha256(id.encode("utf-8")).hexdigest()
-    return checksum
\ No newline at end of file
+    return checksum
+
+def hash_record(record, ignored_fields=()):
+    """Stable SHA-256 of a record's content (key order does not matter)."""
+    content = {key: value for key, value in record.items() if key not in ignored_fields}
+    encoded = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
@@ -0,0 +1,122 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Dict, Any, Optional
+from urllib.parse import urlencode
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class ConditionalRequestCache:
+    """On-disk cache for GET responses, revalidated with conditional requests.
+
+    Entries are keyed by URL, query parameters and a hash of the
+    ``Authorization`` header, so different tokens never share cached data.
+    A cached entry adds ``If-None-Match``/``If-Modified-Since`` to the next
+    request for the same key. A ``304 Not Modified`` reply is then served
+    from disk. On GitHub, 304 replies do not count against the primary rate
+    limit.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+
+    def key_for(self, url: str, params=None, headers=None) -> str:
+        identity = hashlib.sha256(
+            (headers or {}).get("Authorization", "").encode("utf-8")
+        ).hexdigest()
+        query = urlencode(sorted((params or {}).items()))
+        return hashlib.sha256(f"{identity}|{url}?{query}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Validators to send for a cached entry."""
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("lastModified"):
+            headers["If-Modified-Since"] = entry["lastModified"]
+        return headers
+
+    def resolve(self, key: str, entry: Optional[Dict[str, Any]], response: requests.Response) -> requests.Response:
+        """
+        Turn the reply to a (possibly conditional) request into the response to return.
+
+        A 304 for a cached entry becomes the cached 200 response. A 200
+        carrying validators is stored for the next run.
+        """
+        if response.status_code == 304 and entry:
+            cached = self._build_response(entry, response)
+            with self._lock:
+                self.hits += 1
+                self.bytes_saved += len(cached.content)
+            return cached
+
+        with self._lock:
+            self.misses += 1
+        if response.status_code == 200 and (response.headers.get("ETag") or response.headers.get("Last-Modified")):
+            self._store(key, response)
+        return response
+
+    def _store(self, key: str, response: requests.Response):
+        try:
+            entry = {
+                "url": response.url,
+                "etag": response.headers.get("ETag"),
+                "lastModified": response.headers.get("Last-Modified"),
+                "headers": dict(response.headers),
+                "body": response.content.decode("utf-8"),
+            }
+        except UnicodeDecodeError:
+            return
+
+        path = self._path(key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(temp_path, path)
+        except OSError:
+            logging.exception("Failed to write HTTP cache entry")
+
+    @staticmethod
+    def _build_response(entry: Dict[str, Any], not_modified: requests.Response) -> requests.Response:
+        cached = requests.Response()
+        cached.status_code = 200
+        cached.reason = "OK (cached)"
+        cached.url = entry.get("url") or not_modified.url
+        cached.request = not_modified.request
+        cached.encoding = "utf-8"
+        cached._content = entry["body"].encode("utf-8")
+        headers = CaseInsensitiveDict(entry.get("headers", {}))
+        # Keep the fresh rate-limit readings of the 304 reply
+        for name, value in not_modified.headers.items():
+            if name.lower().startswith("x-ratelimit") or name.lower() == "retry-after":
+                headers[name] = value
+        headers.pop("Content-Encoding", None)
+        headers.pop("Content-Length", None)
+        cached.headers = headers
+        return cached
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bytesSaved": self.bytes_saved,
+            }
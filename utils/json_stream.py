@@ -0,0 +1,116 @@
+import codecs
+import json
+from typing import Any, Iterator
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\r\n"
+
+
+def iter_json_array(response, key: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array one at a time from a streamed response.
+
+    Only the item being decoded (plus one network chunk) is held in memory,
+    never the whole document. The request must be made with
+    ``stream=True``. A missing key yields nothing.
+
+    Args:
+        response: requests.Response opened with ``stream=True``
+        key: Name of the top-level array (e.g. ``"value"`` or ``"members"``)
+        chunk_size: Bytes read from the socket at a time
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    chunks = _iter_text(response, chunk_size)
+    buffer = _skip_to_array(chunks, key)
+    if buffer is None:
+        return
+
+    decoder = json.JSONDecoder()
+    exhausted = False
+    position = 0
+    while True:
+        while position < len(buffer) and buffer[position] in _WHITESPACE + ",":
+            position += 1
+        if position < len(buffer) and buffer[position] == "]":
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+            # A number cut by a chunk boundary ("3" of "3.5") only counts as
+            # decoded once the delimiter that follows it has arrived
+            complete = exhausted or (end < len(buffer) and buffer[end] in _WHITESPACE + ",]")
+        except json.JSONDecodeError:
+            if exhausted:
+                raise ValueError(f"Malformed JSON array '{key}' in response")
+            complete = False
+
+        if complete:
+            yield item
+            position = end
+            continue
+
+        buffer = buffer[position:]
+        position = 0
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+        else:
+            buffer += chunk
+
+
+def _iter_text(response, chunk_size: int) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _skip_to_array(chunks: Iterator[str], key: str):
+    """Consume text up to the ``[`` opening ``key`` in the top-level object.
+
+    Returns:
+        The text following the ``[``, or None if the key is not found
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    string_chars = []
+    last_key = None
+    awaiting_value = False
+
+    for chunk in chunks:
+        for index, char in enumerate(chunk):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+                    if depth == 1:
+                        last_key = "".join(string_chars)
+                else:
+                    if depth == 1:
+                        string_chars.append(char)
+                continue
+
+            if awaiting_value and char not in _WHITESPACE:
+                awaiting_value = False
+                if char == "[" and last_key == key:
+                    return chunk[index + 1:]
+            if char == '"':
+                in_string = True
+                string_chars = []
+            elif char in "{[":
+                depth += 1
+            elif char in "}]":
+                depth -= 1
+            elif char == ":" and depth == 1:
+                awaiting_value = True
+    return None
@@ -0,0 +1,79 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterable, List, Optional, Sequence
+from config.api_config import LOCAL_STORE_CONFIG
+from utils.paths import get_app_data_dir
+
+
+class LocalStore:
+    """SQLite database in the app data folder for sync state kept across runs.
+
+    Each thread gets its own connection. Every write runs in its own
+    transaction. The database uses WAL journaling, so concurrent readers
+    are never blocked by the writer. Modules create their own tables with
+    ``ensure_schema``.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schemas = set()
+
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def ensure_schema(self, name: str, statements: Iterable[str]):
+        """Run a module's ``CREATE ... IF NOT EXISTS`` statements once per process."""
+        if name in self._schemas:
+            return
+        with self._schema_lock:
+            if name in self._schemas:
+                return
+            with self.connection() as connection:
+                for statement in statements:
+                    connection.execute(statement)
+            self._schemas.add(name)
+
+    @contextmanager
+    def transaction(self):
+        """Connection whose statements commit together, or roll back on error."""
+        with self.connection() as connection:
+            yield connection
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """Run one write statement in its own transaction and return the affected row count."""
+        with self.connection() as connection:
+            return connection.execute(sql, params).rowcount
+
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]]):
+        with self.connection() as connection:
+            connection.executemany(sql, rows)
+
+    def fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[sqlite3.Row]:
+        return self.connection().execute(sql, params).fetchone()
+
+    def fetchall(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        return self.connection().execute(sql, params).fetchall()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_local_store() -> LocalStore:
+    """The application's shared LocalStore (created on first use)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = LocalStore(os.path.join(get_app_data_dir(), LOCAL_STORE_CONFIG["filename"]))
+        return _store
@@ -0,0 +1,239 @@
+import logging
+import threading
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from config.api_config import OUTBOX_CONFIG
+from services.local.outbox_service import (
+    append_outbox_entry_service,
+    claim_outbox_entry_service,
+    count_outbox_entries_service,
+    get_due_outbox_entries_service,
+    get_outbox_record_keys_service,
+    get_superseded_record_keys_service,
+    prune_outbox_service,
+    recover_inflight_outbox_entries_service,
+    replace_outbox_payload_service,
+    reschedule_outbox_entry_service,
+    set_outbox_entry_status_service,
+)
+from utils.bulk_save import WriteQueued, is_retryable_save_error, save_with_retry
+from utils.retry import RetryPolicy
+
+
+class OutboxEndpoint:
+    """How the writes of one backend endpoint are sent and split into records."""
+
+    def __init__(self, send: Callable[[Any, str], Any], records: Callable[[Any], List[Any]],
+                 record_key: Callable[[Any, Any], str], with_records: Callable[[Any, List[Any]], Any]):
+        """
+        Args:
+            send: Posts a payload with its idempotency key, raising on
+                  failure. It should also do whatever a successful save
+                  does (e.g. invalidate read caches).
+            records: The records a payload writes
+            record_key: Key of one record of a payload, unique within the endpoint
+            with_records: The payload narrowed to some of its records
+        """
+        self.send = send
+        self.records = records
+        self.record_key = record_key
+        self.with_records = with_records
+
+    def record_keys(self, payload: Any) -> List[str]:
+        return [self.record_key(payload, record) for record in self.records(payload)]
+
+
+_endpoints: Dict[str, OutboxEndpoint] = {}
+
+
+def register_outbox_endpoint(name: str, endpoint: OutboxEndpoint):
+    """Register how writes queued under ``name`` are sent and superseded."""
+    _endpoints[name] = endpoint
+
+
+def project_records_endpoint(send: Callable[[Any, str], Any], field: str) -> OutboxEndpoint:
+    """Endpoint whose payloads are ``{"projectId": ..., field: [records with nodeId]}``."""
+    return OutboxEndpoint(
+        send=send,
+        records=lambda payload: payload[field],
+        record_key=lambda payload, record: f"{payload['projectId']}:{record.get('nodeId')}",
+        with_records=lambda payload, records: {**payload, field: records},
+    )
+
+
+def new_idempotency_key() -> str:
+    """Unique key of one write; every attempt and replay of that write reuses it."""
+    return uuid.uuid4().hex
+
+
+def send_through_outbox(name: str, payload: Any, retry_policy: Optional[RetryPolicy] = None):
+    """
+    Send a backend write, keeping it in the outbox until the backend has it.
+
+    The write is appended to the outbox before the first attempt, so a
+    crash mid-save cannot lose it. It is then sent with retries (see
+    ``save_with_retry``) under one idempotency key. Before sending, it waits
+    for any replay of the same records that is in progress, so an older
+    queued write never lands after it. If the backend stays unreachable,
+    the write is handed to the drainer and ``WriteQueued`` is raised.
+
+    Raises:
+        WriteQueued: The write will be replayed by the outbox drainer
+        Exception: The backend rejected the write (it is kept as failed)
+    """
+    endpoint = _endpoints[name]
+    idempotency_key = new_idempotency_key()
+    if not OUTBOX_CONFIG["enabled"]:
+        save_with_retry(lambda body: endpoint.send(body, idempotency_key), payload, retry_policy)
+        return
+
+    record_keys = endpoint.record_keys(payload)
+    entry_id = append_outbox_entry_service(name, payload, idempotency_key, record_keys)
+    outbox_drainer.wait_for_replays(name, record_keys)
+    try:
+        save_with_retry(lambda body: endpoint.send(body, idempotency_key), payload, retry_policy)
+    except Exception as e:
+        if is_retryable_save_error(e):
+            set_outbox_entry_status_service(entry_id, "pending", str(e))
+            logging.warning(f"Backend unavailable; queued a '{name}' write in the outbox ({e})")
+            raise WriteQueued(e) from e
+        set_outbox_entry_status_service(entry_id, "failed", str(e))
+        raise
+    set_outbox_entry_status_service(entry_id, "delivered")
+
+
+class OutboxDrainer:
+    """Background thread that replays queued backend writes.
+
+    Every ``poll_interval`` seconds it sends the due writes in order, each
+    with its own idempotency key. Right before a replay, the records that a
+    newer write also carries are dropped from it. A write left with no
+    records is marked superseded instead of sent, so a stale write never
+    overwrites a newer one. A write the backend accepts is marked delivered.
+    A network error, 429 or 5xx reschedules the write with exponential
+    backoff and ends the pass, since the backend is still unreachable. Any
+    other rejection marks the write as failed. Entries are never rewritten
+    in place except to narrow them; old delivered and superseded entries
+    are pruned after ``retention_days``.
+    """
+
+    def __init__(self, poll_interval: float, batch_size: int, retry_policy: RetryPolicy,
+                 retention_days: float):
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.retry_policy = retry_policy
+        self.retention_days = retention_days
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        # (endpoint, record key) pairs of the replay in progress
+        self._replaying: Set[tuple] = set()
+        self._replaying_changed = threading.Condition()
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            recovered = recover_inflight_outbox_entries_service()
+            if recovered:
+                logging.info(f"Outbox: {recovered} writes interrupted by the last run will be replayed")
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="backend-outbox", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def wait_for_replays(self, name: str, record_keys: Iterable[str]):
+        """Block while the drainer is replaying a write of any of these records."""
+        keys = {(name, record_key) for record_key in record_keys}
+        with self._replaying_changed:
+            while self._replaying & keys:
+                self._replaying_changed.wait()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.drain_once()
+                prune_outbox_service(self.retention_days)
+            except Exception:
+                logging.exception("Outbox drain pass failed")
+            self._stop.wait(self.poll_interval)
+
+    def drain_once(self) -> int:
+        """Deliver the writes that are due; returns how many the backend accepted."""
+        delivered = 0
+        for entry in get_due_outbox_entries_service(self.batch_size):
+            endpoint = _endpoints.get(entry["endpoint"])
+            if endpoint is None:
+                continue
+            keys = {(entry["endpoint"], record_key) for record_key in get_outbox_record_keys_service(entry["id"])}
+            # Publish the replay before checking for newer writes: a write appended
+            # after the check then waits in wait_for_replays until this replay ends
+            with self._replaying_changed:
+                self._replaying |= keys
+            try:
+                if not claim_outbox_entry_service(entry["id"]):
+                    continue
+                payload = self._without_superseded(entry, endpoint)
+                if payload is None:
+                    continue
+                try:
+                    endpoint.send(payload, entry["idempotencyKey"])
+                except Exception as e:
+                    if is_retryable_save_error(e):
+                        delay = self.retry_policy.delay_for(min(entry["attempts"], 16))
+                        reschedule_outbox_entry_service(entry["id"], delay, str(e))
+                        logging.info(f"Outbox: backend still unavailable ({e}); next attempt in {delay:.0f}s")
+                        break
+                    set_outbox_entry_status_service(entry["id"], "failed", str(e))
+                    logging.error(f"Outbox: backend rejected a queued '{entry['endpoint']}' write: {e}")
+                    continue
+                set_outbox_entry_status_service(entry["id"], "delivered")
+                delivered += 1
+            finally:
+                with self._replaying_changed:
+                    self._replaying -= keys
+                    self._replaying_changed.notify_all()
+        if delivered:
+            logging.info(f"Outbox: delivered {delivered} queued backend writes")
+        return delivered
+
+    def _without_superseded(self, entry: Dict[str, Any], endpoint: OutboxEndpoint) -> Optional[Any]:
+        """The entry's payload minus records a newer write carries; None if nothing is left."""
+        superseded = get_superseded_record_keys_service(entry["id"])
+        if not superseded:
+            return entry["payload"]
+        payload = entry["payload"]
+        remaining = [
+            record for record in endpoint.records(payload)
+            if endpoint.record_key(payload, record) not in superseded
+        ]
+        if not remaining:
+            set_outbox_entry_status_service(entry["id"], "superseded")
+            logging.info(f"Outbox: dropped a queued '{entry['endpoint']}' write superseded by newer saves")
+            return None
+        narrowed = endpoint.with_records(payload, remaining)
+        replace_outbox_payload_service(entry["id"], narrowed, endpoint.record_keys(narrowed))
+        return narrowed
+
+    def stats(self) -> Dict[str, int]:
+        return count_outbox_entries_service()
+
+
+outbox_drainer = OutboxDrainer(
+    poll_interval=OUTBOX_CONFIG["poll_interval"],
+    batch_size=OUTBOX_CONFIG["batch_size"],
+    retry_policy=RetryPolicy(base_delay=OUTBOX_CONFIG["base_delay"], max_delay=OUTBOX_CONFIG["max_delay"]),
+    retention_days=OUTBOX_CONFIG["retention_days"],
+)
+
+
+def start_outbox_drainer():
+    """Start replaying queued writes in the background (no-op when the outbox is disabled)."""
+    if OUTBOX_CONFIG["enabled"]:
+        outbox_drainer.start()
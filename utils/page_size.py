@@ -0,0 +1,37 @@
+import threading
+
+
+class AdaptivePageSize:
+    """Page size that backs off on server failures and recovers after successes.
+
+    Starts at ``initial``. Halves (down to ``minimum``) whenever a page times
+    out or fails with a 5xx, and grows by ``growth_factor`` (up to
+    ``maximum``) after ``grow_after`` consecutive successes. Only the size of
+    the next request changes; the cursor it continues from stays the same.
+    """
+
+    def __init__(self, initial: int, minimum: int = 10, maximum: int = 100,
+                 grow_after: int = 3, growth_factor: float = 1.5):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.grow_after = grow_after
+        self.growth_factor = growth_factor
+        self.size = max(minimum, min(initial, maximum))
+        self._successes = 0
+        self._lock = threading.Lock()
+
+    def record_success(self):
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.grow_after and self.size < self.maximum:
+                self.size = min(self.maximum, int(self.size * self.growth_factor))
+                self._successes = 0
+
+    def shrink(self) -> bool:
+        """Halve the page size; False if it was already at the minimum."""
+        with self._lock:
+            self._successes = 0
+            if self.size <= self.minimum:
+                return False
+            self.size = max(self.minimum, self.size // 2)
+            return True
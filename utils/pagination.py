@@ -0,0 +1,141 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse, parse_qs
+from utils.errors import handle_github_error
+
+GITHUB_PER_PAGE = 100
+GITHUB_PAGE_WORKERS = 4
+
+
+class Page(list):
+    """One page of items, plus the cursor that continues after it (None on the last page)."""
+
+    def __init__(self, items=(), cursor=None):
+        super().__init__(items)
+        self.cursor = cursor
+
+
+def paginate_github(transport, url, headers, context, params=None, timeout=10,
+                    per_page=GITHUB_PER_PAGE, max_workers=GITHUB_PAGE_WORKERS):
+    """Yield every item of a GitHub REST list endpoint, page by page.
+
+    The first page is requested with ``per_page`` set. When its ``Link``
+    header carries a ``last`` relation the total page count is known, so the
+    remaining pages are fetched concurrently and their items are yielded as
+    each page arrives. Otherwise ``next`` links are followed one at a time.
+
+    Args:
+        transport: HttpTransport used for the requests
+        url: List endpoint URL (e.g. ``GITHUB_API["get_org_repos"](org)``)
+        headers: Request headers, including authorization
+        context: Description of the resource, used in error messages
+        params: Extra query parameters
+        timeout: Per-request timeout in seconds
+        per_page: Page size requested from GitHub (max 100)
+        max_workers: Concurrent page requests once the last page is known
+
+    Raises:
+        GitHubError: If any page request fails
+    """
+    params = dict(params or {})
+    params["per_page"] = per_page
+
+    response = _get_page(transport, url, headers, params, timeout, context)
+    yield from response.json()
+
+    last_page = _page_number(response.links.get("last", {}).get("url"))
+    if last_page:
+        yield from _fetch_pages_concurrently(
+            transport, url, headers, params, timeout, context, last_page, max_workers
+        )
+        return
+
+    next_url = response.links.get("next", {}).get("url")
+    while next_url:
+        response = _get_page(transport, next_url, headers, None, timeout, context)
+        yield from response.json()
+        next_url = response.links.get("next", {}).get("url")
+
+
+def _fetch_pages_concurrently(transport, url, headers, params, timeout, context, last_page, max_workers):
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [
+            executor.submit(
+                _get_page, transport, url, headers, {**params, "page": page}, timeout, context
+            )
+            for page in range(2, last_page + 1)
+        ]
+        for future in as_completed(futures):
+            yield from future.result().json()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _get_page(transport, url, headers, params, timeout, context):
+    response = transport.get(url, headers=headers, params=params, timeout=timeout)
+    if response.status_code != 200:
+        handle_github_error(response, context)
+    return response
+
+
+def _page_number(link_url):
+    """Extract the ``page`` query parameter from a Link header URL."""
+    if not link_url:
+        return None
+    try:
+        return int(parse_qs(urlparse(link_url).query)["page"][0])
+    except (KeyError, IndexError, ValueError):
+        return None
+
+
+def merge_page_streams(page_iterators, max_pending=4):
+    """Drain several page iterators concurrently and yield their pages as they arrive.
+
+    Each iterator runs on its own thread. Pages are handed over through a
+    queue holding at most ``max_pending`` pages. The first exception raised
+    by any iterator is re-raised here, and the other iterators are
+    abandoned. Closing the generator early stops them too.
+    """
+    page_iterators = list(page_iterators)
+    if not page_iterators:
+        return
+
+    pages = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+
+    def offer(item):
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def drain(iterator):
+        try:
+            for page in iterator:
+                if not offer(("page", page)):
+                    return
+            offer(("done", None))
+        except BaseException as e:
+            offer(("error", e))
+
+    executor = ThreadPoolExecutor(max_workers=len(page_iterators))
+    try:
+        for iterator in page_iterators:
+            executor.submit(drain, iterator)
+        running = len(page_iterators)
+        while running:
+            kind, value = pages.get()
+            if kind == "page":
+                yield value
+            elif kind == "done":
+                running -= 1
+            else:
+                raise value
+    finally:
+        stop.set()
+        executor.shutdown(wait=True)
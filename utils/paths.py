@@ -0,0 +1,17 @@
+import os
+import sys
+
+# Folder, next to the executable (or the source tree), holding local caches and stores
+APP_DATA_DIR_NAME = "collector_data"
+
+
+def get_app_data_dir(*parts: str) -> str:
+    """Return (and create) a directory for local data, supporting frozen executables."""
+    if getattr(sys, 'frozen', False):
+        base_path = os.path.dirname(sys.executable)
+    else:
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    path = os.path.join(base_path, APP_DATA_DIR_NAME, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,245 @@
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+# Wait applied to a secondary rate limit response that carries no Retry-After
+DEFAULT_RATE_LIMIT_WAIT = 60
+
+
+class TokenBucket:
+    """Token bucket pacing one rate-limit budget (e.g. GitHub REST "core").
+
+    The bucket starts full, so short jobs run at full speed. It refills at
+    the rate that spends the server-reported remaining budget exactly by
+    the reset time. Long jobs therefore settle at the maximum sustainable
+    speed instead of running into the limit.
+    """
+
+    def __init__(self, name: str, limit: int, window: int, burst: int, reserve: int):
+        now = time.time()
+        self.name = name
+        self.limit = limit
+        self.remaining = limit
+        self.reset_at = now + window
+        self.window = window
+        self.burst = burst
+        self.reserve = reserve
+        self.tokens = float(burst)
+        self.last_refill = now
+        self.blocked_until = 0.0
+        self.last_cost = None
+
+    def refill_rate(self, now: float) -> float:
+        """Tokens per second that spend the budget left above the reserve by reset."""
+        if now >= self.reset_at:
+            return float(self.limit) / self.window
+        spendable = max(self.remaining - self.reserve, 0)
+        return spendable / max(self.reset_at - now, 1.0)
+
+    def refill(self, now: float):
+        if now >= self.reset_at:
+            # Window rolled over without a fresher server reading
+            self.remaining = self.limit
+            self.reset_at = now + self.window
+        elapsed = max(now - self.last_refill, 0.0)
+        self.tokens = min(float(self.burst), self.tokens + elapsed * self.refill_rate(now))
+        self.last_refill = now
+
+    def wait_time(self, now: float, cost: int) -> float:
+        """Seconds to wait before ``cost`` tokens are available (0 if now)."""
+        if self.blocked_until > now:
+            return self.blocked_until - now
+        if self.remaining - cost < self.reserve:
+            return max(self.reset_at - now, 0.0) or 1.0
+        if self.tokens >= cost:
+            return 0.0
+        rate = self.refill_rate(now)
+        return (cost - self.tokens) / rate if rate > 0 else max(self.reset_at - now, 1.0)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "resource": self.name,
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "resetAt": datetime.fromtimestamp(self.reset_at).isoformat(timespec="seconds"),
+            "blockedFor": max(round(self.blocked_until - time.time()), 0),
+            "lastCost": self.last_cost,
+        }
+
+
+class RateLimitGovernor:
+    """Shared rate-limit governor for every thread using one provider token.
+
+    Requests are paced through one TokenBucket per rate-limit resource
+    (GitHub keeps separate budgets for REST, search and GraphQL). The
+    buckets are updated from ``X-RateLimit-*``/``Retry-After`` response
+    headers and from the GraphQL ``rateLimit { cost remaining resetAt }``
+    block. Call ``acquire`` before each request; it blocks while the
+    budget is exhausted or a Retry-After is pending.
+    """
+
+    def __init__(self, limit: int = 5000, window: int = 3600, burst: int = 100, reserve: int = 50):
+        self.limit = limit
+        self.window = window
+        self.burst = burst
+        self.reserve = reserve
+        self._buckets = {}
+        self._condition = threading.Condition()
+
+    @staticmethod
+    def resource_for(url: str) -> str:
+        """Best-effort guess of the GitHub rate-limit resource of a URL."""
+        if url.rstrip("/").endswith("/graphql"):
+            return "graphql"
+        if "/search/" in url:
+            return "search"
+        return "core"
+
+    def _bucket(self, resource: str) -> TokenBucket:
+        bucket = self._buckets.get(resource)
+        if bucket is None:
+            bucket = TokenBucket(resource, self.limit, self.window, self.burst, self.reserve)
+            self._buckets[resource] = bucket
+        return bucket
+
+    def acquire(self, url: str, cost: int = 1):
+        """Block until ``cost`` units of the URL's budget may be spent, then spend them."""
+        resource = self.resource_for(url)
+        with self._condition:
+            while True:
+                now = time.time()
+                bucket = self._bucket(resource)
+                bucket.refill(now)
+                delay = bucket.wait_time(now, cost)
+                if delay <= 0:
+                    bucket.tokens -= cost
+                    bucket.remaining -= cost
+                    return
+                if delay > 5:
+                    logging.info(f"Rate limit governor pausing {resource} requests for {delay:.0f}s")
+                self._condition.wait(timeout=delay)
+
+    def ready_in(self, url: str, cost: int = 1) -> float:
+        """Seconds until ``acquire(url, cost)`` would go through without blocking."""
+        resource = self.resource_for(url)
+        with self._condition:
+            now = time.time()
+            bucket = self._bucket(resource)
+            bucket.refill(now)
+            return max(bucket.wait_time(now, cost), 0.0)
+
+    def remaining_for(self, url: str) -> int:
+        """Last known remaining budget of the URL's rate-limit resource."""
+        with self._condition:
+            return self._bucket(self.resource_for(url)).remaining
+
+    def update_from_response(self, url: str, response) -> bool:
+        """
+        Record the rate-limit headers of a response.
+
+        Returns:
+            True if the response was rejected by a rate limit and the
+            request should be retried once ``acquire`` lets it through
+        """
+        headers = response.headers
+        resource = headers.get("X-RateLimit-Resource") or self.resource_for(url)
+        rate_limited = self.is_rate_limited(response)
+
+        with self._condition:
+            bucket = self._bucket(resource)
+            if headers.get("X-RateLimit-Limit"):
+                bucket.limit = int(headers["X-RateLimit-Limit"])
+            if headers.get("X-RateLimit-Remaining"):
+                bucket.remaining = int(headers["X-RateLimit-Remaining"])
+            if headers.get("X-RateLimit-Reset"):
+                bucket.reset_at = float(headers["X-RateLimit-Reset"])
+
+            retry_after = _parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                bucket.blocked_until = max(bucket.blocked_until, time.time() + retry_after)
+            elif rate_limited:
+                if bucket.remaining <= 0 and bucket.reset_at > time.time():
+                    bucket.blocked_until = bucket.reset_at
+                else:
+                    bucket.blocked_until = time.time() + DEFAULT_RATE_LIMIT_WAIT
+            if rate_limited:
+                bucket.tokens = 0.0
+            self._condition.notify_all()
+
+        return rate_limited
+
+    def update_from_graphql(self, rate_limit: Optional[Dict[str, Any]], response=None):
+        """Record a GraphQL ``rateLimit { cost remaining resetAt }`` block.
+
+        ``response`` is the reply that carried the block; a single governor
+        does not need it, but a TokenPool uses it to find the token.
+        """
+        if not rate_limit:
+            return
+        with self._condition:
+            bucket = self._bucket("graphql")
+            if rate_limit.get("limit") is not None:
+                bucket.limit = rate_limit["limit"]
+            if rate_limit.get("remaining") is not None:
+                bucket.remaining = rate_limit["remaining"]
+            if rate_limit.get("resetAt"):
+                bucket.reset_at = _parse_timestamp(rate_limit["resetAt"], bucket.reset_at)
+            bucket.last_cost = rate_limit.get("cost")
+            self._condition.notify_all()
+
+    def block_graphql(self, rate_limit: Optional[Dict[str, Any]] = None, response=None):
+        """Hold GraphQL requests until the budget resets after a ``RATE_LIMITED`` error.
+
+        GitHub answers such queries with HTTP 200, so ``update_from_response``
+        does not notice them. The reset time comes from the ``rateLimit``
+        block when the query selected one, else from ``X-RateLimit-Reset``.
+        """
+        now = time.time()
+        reset_at = None
+        if rate_limit and rate_limit.get("resetAt"):
+            reset_at = _parse_timestamp(rate_limit["resetAt"], None)
+        if reset_at is None and response is not None and response.headers.get("X-RateLimit-Reset"):
+            reset_at = float(response.headers["X-RateLimit-Reset"])
+        with self._condition:
+            bucket = self._bucket("graphql")
+            bucket.remaining = 0
+            bucket.tokens = 0.0
+            if reset_at is not None and reset_at > now:
+                bucket.reset_at = reset_at
+                bucket.blocked_until = max(bucket.blocked_until, reset_at)
+            else:
+                bucket.blocked_until = max(bucket.blocked_until, now + DEFAULT_RATE_LIMIT_WAIT)
+            self._condition.notify_all()
+
+    @staticmethod
+    def is_rate_limited(response) -> bool:
+        if response.status_code == 429:
+            return True
+        if response.status_code != 403:
+            return False
+        if response.headers.get("Retry-After") or response.headers.get("X-RateLimit-Remaining") == "0":
+            return True
+        return "rate limit" in response.text.lower()
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Remaining budget per rate-limit resource, for status displays."""
+        with self._condition:
+            return {name: bucket.status() for name, bucket in self._buckets.items()}
+
+
+def _parse_retry_after(value) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+def _parse_timestamp(value: str, default: Optional[float]) -> Optional[float]:
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return default
@@ -0,0 +1,93 @@
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+from config.api_config import READ_CACHE_CONFIG
+from utils.single_flight import SingleFlight
+
+
+class ReadCache:
+    """In-memory TTL cache for lists loaded from the backend, keyed by namespace and id.
+
+    Namespaces are the kinds of data ("users", "teams", ...). Each one has
+    its own time-to-live in seconds. The save that changes a list calls
+    ``invalidate`` for exactly that namespace and key. Every invalidation
+    bumps the key's version. A load that was already in flight when the
+    save landed is then returned to its caller but not cached, so a stale
+    list never outlives the save.
+
+    Concurrent misses for the same key and version share one load (see
+    ``SingleFlight``). Callers get deep copies, so mutating a returned list
+    cannot corrupt the cache.
+    """
+
+    def __init__(self, ttls: Dict[str, float]):
+        self.ttls = ttls
+        self._entries: Dict[Tuple[str, Hashable], Tuple[float, Any]] = {}
+        self._versions: Dict[Tuple[str, Hashable], int] = {}
+        self._epoch = 0
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._loads = SingleFlight()
+
+    def get_or_load(self, namespace: str, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value of (namespace, key), or call ``loader`` and cache its result.
+
+        Args:
+            namespace: Kind of data; its TTL comes from the cache's ``ttls``
+            key: Which list of that kind, e.g. the project id
+            loader: Loads the value from the backend on a miss
+
+        Returns:
+            A copy of the cached or freshly loaded value
+        """
+        cache_key = (namespace, key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[0] > now:
+                self._hits[namespace] = self._hits.get(namespace, 0) + 1
+                return copy.deepcopy(entry[1])
+            self._misses[namespace] = self._misses.get(namespace, 0) + 1
+            version = (self._epoch, self._versions.get(cache_key, 0))
+
+        value = self._loads.do((cache_key, version), loader)
+
+        ttl = self.ttls.get(namespace, 0)
+        if ttl > 0:
+            with self._lock:
+                if (self._epoch, self._versions.get(cache_key, 0)) == version:
+                    self._entries[cache_key] = (time.monotonic() + ttl, copy.deepcopy(value))
+        return value
+
+    def invalidate(self, namespace: str, key: Hashable):
+        """Drop one cached list; call it after every save that changes it."""
+        cache_key = (namespace, key)
+        with self._lock:
+            self._entries.pop(cache_key, None)
+            self._versions[cache_key] = self._versions.get(cache_key, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hits, misses and hit rate per namespace."""
+        with self._lock:
+            stats = {}
+            for namespace in sorted(set(self._hits) | set(self._misses)):
+                hits = self._hits.get(namespace, 0)
+                misses = self._misses.get(namespace, 0)
+                stats[namespace] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hitRate": hits / (hits + misses),
+                }
+            return stats
+
+
+# Backend lookups shared by every tab
+backend_read_cache = ReadCache(READ_CACHE_CONFIG["ttl_seconds"] if READ_CACHE_CONFIG["enabled"] else {})
@@ -0,0 +1,86 @@
+import random
+import threading
+from typing import Optional
+
+# Response headers that tell the client how long to back off, in seconds
+BACKOFF_HEADERS = ("Retry-After", "X-RateLimit-Delay")
+
+
+class RetryBudget:
+    """Number of retries one sync may spend, shared by all of its requests.
+
+    Keeps a throttled or flaky sync from retrying forever: once the budget
+    is spent, failures surface to the caller as before.
+    """
+
+    def __init__(self, max_retries: int):
+        self.max_retries = max_retries
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def try_consume(self) -> bool:
+        with self._lock:
+            if self.used >= self.max_retries:
+                return False
+            self.used += 1
+            return True
+
+    def reset(self):
+        with self._lock:
+            self.used = 0
+
+    @property
+    def remaining(self) -> int:
+        return max(self.max_retries - self.used, 0)
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for throttled or transient failures.
+
+    Server-provided ``Retry-After``/``X-RateLimit-Delay`` headers take
+    precedence over the computed backoff.
+    """
+
+    def __init__(self, max_attempts: int = 6, base_delay: float = 1.0, max_delay: float = 60.0,
+                 retry_statuses=(429, 503), budget: Optional[RetryBudget] = None):
+        """
+        Args:
+            max_attempts: Total attempts per request, including the first
+            base_delay: Backoff of the first retry, in seconds
+            max_delay: Upper bound for any single wait, in seconds
+            retry_statuses: HTTP status codes that are retried
+            budget: Optional RetryBudget shared by all requests of a sync
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.budget = budget
+
+    def should_retry_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def can_retry(self, attempt: int) -> bool:
+        """Whether the request may be retried after its ``attempt``-th try (0-based)."""
+        if attempt + 1 >= self.max_attempts:
+            return False
+        return self.budget is None or self.budget.try_consume()
+
+    def delay_for(self, attempt: int, response=None) -> float:
+        """Seconds to wait before retrying after the ``attempt``-th try (0-based)."""
+        if response is not None:
+            for header in BACKOFF_HEADERS:
+                server_delay = _parse_seconds(response.headers.get(header))
+                if server_delay is not None:
+                    return min(server_delay, self.max_delay)
+        backoff = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, backoff)
+
+
+def _parse_seconds(value) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
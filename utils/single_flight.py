@@ -0,0 +1,66 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Coalesces identical calls that are in flight at the same time.
+
+    The first caller for a key runs the call. Callers that ask for the same
+    key while it is running wait for that call and share its result, or its
+    exception. Nothing is cached: once the call finishes, the next caller
+    for the key runs it again.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run ``fn`` for ``key``, or join the call already running for it.
+
+        Args:
+            key: Identifies the call; equal keys must mean interchangeable results
+            fn: The call to run when no call for ``key`` is in flight
+
+        Returns:
+            The result of the (shared) call
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+            }
+
+
+# Provider and backend lookups made by the models layer
+model_single_flight = SingleFlight()
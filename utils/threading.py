@@ -5,6 +5,7 @@ import traceback
 class WorkerSignals(QObject):
     finished = pyqtSignal(object)
     error = pyqtSignal(Exception)
+    progress = pyqtSignal(object)
 
 class Worker(QRunnable):
     def __init__(self, fn, *args, **kwargs):
@@ -22,7 +23,7 @@ class Worker(QRunnable):
             traceback.print_exc()
             self.signals.error.emit(e)
 
-def worker_spinner(parent, progress_bar, task_fn, on_success, on_error):
+def worker_spinner(parent, progress_bar, task_fn, on_success, on_error, on_progress=None):
     """
     Utility to run a task with a progress bar spinner and callbacks.
 
@@ -31,6 +32,10 @@ def worker_spinner(parent, progress_bar, task_fn, on_success, on_error):
     :param task_fn: A no-arg function to run in the background
     :param on_success: Callback for success (runs on main thread)
     :param on_error: Callback for error (runs on main thread)
+    :param on_progress: Optional callback for progress updates (runs on main
+                        thread). When given, task_fn is called with a
+                        ``progress_callback`` keyword argument that may be
+                        called from any thread.
     """
     # Show spinner
     progress_bar.setVisible(True)
@@ -53,4 +58,7 @@ def worker_spinner(parent, progress_bar, task_fn, on_success, on_error):
     worker = Worker(task_fn)
     worker.signals.finished.connect(wrapped_success)
     worker.signals.error.connect(wrapped_error)
+    if on_progress is not None:
+        worker.kwargs["progress_callback"] = worker.signals.progress.emit
+        worker.signals.progress.connect(on_progress)
     parent.threadpool.start(worker)
\ No newline at end of file
@@ -0,0 +1,100 @@
+import logging
+import threading
+import time
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from utils.rate_limit import RateLimitGovernor
+
+# Longest single sleep while every token is parked, so new readings are picked up
+MAX_PARKED_SLEEP = 5.0
+
+
+class PooledToken:
+    """One personal access token and the governor tracking its budget."""
+
+    def __init__(self, index: int, token: str, governor: RateLimitGovernor):
+        self.index = index
+        self.token = token
+        self.governor = governor
+        self.authorization = f"Bearer {token}"
+
+    @property
+    def label(self) -> str:
+        return f"#{self.index + 1}"
+
+
+class TokenPool:
+    """Spreads GitHub requests over several tokens by remaining headroom.
+
+    Every token keeps its own RateLimitGovernor. Each request goes to the
+    ready token with the most remaining budget for the request's resource.
+    A token whose budget is exhausted (or that is waiting out a Retry-After)
+    is parked until its reset time. The pool has the same ``acquire`` /
+    ``update_from_response`` / ``update_from_graphql`` / ``block_graphql`` /
+    ``status`` interface as a single governor, so HttpTransport can use either.
+    """
+
+    def __init__(self, tokens: List[str], governor_factory: Callable[[], RateLimitGovernor]):
+        if not tokens:
+            raise ValueError("A token pool needs at least one token")
+        self.tokens = [
+            PooledToken(index, token, governor_factory()) for index, token in enumerate(tokens)
+        ]
+        self._by_authorization = {entry.authorization: entry for entry in self.tokens}
+        self._lock = threading.Lock()
+
+    def _choose(self, url: str) -> Tuple[Optional[PooledToken], float]:
+        ready = []
+        shortest_wait = None
+        for entry in self.tokens:
+            wait = entry.governor.ready_in(url)
+            if wait <= 0:
+                ready.append(entry)
+            elif shortest_wait is None or wait < shortest_wait:
+                shortest_wait = wait
+        if ready:
+            return max(ready, key=lambda entry: entry.governor.remaining_for(url)), 0.0
+        return None, shortest_wait or 1.0
+
+    def acquire(self, url: str, cost: int = 1) -> Dict[str, str]:
+        """Block until some token may spend ``cost`` units, spend them, and return its auth header."""
+        while True:
+            with self._lock:
+                entry, wait = self._choose(url)
+            if entry is not None:
+                entry.governor.acquire(url, cost)
+                return {"Authorization": entry.authorization}
+            if wait > MAX_PARKED_SLEEP:
+                logging.info(f"All {len(self.tokens)} GitHub tokens are parked; next one is ready in {wait:.0f}s")
+            time.sleep(min(wait, MAX_PARKED_SLEEP))
+
+    def _entry_for(self, response) -> Optional[PooledToken]:
+        request = getattr(response, "request", None)
+        authorization = request.headers.get("Authorization") if request is not None else None
+        return self._by_authorization.get(authorization)
+
+    def update_from_response(self, url: str, response) -> bool:
+        entry = self._entry_for(response)
+        if entry is None:
+            return RateLimitGovernor.is_rate_limited(response)
+        return entry.governor.update_from_response(url, response)
+
+    def update_from_graphql(self, rate_limit: Optional[Dict[str, Any]], response=None):
+        entry = self._entry_for(response)
+        if entry is not None:
+            entry.governor.update_from_graphql(rate_limit)
+
+    def block_graphql(self, rate_limit: Optional[Dict[str, Any]] = None, response=None):
+        """Park the GraphQL budget of the token that got ``RATE_LIMITED``; the others carry on."""
+        entry = self._entry_for(response)
+        if entry is not None:
+            entry.governor.block_graphql(rate_limit, response)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Remaining budget per rate-limit resource, per token (keyed ``"<resource> #<n>"``)."""
+        if len(self.tokens) == 1:
+            return self.tokens[0].governor.status()
+        status = {}
+        for entry in self.tokens:
+            for resource, budget in entry.governor.status().items():
+                status[f"{resource} {entry.label}"] = budget
+        return status
@@ -0,0 +1,163 @@
+import logging
+import threading
+import time
+import weakref
+import requests
+from requests.adapters import HTTPAdapter
+from utils.single_flight import SingleFlight
+
+
+class HttpTransport:
+    """Pooled, keep-alive HTTP transport shared by every service of one owner.
+
+    Each provider (and the backend client) owns one transport, so all pages of
+    a sync reuse the same TCP/TLS connections instead of opening a new one per
+    request through module-level ``requests.get``/``requests.post``.
+    """
+
+    def __init__(self, pool_connections=4, pool_maxsize=10, pool_block=True, default_headers=None,
+                 governor=None, max_rate_limit_waits=3, retry_policy=None, cache=None,
+                 coalesce_gets=False):
+        """
+        Args:
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum open connections kept alive per host
+            pool_block: Wait for a free connection instead of opening extra
+                        ones when a host's pool is exhausted (per-host limit)
+            default_headers: Headers sent with every request of this transport
+            governor: Optional RateLimitGovernor (or TokenPool) that paces
+                      every request and is fed the rate-limit headers of
+                      every response. Headers returned by its ``acquire``
+                      (e.g. the Authorization of the chosen token) are
+                      applied to the request.
+            max_rate_limit_waits: How many times a rate-limited request is
+                                  retried after waiting out the limit
+            retry_policy: Optional RetryPolicy for throttled/unavailable
+                          responses and transient connection errors
+            cache: Optional ConditionalRequestCache revalidating GET
+                   requests with ETag/Last-Modified
+            coalesce_gets: Let identical non-streamed GETs that are in
+                           flight at the same time share one request and
+                           its response
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.default_headers = dict(default_headers or {})
+        self.governor = governor
+        self.max_rate_limit_waits = max_rate_limit_waits
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self.single_flight = SingleFlight() if coalesce_gets else None
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._local = threading.local()
+        # Weak, so a session goes away with the (e.g. executor) thread that used it
+        self._sessions = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Session of the calling thread.
+
+        ``requests.Session`` is not guaranteed to be thread-safe, so every
+        worker thread gets its own session. All of them share the same
+        adapter, so the connection pools (and their per-host limits) stay
+        shared across threads. A thread's session is dropped when the thread
+        ends, without closing it, since that would close the shared adapter.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._create_session()
+            self._local.session = session
+            with self._lock:
+                self._sessions.add(session)
+        return session
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        session.headers.update(self.default_headers)
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        if self.single_flight is not None and method == "GET" and not kwargs.get("stream"):
+            flight_key = repr((url, kwargs.get("params"), sorted((kwargs.get("headers") or {}).items())))
+            return self.single_flight.do(flight_key, lambda: self._request(method, url, **kwargs))
+        return self._request(method, url, **kwargs)
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        use_cache = self.cache is not None and method == "GET" and not kwargs.get("stream")
+        return self._send(method, url, use_cache=use_cache, **kwargs)
+
+    def _send(self, method: str, url: str, use_cache: bool = False, **kwargs) -> requests.Response:
+        base_headers = dict(kwargs.pop("headers", None) or {})
+        rate_limit_waits = 0
+        attempt = 0
+        while True:
+            headers = dict(base_headers)
+            if self.governor is not None:
+                auth_headers = self.governor.acquire(url)
+                if auth_headers:
+                    headers.update(auth_headers)
+
+            # Keyed by the token this attempt actually sends, so each token
+            # keeps (and revalidates with) its own validators
+            cache_key = cache_entry = None
+            if use_cache:
+                cache_key = self.cache.key_for(url, kwargs.get("params"), headers)
+                cache_entry = self.cache.load(cache_key)
+                headers.update(self.cache.conditional_headers(cache_entry))
+
+            try:
+                response = self.session.request(method, url, headers=headers, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if self.retry_policy is None or not self.retry_policy.can_retry(attempt):
+                    raise
+                delay = self.retry_policy.delay_for(attempt)
+                logging.warning(f"{method} {url} failed ({e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if self.governor is not None and self.governor.update_from_response(url, response):
+                if rate_limit_waits < self.max_rate_limit_waits:
+                    logging.warning(f"Rate limited on {method} {url}; waiting for budget before retrying")
+                    response.close()
+                    rate_limit_waits += 1
+                    continue
+
+            if (self.retry_policy is not None
+                    and self.retry_policy.should_retry_status(response.status_code)
+                    and self.retry_policy.can_retry(attempt)):
+                delay = self.retry_policy.delay_for(attempt, response)
+                logging.warning(
+                    f"{method} {url} returned {response.status_code}; retrying in {delay:.1f}s"
+                )
+                response.close()
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if cache_key is not None:
+                return self.cache.resolve(cache_key, cache_entry, response)
+            return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        """Close every session and release pooled connections."""
+        with self._lock:
+            sessions, self._sessions = list(self._sessions), weakref.WeakSet()
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
@@ -0,0 +1,103 @@
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, List
+
+# Tells an upload worker that no more chunks will come
+_DONE = object()
+
+
+class ChunkedUploader:
+    """Producer/consumer pipeline that uploads items in fixed-size chunks.
+
+    The producer calls ``add`` with each page of items as it arrives. Full
+    chunks go into a bounded queue that several worker threads drain
+    concurrently, so data reaches the backend while fetching continues.
+    When the queue is full, ``add`` blocks, so memory stays bounded however
+    large the sync is. A failed upload loses only its own chunk; it is
+    counted and reported by ``close``.
+
+    Use it as a context manager, or call ``close`` when the producer is done.
+    """
+
+    def __init__(self, upload: Callable[[List[Any]], Any], chunk_size: int,
+                 max_workers: int, max_pending: int):
+        """
+        Args:
+            upload: Uploads one chunk; raising marks the chunk as failed
+            chunk_size: Items per upload
+            max_workers: Concurrent uploads
+            max_pending: Full chunks that may wait in the queue before ``add`` blocks
+        """
+        self.upload = upload
+        self.chunk_size = chunk_size
+        self.saved = 0
+        self.failed = 0
+        self.chunks = 0
+        self.failed_chunks = 0
+        self.errors: List[str] = []
+        self._buffer: List[Any] = []
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._workers = [
+            threading.Thread(target=self._drain, name=f"chunk-upload-{index}", daemon=True)
+            for index in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def __enter__(self) -> "ChunkedUploader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def add(self, items: List[Any]):
+        """Buffer items and queue every full chunk (blocks while the queue is full)."""
+        self._buffer.extend(items)
+        while len(self._buffer) >= self.chunk_size:
+            chunk = self._buffer[:self.chunk_size]
+            self._buffer = self._buffer[self.chunk_size:]
+            self._queue.put(chunk)
+
+    def close(self) -> Dict[str, Any]:
+        """Upload the last partial chunk, wait for the workers, and return the stats."""
+        if not self._closed:
+            self._closed = True
+            if self._buffer:
+                self._queue.put(self._buffer)
+                self._buffer = []
+            for _ in self._workers:
+                self._queue.put(_DONE)
+            for worker in self._workers:
+                worker.join()
+        return self.stats()
+
+    def _drain(self):
+        while True:
+            chunk = self._queue.get()
+            if chunk is _DONE:
+                return
+            try:
+                self.upload(chunk)
+                with self._lock:
+                    self.chunks += 1
+                    self.saved += len(chunk)
+            except Exception as e:
+                logging.exception(f"Failed to upload a chunk of {len(chunk)} items")
+                with self._lock:
+                    self.chunks += 1
+                    self.failed_chunks += 1
+                    self.failed += len(chunk)
+                    self.errors.append(str(e))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "saved": self.saved,
+                "failed": self.failed,
+                "chunks": self.chunks,
+                "failedChunks": self.failed_chunks,
+                "errors": list(self.errors),
+            }